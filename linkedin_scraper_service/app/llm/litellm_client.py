@@ -11,6 +11,59 @@ from pydantic import Field
 from linkedin_scraper_service.app.utils.parallel_executor import execute_parallel_with_semaphore
 _translator = Translator()
 
+# Static prompt text, built once at import; only the search criteria and job list vary per request
+BASE_PROMPT_TEMPLATE = """You are a senior technical recruiter specializing in job matching. Enrich jobs with techstack - a list of technologies that are mentioned in the job title and description ordered by their importance from high to low. Then evaluate jobs against search criteria with focus on accuracy and relevance.
+
+SEARCH CRITERIA:
+{search_criteria}
+
+EVALUATION PRIORITY (in order of importance):
+1. TITLE & KEYWORDS MATCH: Job title partial similarity to provided keywords
+2. TECHSTACK & KEYWORDS MATCH: Job techstack similarity to provided keywords
+3. REMOTE WORK TYPE: Match between job's remote policy and required remote type
+4. JOB TYPE: Match between job type (full-time, contract, etc.) and requirements
+5. DESCRIPTION KEYWORDS: How well job description matches search keywords  
+6. ADDITIONAL REQUIREMENTS: Alignment with freeform filter requirements is necessary
+
+SCORING GUIDELINES:
+- 90-100: Perfect match (title has some matches with keywords + techstack has matches with keywords + all additional requirements met)
+- 70-89: Strong match (partial title match with keywords and partial techstack match with keywords, most additional requirements met)
+- 50-69: Good match ((partial title match with keywords or partial techstack match with keywords) and strong description match with keywords or additional requirements)
+- 30-49: Weak match (weak title match with keywords or some weak techstack match with keywords or some weak description match with keywords or additional requirements but weak overall fit)
+- 0-29: Poor/no match (no significant alignment)
+
+Note: Job titles and descriptions will be translated to English, your response must always be in English.
+
+JOBS TO EVALUATE:"""
+
+RESPONSE_INSTRUCTIONS = """Return ONLY a valid JSON array with this exact structure (no markdown, no extra text):
+[
+  {
+    "job_id": "0",
+    "compatibility_score": 85,
+    "techstack": ["Python", "React", "AWS", "Docker"],
+    "filter_reason": null
+  },
+  {
+    "job_id": "1", 
+    "compatibility_score": 0,
+    "techstack": ["Java", "Spring Boot", "Kubernetes"],
+    "filter_reason": "Requires German language"
+  }
+]
+
+REQUIREMENTS:
+- job_id: string index (0, 1, 2, etc.) matching job order above
+- compatibility_score: integer 0-100 based on evaluation criteria
+- techstack: array of technology/skill strings extracted from job description
+- filter_reason: null if job is not filtered out, otherwise a short explanation (e.g., 'Requires German language', 'On-site only', etc.)
+- If a job is filtered out (compatibility_score 0), filter_reason MUST be provided and explain why.
+- Only assign a high compatibility_score if ALL requirements and negative constraints in the filter text are satisfied.
+- If a job description contains any requirement that is explicitly forbidden in the filter text (e.g., 'should not have requirement to know German language'), assign a compatibility_score of 0 and explain in filter_reason what requirement was violated.
+- Do NOT ignore negative requirements, even if the job matches other criteria.
+- NO markdown formatting in response
+- NO additional text or explanations"""
+
 
 
 async def ensure_english(text: str) -> str:
@@ -113,18 +166,18 @@ class LiteLLMClient:
             job_types_list = [jt.label for jt in job_types] if job_types else []
             remote_types_list = [rt.label for rt in remote_types] if remote_types else []
             
+            # The criteria are the same for every batch, so build their prompt once
+            base_prompt = self._build_base_prompt(keywords_list, job_types_list, remote_types_list, location, filter_text)
+            
             # Split jobs into batches based on content length
-            job_batches = self._split_jobs_by_content_length(jobs_english, keywords_list, job_types_list, remote_types_list, location, filter_text)
+            job_batches = self._split_jobs_by_content_length(jobs_english, base_prompt)
             
             # Process batches in parallel
             async def process_batch(batch_data, batch_index: int):
                 batch_jobs, batch_start_offset = batch_data
                 self.logger.info(f"Processing batch {batch_index + 1}/{len(job_batches)} with {len(batch_jobs)} jobs (offset: {batch_start_offset})")
                 
-                return await self._process_job_batch(
-                    batch_jobs, keywords_list, job_types_list, remote_types_list, 
-                    location, filter_text, batch_start_offset
-                )
+                return await self._process_job_batch(batch_jobs, base_prompt, batch_start_offset)
             
             # Execute batch processing in parallel with limited concurrency to avoid API rate limits
             batch_results = await execute_parallel_with_semaphore(
@@ -171,18 +224,13 @@ Description: {description}
     def _split_jobs_by_content_length(
         self,
         jobs: List[ShortJobListing],
-        keywords: List[str],
-        job_types: List[str],
-        remote_types: List[str],
-        location: Optional[str],
-        filter_text: Optional[str]
+        base_prompt: str
     ) -> List[Tuple[List[ShortJobListing], int]]:
         """
         Split jobs into batches based on content length to stay within token limits.
         Returns list of (batch_jobs, batch_start_offset) tuples.
         """
         # Estimate base prompt size (criteria + instructions)
-        base_prompt = self._build_base_prompt(keywords, job_types, remote_types, location, filter_text)
         base_tokens = len(base_prompt) * self.estimated_tokens_per_char
         
         # Reserve tokens for response (estimated ~80 tokens per job for response)
@@ -224,16 +272,12 @@ Description: {description}
     async def _process_job_batch(
         self,
         jobs: List[ShortJobListing],
-        keywords: List[str],
-        job_types: List[str],
-        remote_types: List[str],
-        location: Optional[str],
-        filter_text: Optional[str],
+        base_prompt: str,
         batch_offset: int
     ) -> List[FullJobListing]:
         """Process a batch of jobs through the LLM."""
         
-        prompt = self._build_prompt(jobs, keywords, job_types, remote_types, location, filter_text)
+        prompt = self._build_prompt(jobs, base_prompt)
         
         response = await acompletion(
             model=self.model,
@@ -278,76 +322,17 @@ Description: {description}
         
         search_criteria = "\n".join(criteria_parts) if criteria_parts else "No specific criteria provided"
         
-        return f"""You are a senior technical recruiter specializing in job matching. Enrich jobs with techstack - a list of technologies that are mentioned in the job title and description ordered by their importance from high to low. Then evaluate jobs against search criteria with focus on accuracy and relevance.
+        return BASE_PROMPT_TEMPLATE.format(search_criteria=search_criteria)
 
-SEARCH CRITERIA:
-{search_criteria}
-
-EVALUATION PRIORITY (in order of importance):
-1. TITLE & KEYWORDS MATCH: Job title partial similarity to provided keywords
-2. TECHSTACK & KEYWORDS MATCH: Job techstack similarity to provided keywords
-3. REMOTE WORK TYPE: Match between job's remote policy and required remote type
-4. JOB TYPE: Match between job type (full-time, contract, etc.) and requirements
-5. DESCRIPTION KEYWORDS: How well job description matches search keywords  
-6. ADDITIONAL REQUIREMENTS: Alignment with freeform filter requirements is necessary
-
-SCORING GUIDELINES:
-- 90-100: Perfect match (title has some matches with keywords + techstack has matches with keywords + all additional requirements met)
-- 70-89: Strong match (partial title match with keywords and partial techstack match with keywords, most additional requirements met)
-- 50-69: Good match ((partial title match with keywords or partial techstack match with keywords) and strong description match with keywords or additional requirements)
-- 30-49: Weak match (weak title match with keywords or some weak techstack match with keywords or some weak description match with keywords or additional requirements but weak overall fit)
-- 0-29: Poor/no match (no significant alignment)
-
-Note: Job titles and descriptions will be translated to English, your response must always be in English.
-
-JOBS TO EVALUATE:"""
-
-    def _build_prompt(
-        self,
-        jobs: List[ShortJobListing],
-        keywords: List[str],
-        job_types: List[str],
-        remote_types: List[str],
-        location: Optional[str],
-        filter_text: Optional[str]
-    ) -> str:
+    def _build_prompt(self, jobs: List[ShortJobListing], base_prompt: str) -> str:
         """Build the complete prompt for LLM evaluation."""
-        
-        base_prompt = self._build_base_prompt(keywords, job_types, remote_types, location, filter_text)
-        
         # Build jobs section using consistent formatting
         jobs_text = "".join(self._format_job_for_prompt(job, i) for i, job in enumerate(jobs))
         
         return f"""{base_prompt}
 {jobs_text}
 
-Return ONLY a valid JSON array with this exact structure (no markdown, no extra text):
-[
-  {{
-    "job_id": "0",
-    "compatibility_score": 85,
-    "techstack": ["Python", "React", "AWS", "Docker"],
-    "filter_reason": null
-  }},
-  {{
-    "job_id": "1", 
-    "compatibility_score": 0,
-    "techstack": ["Java", "Spring Boot", "Kubernetes"],
-    "filter_reason": "Requires German language"
-  }}
-]
-
-REQUIREMENTS:
-- job_id: string index (0, 1, 2, etc.) matching job order above
-- compatibility_score: integer 0-100 based on evaluation criteria
-- techstack: array of technology/skill strings extracted from job description
-- filter_reason: null if job is not filtered out, otherwise a short explanation (e.g., 'Requires German language', 'On-site only', etc.)
-- If a job is filtered out (compatibility_score 0), filter_reason MUST be provided and explain why.
-- Only assign a high compatibility_score if ALL requirements and negative constraints in the filter text are satisfied.
-- If a job description contains any requirement that is explicitly forbidden in the filter text (e.g., 'should not have requirement to know German language'), assign a compatibility_score of 0 and explain in filter_reason what requirement was violated.
-- Do NOT ignore negative requirements, even if the job matches other criteria.
-- NO markdown formatting in response
-- NO additional text or explanations"""
+{RESPONSE_INSTRUCTIONS}"""
     
     def _clean_json_response(self, content: str) -> str:
         """Clean LLM response to extract valid JSON."""
@@ -450,4 +435,15 @@ REQUIREMENTS:
                 compatibility_score=None 
             )
             for job in jobs
-        ] 
\ No newline at end of file
+        ] 
+
+
+# One client per process; it holds only configuration read from the environment
+_shared_client: Optional[LiteLLMClient] = None
+
+def get_llm_client() -> LiteLLMClient:
+    """Return the shared LLM client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = LiteLLMClient()
+    return _shared_client
@@ -17,6 +17,15 @@ app = FastAPI()
 
 logger = logging.getLogger("search_jobs_endpoint")
 
+# Shared client so result callbacks reuse pooled keep-alive connections
+_callback_client: Optional[httpx.AsyncClient] = None
+
+def _get_callback_client() -> httpx.AsyncClient:
+    global _callback_client
+    if _callback_client is None or _callback_client.is_closed:
+        _callback_client = httpx.AsyncClient()
+    return _callback_client
+
 # Deprecated
 # @app.get("/search_jobs")
 # async def search_jobs(
@@ -110,12 +119,11 @@ async def search_jobs(
                 filter_text=search_params.filter_text,
             )
             logger.info(f"[search_jobs] Finished job for user_id={user_id}, keywords={search_params.keywords}, location={search_params.location}, job_search_id={job_search_id}, found {len(jobs) if jobs else 0} jobs")
-            async with httpx.AsyncClient() as client:
-                await client.post(callback_url, json={
-                    "job_search_id": job_search_id,
-                    "user_id": user_id,
-                    "jobs": [job.model_dump() for job in jobs] if jobs else [],
-                })
+            await _get_callback_client().post(callback_url, json={
+                "job_search_id": job_search_id,
+                "user_id": user_id,
+                "jobs": [job.model_dump() for job in jobs] if jobs else [],
+            })
         except Exception as e:
             logger.error(f"Error in background job for user_id={user_id}, job_search_id={job_search_id}, callback_url={callback_url}: {e}", exc_info=True)
     asyncio.create_task(run_job())
@@ -139,6 +147,16 @@ async def health():
     """Health check endpoint."""
     return {"status": "healthy", "service": "linkedin_scraper_service"}
 
+@app.on_event("startup")
+async def startup_event():
+    # Pay the Chromium launch once at startup instead of in the first search request
+    try:
+        await LinkedInScraperGuest.start_browser()
+    except Exception as e:
+        logger.error(f"Failed to launch browser at startup, will retry on first search: {e}")
+
 @app.on_event("shutdown")
 async def shutdown_event():
-    await LinkedInScraperGuest.close_all_browsers() 
\ No newline at end of file
+    await LinkedInScraperGuest.close_all_browsers()
+    if _callback_client is not None:
+        await _callback_client.aclose() 
\ No newline at end of file
@@ -2,19 +2,46 @@ import asyncio
 import logging
 import os
 from pathlib import Path
-from typing import List, Optional, Dict
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from functools import lru_cache
+from typing import List, Optional, Dict, Tuple
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Error as PlaywrightError
 from shared.data import JobType, RemoteType, TimePeriod, ShortJobListing, StreamEvent, StreamType, FullJobListing
 import time
 import random
-from urllib.parse import urlparse, urlunparse, quote_plus, urlencode
+from urllib.parse import quote_plus, urlencode
 from playwright_stealth import stealth_async
 from datetime import datetime, timezone, timedelta
 import traceback
 from collections import deque
-from linkedin_scraper_service.app.llm.litellm_client import LiteLLMClient
+from linkedin_scraper_service.app.llm.litellm_client import get_llm_client
 from linkedin_scraper_service.app.utils.parallel_executor import execute_parallel_with_semaphore
 
+# Text is all the scraper reads, so these are never worth downloading
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+BLOCKED_DOMAINS = ("doubleclick.net", "google-analytics.com", "ads.linkedin.com")
+
+@lru_cache(maxsize=1)
+def _proxy_settings() -> Optional[Tuple[str, List[int], Optional[str], Optional[str]]]:
+    """Parse the proxy environment once; sessions only pick a random port from it.
+    
+    Returns (scheme://host, ports, username, password), or None when no proxy is configured.
+    """
+    proxy_server = os.getenv('PROXY_SERVER')
+    if not proxy_server:
+        return None
+    proxy_ports_str = os.getenv("PROXY_PORTS", "")
+    proxy_ports = [int(port.strip()) for port in proxy_ports_str.split(",") if port.strip()]
+    
+    # Drop any port from the server URL so a random one can be appended
+    if '://' in proxy_server:
+        protocol, rest = proxy_server.split('://', 1)
+    else:
+        # If no protocol specified, assume http
+        protocol, rest = 'http', proxy_server
+    host = rest.split(':', 1)[0]
+    return f"{protocol}://{host}", proxy_ports, os.getenv('PROXY_USERNAME'), os.getenv('PROXY_PASSWORD')
+
+
 class LinkedInScraperGuest:
     """LinkedIn job scraper for public/guest access (no login)."""
     
@@ -37,6 +64,28 @@ class LinkedInScraperGuest:
         {'width': 1680, 'height': 1050},
     ]
     
+    # Navigator overrides applied to every page of a scraping context
+    STEALTH_INIT_SCRIPT = """
+        Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+        Object.defineProperty(navigator, 'platform', { get: () => 'Linux x86_64' });
+        Object.defineProperty(navigator, 'vendor', { get: () => 'Google Inc.' });
+        Object.defineProperty(navigator, 'vendorSub', { get: () => '' });
+        Object.defineProperty(navigator, 'productSub', { get: () => '20030107' });
+        Object.defineProperty(navigator, 'plugins', { get: () => ({ length: 3, 0: { name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer' }, 1: { name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai' }, 2: { name: 'Native Client', filename: 'internal-nacl-plugin' } }) });
+        Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
+        window.chrome = { runtime: { onConnect: undefined, onMessage: undefined }, loadTimes: function() { return { commitLoadTime: Date.now() / 1000 - Math.random() * 10, connectionInfo: 'http/1.1', finishDocumentLoadTime: Date.now() / 1000 - Math.random() * 5, finishLoadTime: Date.now() / 1000 - Math.random() * 3, firstPaintAfterLoadTime: 0, firstPaintTime: Date.now() / 1000 - Math.random() * 8, navigationType: 'Other', npnNegotiatedProtocol: 'unknown', requestTime: Date.now() / 1000 - Math.random() * 15, startLoadTime: Date.now() / 1000 - Math.random() * 12, wasAlternateProtocolAvailable: false, wasFetchedViaSpdy: false, wasNpnNegotiated: false }; }, csi: function() { return { pageT: Date.now() - Math.random() * 1000, startE: Date.now() - Math.random() * 2000, tran: 15 }; } };
+        Object.defineProperty(navigator, 'permissions', { get: () => ({ query: (parameters) => ( parameters.name === 'notifications' ? Promise.resolve({ state: Notification.permission }) : Promise.resolve({ state: 'granted' }) ) }) });
+        Object.defineProperty(navigator, 'hardwareConcurrency', { get: () => 8 });
+        Object.defineProperty(navigator, 'deviceMemory', { get: () => 8 });
+        Object.defineProperty(navigator, 'connection', { get: () => ({ effectiveType: '4g', rtt: 50, downlink: 10 }) });
+    """
+    
+    # Job cards per guest results page; a shorter page is the last one
+    RESULTS_PAGE_SIZE = 10
+    
+    # Seconds before the first job-details retry; doubled on each further attempt
+    DETAILS_RETRY_BASE_DELAY = 1.0
+    
     _browser: Optional[Browser] = None
     _playwright = None
     _browser_lock = asyncio.Lock()
@@ -52,7 +101,7 @@ class LinkedInScraperGuest:
         self._watchdog_task = None
         self.proxy_config = proxy_config or self._get_default_proxy_config()
         self._recent_logs = deque(maxlen=50)
-        self.llm_client = LiteLLMClient()
+        self.llm_client = get_llm_client()
         
         class LastLogTimeHandler(logging.Handler):
             def __init__(inner_self, parent):
@@ -83,30 +132,11 @@ class LinkedInScraperGuest:
 
     def _get_default_proxy_config(self) -> Optional[Dict[str, str]]:
         """Get default proxy configuration from environment variables."""
-        proxy_server = os.getenv('PROXY_SERVER')
-        proxy_username = os.getenv('PROXY_USERNAME')
-        proxy_password = os.getenv('PROXY_PASSWORD')
-        proxy_ports_str = os.getenv("PROXY_PORTS", "")
-        proxy_ports = [int(port.strip()) for port in proxy_ports_str.split(",") if port.strip()]
-        
-        if proxy_server:
+        settings = _proxy_settings()
+        if settings:
+            base_url, proxy_ports, proxy_username, proxy_password = settings
             random_port = random.choice(proxy_ports)
-            
-            # Parse the proxy server URL to replace the port
-            if '://' in proxy_server:
-                protocol, rest = proxy_server.split('://', 1)
-                if ':' in rest:
-                    host, _ = rest.split(':', 1)
-                else:
-                    host = rest
-                proxy_server_with_port = f"{protocol}://{host}:{random_port}"
-            else:
-                # If no protocol specified, assume http
-                if ':' in proxy_server:
-                    host, _ = proxy_server.split(':', 1)
-                else:
-                    host = proxy_server
-                proxy_server_with_port = f"http://{host}:{random_port}"
+            proxy_server_with_port = f"{base_url}:{random_port}"
             
             self.logger.info(f"Using proxy server with random port: {proxy_server_with_port}")
             
@@ -128,23 +158,6 @@ class LinkedInScraperGuest:
         self.logger.debug(f"Random delay: {delay:.2f} seconds")
         await asyncio.sleep(delay)
 
-    async def _human_like_mouse_movement(self):
-        """Simulate human-like mouse movement."""
-        if not self.page:
-            return
-        try:
-            # Get viewport size
-            viewport = self.page.viewport_size
-            if viewport:
-                # Random mouse movements
-                for _ in range(random.randint(1, 3)):
-                    x = random.randint(100, viewport['width'] - 100)
-                    y = random.randint(100, viewport['height'] - 100)
-                    await self.page.mouse.move(x, y)
-                    await asyncio.sleep(random.uniform(0.1, 0.3))
-        except Exception as e:
-            self.logger.debug(f"Mouse movement error: {e}")
-
     async def _human_like_typing(self, text: str):
         """Type text with human-like speed variations."""
         for char in text:
@@ -152,17 +165,17 @@ class LinkedInScraperGuest:
             # Variable typing speed
             await asyncio.sleep(random.uniform(0.05, 0.15))
 
-    async def _block_resource_types(self):
-        if not self.page:
-            return
+    @staticmethod
+    async def _block_resource_types(context: BrowserContext):
+        """Abort media and tracker requests for every page of the context, including job-detail pages."""
         async def route_intercept(route, request):
-            if request.resource_type in ["image", "media", "font", "stylesheet"]:
+            if request.resource_type in BLOCKED_RESOURCE_TYPES:
                 await route.abort()
-            elif any(domain in request.url for domain in ["doubleclick.net", "google-analytics.com", "ads.linkedin.com"]):
+            elif any(domain in request.url for domain in BLOCKED_DOMAINS):
                 await route.abort()
             else:
                 await route.continue_()
-        await self.page.route("**/*", route_intercept)
+        await context.route("**/*", route_intercept)
 
     @classmethod
     async def _get_browser(cls, launch_options=None):
@@ -206,68 +219,59 @@ class LinkedInScraperGuest:
                 cls._browser = await cls._playwright.chromium.launch(**launch_options)
             return cls._browser
 
+    async def _new_context(self) -> BrowserContext:
+        """Create a context on the shared browser with a fresh fingerprint and the current proxy."""
+        # Context options with proxy and human-like settings
+        chrome_version = self._get_random_chrome_version()
+        context_options = {
+            'user_agent': random.choice(self.USER_AGENTS),
+            'viewport': random.choice(self.VIEWPORT_SIZES),
+            'locale': 'en-US',
+            'timezone_id': 'Europe/London',
+            'geolocation': None,
+            'permissions': [],
+            'extra_http_headers': {
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1',
+                'Sec-Fetch-Dest': 'document',
+                'Sec-Fetch-Mode': 'navigate',
+                'Sec-Fetch-Site': 'none',
+                'Sec-Fetch-User': '?1',
+                'Sec-Ch-Ua': f'"Not_A Brand";v="8", "Chromium";v="{chrome_version}", "Google Chrome";v="{chrome_version}"',
+                'Sec-Ch-Ua-Mobile': '?0',
+                'Sec-Ch-Ua-Platform': '"Linux"',
+                'Cache-Control': 'max-age=0',
+            }
+        }
+        # Add proxy if configured
+        if self.proxy_config:
+            context_options['proxy'] = self.proxy_config
+            self.logger.info(f"Using proxy: {self.proxy_config.get('server', 'configured')}")
+        else:
+            self.logger.info("No proxy configured, using direct connection")
+        
+        context = await self.browser.new_context(**context_options)
+        # Add stealth scripts to avoid detection
+        await context.add_init_script(self.STEALTH_INIT_SCRIPT)
+        await self._block_resource_types(context)
+        return context
+
     async def _initialize(self):
         try:
             self.logger.info("Starting new browser context initialization...")
             # Always get the shared browser instance
             self.browser = await self._get_browser()
-            # Context options with proxy and human-like settings
-            chrome_version = self._get_random_chrome_version()
-            context_options = {
-                'user_agent': random.choice(self.USER_AGENTS),
-                'viewport': random.choice(self.VIEWPORT_SIZES),
-                'locale': 'en-US',
-                'timezone_id': 'Europe/London',
-                'geolocation': None,
-                'permissions': [],
-                'extra_http_headers': {
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-User': '?1',
-                    'Sec-Ch-Ua': f'"Not_A Brand";v="8", "Chromium";v="{chrome_version}", "Google Chrome";v="{chrome_version}"',
-                    'Sec-Ch-Ua-Mobile': '?0',
-                    'Sec-Ch-Ua-Platform': '"Linux"',
-                    'Cache-Control': 'max-age=0',
-                }
-            }
-            # Add proxy if configured
-            if self.proxy_config:
-                context_options['proxy'] = self.proxy_config
-                self.logger.info(f"Using proxy: {self.proxy_config.get('server', 'configured')}")
-            else:
-                self.logger.info("No proxy configured, using direct connection")
-            
-            self.context = await self.browser.new_context(**context_options)
+            self.context = await self._new_context()
             self.logger.info("Created new browser context")
             
-            # Add stealth scripts to avoid detection
-            await self.context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-                Object.defineProperty(navigator, 'platform', { get: () => 'Linux x86_64' });
-                Object.defineProperty(navigator, 'vendor', { get: () => 'Google Inc.' });
-                Object.defineProperty(navigator, 'vendorSub', { get: () => '' });
-                Object.defineProperty(navigator, 'productSub', { get: () => '20030107' });
-                Object.defineProperty(navigator, 'plugins', { get: () => ({ length: 3, 0: { name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer' }, 1: { name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai' }, 2: { name: 'Native Client', filename: 'internal-nacl-plugin' } }) });
-                Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
-                window.chrome = { runtime: { onConnect: undefined, onMessage: undefined }, loadTimes: function() { return { commitLoadTime: Date.now() / 1000 - Math.random() * 10, connectionInfo: 'http/1.1', finishDocumentLoadTime: Date.now() / 1000 - Math.random() * 5, finishLoadTime: Date.now() / 1000 - Math.random() * 3, firstPaintAfterLoadTime: 0, firstPaintTime: Date.now() / 1000 - Math.random() * 8, navigationType: 'Other', npnNegotiatedProtocol: 'unknown', requestTime: Date.now() / 1000 - Math.random() * 15, startLoadTime: Date.now() / 1000 - Math.random() * 12, wasAlternateProtocolAvailable: false, wasFetchedViaSpdy: false, wasNpnNegotiated: false }; }, csi: function() { return { pageT: Date.now() - Math.random() * 1000, startE: Date.now() - Math.random() * 2000, tran: 15 }; } };
-                Object.defineProperty(navigator, 'permissions', { get: () => ({ query: (parameters) => ( parameters.name === 'notifications' ? Promise.resolve({ state: Notification.permission }) : Promise.resolve({ state: 'granted' }) ) }) });
-                Object.defineProperty(navigator, 'hardwareConcurrency', { get: () => 8 });
-                Object.defineProperty(navigator, 'deviceMemory', { get: () => 8 });
-                Object.defineProperty(navigator, 'connection', { get: () => ({ effectiveType: '4g', rtt: 50, downlink: 10 }) });
-            """)
-            
             self.logger.info("Creating new page...")
             self.page = await self.context.new_page()
             await stealth_async(self.page)
             self.logger.info("Stealth script injected.")
             
-            await self._block_resource_types()
             self.logger.info("Initialized Playwright context for guest scraping with human-like behavior.")
         except Exception as e:
             self.logger.error(f"Context initialization failed: {e}")
@@ -360,7 +364,9 @@ class LinkedInScraperGuest:
         max_retries = 2
         
         try:
-            await stealth_async(current_page)
+            # A page handed in by the caller already has the stealth scripts; adding them twice repeats every injection
+            if not page:
+                await stealth_async(current_page)
             
             for attempt in range(max_retries + 1):
                 try:
@@ -383,8 +389,8 @@ class LinkedInScraperGuest:
                     api_url = f"https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
                     public_url = f"https://www.linkedin.com/jobs/view/{job_id}/"
                     
+                    # The guest endpoint serves static HTML, so the fields are in the DOM once it is parsed
                     await current_page.goto(api_url, timeout=30000, wait_until='domcontentloaded')
-                    await self._random_delay(1, 2)  # Reduced delay for parallel processing
                     
                     # Extract job details with updated selectors
                     title_el = await current_page.query_selector('body > section > div > div.top-card-layout__entity-info-container.flex.flex-wrap.papabear\\:flex-nowrap > div > a > h2')
@@ -440,7 +446,8 @@ class LinkedInScraperGuest:
                         description=combined_description
                     )
                     
-                except Exception as e:
+                except PlaywrightError as e:
+                    # Timeouts and navigation failures are transient; back off and retry
                     current_url = current_page.url if current_page else api_url
                     
                     self.logger.error(f"Error getting job details for job_id={job_id} from URL={current_url} (attempt {attempt + 1}): {e}")
@@ -456,6 +463,11 @@ class LinkedInScraperGuest:
                     if attempt == max_retries:
                         self.logger.error(f"Failed to get job details for job_id={job_id} after {max_retries + 1} attempts")
                         return None
+                    await asyncio.sleep(self.DETAILS_RETRY_BASE_DELAY * 2 ** attempt)
+                except Exception as e:
+                    # Anything else is a bug in extraction that a retry won't fix
+                    self.logger.error(f"Unexpected error getting job details for job_id={job_id}: {e}")
+                    return None
         
         finally:
             # Clean up the page if we created it
@@ -476,9 +488,9 @@ class LinkedInScraperGuest:
             try:
                 # Rotate proxy config for this task
                 if task_index % 5 == 0:  # Every 5th task gets a new proxy
+                    # The new context is ready once this returns
                     new_proxy_config = self._get_default_proxy_config()
                     await self._update_proxy_config(new_proxy_config)
-                    await asyncio.sleep(1)  # Brief delay after proxy change
                 
                 # Create a dedicated page for this job to avoid interference
                 job_page = await self.context.new_page()
@@ -548,59 +560,11 @@ class LinkedInScraperGuest:
                     await self.context.close()
                 
                 # Create new context with updated proxy
-                chrome_version = self._get_random_chrome_version()
-                context_options = {
-                    'user_agent': random.choice(self.USER_AGENTS),
-                    'viewport': random.choice(self.VIEWPORT_SIZES),
-                    'locale': 'en-US',
-                    'timezone_id': 'Europe/London',
-                    'geolocation': None,
-                    'permissions': [],
-                    'extra_http_headers': {
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Accept-Encoding': 'gzip, deflate, br',
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                        'Connection': 'keep-alive',
-                        'Upgrade-Insecure-Requests': '1',
-                        'Sec-Fetch-Dest': 'document',
-                        'Sec-Fetch-Mode': 'navigate',
-                        'Sec-Fetch-Site': 'none',
-                        'Sec-Fetch-User': '?1',
-                        'Sec-Ch-Ua': f'"Not_A Brand";v="8", "Chromium";v="{chrome_version}", "Google Chrome";v="{chrome_version}"',
-                        'Sec-Ch-Ua-Mobile': '?0',
-                        'Sec-Ch-Ua-Platform': '"Linux"',
-                        'Cache-Control': 'max-age=0',
-                    }
-                }
-                
-                # Add new proxy config
-                if self.proxy_config:
-                    context_options['proxy'] = self.proxy_config
-                    self.logger.info(f"Applied new proxy: {self.proxy_config.get('server', 'configured')}")
-                else:
-                    self.logger.info("Using direct connection (no proxy)")
-                
-                # Create new context with updated proxy
-                self.context = await self.browser.new_context(**context_options)
-                await self.context.add_init_script("""
-                    Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-                    Object.defineProperty(navigator, 'platform', { get: () => 'Linux x86_64' });
-                    Object.defineProperty(navigator, 'vendor', { get: () => 'Google Inc.' });
-                    Object.defineProperty(navigator, 'vendorSub', { get: () => '' });
-                    Object.defineProperty(navigator, 'productSub', { get: () => '20030107' });
-                    Object.defineProperty(navigator, 'plugins', { get: () => ({ length: 3, 0: { name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer' }, 1: { name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai' }, 2: { name: 'Native Client', filename: 'internal-nacl-plugin' } }) });
-                    Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
-                    window.chrome = { runtime: { onConnect: undefined, onMessage: undefined }, loadTimes: function() { return { commitLoadTime: Date.now() / 1000 - Math.random() * 10, connectionInfo: 'http/1.1', finishDocumentLoadTime: Date.now() / 1000 - Math.random() * 5, finishLoadTime: Date.now() / 1000 - Math.random() * 3, firstPaintAfterLoadTime: 0, firstPaintTime: Date.now() / 1000 - Math.random() * 8, navigationType: 'Other', npnNegotiatedProtocol: 'unknown', requestTime: Date.now() / 1000 - Math.random() * 15, startLoadTime: Date.now() / 1000 - Math.random() * 12, wasAlternateProtocolAvailable: false, wasFetchedViaSpdy: false, wasNpnNegotiated: false }; }, csi: function() { return { pageT: Date.now() - Math.random() * 1000, startE: Date.now() - Math.random() * 2000, tran: 15 }; } };
-                    Object.defineProperty(navigator, 'permissions', { get: () => ({ query: (parameters) => ( parameters.name === 'notifications' ? Promise.resolve({ state: Notification.permission }) : Promise.resolve({ state: 'granted' }) ) }) });
-                    Object.defineProperty(navigator, 'hardwareConcurrency', { get: () => 8 });
-                    Object.defineProperty(navigator, 'deviceMemory', { get: () => 8 });
-                    Object.defineProperty(navigator, 'connection', { get: () => ({ effectiveType: '4g', rtt: 50, downlink: 10 }) });
-                """)
+                self.context = await self._new_context()
                 
                 # Create new page
                 self.page = await self.context.new_page()
                 await stealth_async(self.page)
-                await self._block_resource_types()
                 
                 self.logger.info("Successfully updated proxy configuration and reinitialized context")
             else:
@@ -667,7 +631,7 @@ class LinkedInScraperGuest:
         max_pages_to_scrape = time_period.get_max_pages_to_scrape()
         
         for iteration in range(max_pages_to_scrape):
-            start_pos = iteration * 10
+            start_pos = iteration * self.RESULTS_PAGE_SIZE
             params["start"] = start_pos
             
             # Build URL with current pagination
@@ -676,9 +640,11 @@ class LinkedInScraperGuest:
             self.logger.info(f"Fetching jobs page {iteration + 1} (start={start_pos}): {search_url}")
             
             try:
-                # Navigate to the API endpoint
-                await self.page.goto(search_url, timeout=20000)
-                await self._random_delay(2, 4)
+                # Pace consecutive result pages; the first one is fetched right away
+                if iteration:
+                    await self._random_delay(2, 4)
+                # Navigate to the API endpoint; its static HTML is complete once parsed
+                await self.page.goto(search_url, timeout=20000, wait_until='domcontentloaded')
                 
                 # Check for empty HTML response that indicates end of results
                 body_element = await self.page.query_selector('body')
@@ -697,33 +663,30 @@ class LinkedInScraperGuest:
                     self.logger.info(f"No results section detected on page {iteration + 1}")
                     break
                     
-                # Extract job cards using new selectors
-                job_cards = await self.page.query_selector_all('li > div.base-card')
-                self.logger.info(f"Found {len(job_cards)} job cards on page {iteration + 1}")
+                # Read every card's data-entity-urn in one round trip instead of one per card
+                entity_urns = await self.page.eval_on_selector_all(
+                    'li > div.base-card',
+                    "cards => cards.map(card => card.getAttribute('data-entity-urn'))",
+                )
+                self.logger.info(f"Found {len(entity_urns)} job cards on page {iteration + 1}")
                 
-                if len(job_cards) == 0:
+                if len(entity_urns) == 0:
                     self.logger.info(f"No job cards found on page {iteration + 1}, stopping pagination")
                     break
                     
                 # Extract job IDs from the cards
-                page_job_ids = set()
-                for card in job_cards:
-                    try:
-                        # Look for data-entity-urn attribute
-                        entity_urn = await card.get_attribute('data-entity-urn')
-                        if entity_urn and entity_urn.startswith('urn:li:jobPosting:'):
-                            job_id = entity_urn.split(':')[-1]
-                            page_job_ids.add(job_id)
-                            all_job_ids.add(job_id)
-                    except Exception as e:
-                        self.logger.error(f"Failed to extract job ID from card: {e}")
-                continue
+                page_job_ids = {
+                    entity_urn.split(':')[-1]
+                    for entity_urn in entity_urns
+                    if entity_urn and entity_urn.startswith('urn:li:jobPosting:')
+                }
+                all_job_ids.update(page_job_ids)
                         
                 self.logger.info(f"Extracted {len(page_job_ids)} job IDs from page {iteration + 1}")
                 
-                # If we found fewer than 10 jobs, this is likely the last page
-                if len(job_cards) < 10:
-                    self.logger.info(f"Found only {len(job_cards)} jobs on page {iteration + 1}, stopping pagination")
+                # A page short of a full set is the last one; don't request another
+                if len(entity_urns) < self.RESULTS_PAGE_SIZE:
+                    self.logger.info(f"Found only {len(entity_urns)} jobs on page {iteration + 1}, stopping pagination")
                     break
                     
             except Exception as e:
@@ -765,131 +728,13 @@ class LinkedInScraperGuest:
             self.logger.debug(f"Human-like click failed, using normal click: {e}")
             await element.click()
 
-    async def _apply_job_type_filter(self, job_types: List[JobType]):
-        # Find the Job type filter button by aria-label
-        btn = await self.page.query_selector('button[aria-label^="Job type filter"]')
-        if btn:
-            await self._human_like_click(btn)
-            await self._random_delay(0.5, 1.5)
-            found_labels = await self.page.query_selector_all('div[aria-label="Job type filter options"] label')
-            label_texts = [await label_el.inner_text() for label_el in found_labels]
-            self.logger.info(f"Job type filter labels found: {label_texts}")
-            self.logger.info(f"Job types to apply: {job_types}")
-            any_applied = False
-            for applied_job_type in job_types:
-                applied_label_text = applied_job_type.label.lower()
-                for label_el in found_labels:
-                    found_text = (await label_el.inner_text()).lower()
-                    if applied_label_text in found_text:
-                        is_visible = await label_el.is_visible()
-                        is_enabled = await label_el.is_enabled()
-                        self.logger.info(f"Label '{found_text}' is_visible={is_visible}, is_enabled={is_enabled}")
-                        if is_visible and is_enabled:
-                            await self._human_like_click(label_el)
-                            self.logger.info(f"Clicked label for job type: {applied_job_type.label}")
-                            await self._random_delay(0.3, 0.8)
-                            for_attr = await label_el.get_attribute('for')
-                            if for_attr:
-                                cb = await self.page.query_selector(f'#{for_attr}')
-                                if cb:
-                                    await cb.check()
-                                    checked = await cb.is_checked()
-                                    self.logger.info(f"Checkbox for job type '{applied_job_type.label}' checked: {checked}")
-                            any_applied = True
-                            break
-            await self._random_delay(0.5, 1)
-            done_btn = await self.page.query_selector('#jserp-filters > ul > li:nth-child(3) > div > div > div > button')
-            if done_btn:
-                await self._human_like_click(done_btn)
-                self.logger.info("Clicked 'Done' button for job type filter.")
-            else:
-                self.logger.info("No 'Done' button found for job type filter.")
-            await self.page.keyboard.press('Escape')
-            await self._random_delay(0.5, 1.5)
-            return any_applied
-        return False
-
-    async def _apply_remote_type_filter(self, remote_types: List[RemoteType]):
-        # Find the Remote filter button by aria-label
-        btn = await self.page.query_selector('button[aria-label^="Remote filter"]')
-        if btn:
-            await self._human_like_click(btn)
-            await self._random_delay(0.5, 1.5)
-            labels = await self.page.query_selector_all('div[aria-label="Remote filter options"] label')
-            label_texts = [await label_el.inner_text() for label_el in labels]
-            self.logger.info(f"Remote type filter labels found: {label_texts}")
-            self.logger.info(f"Remote types to apply: {remote_types}")
-            any_applied = False
-            for rt in remote_types:
-                label_text = rt.label.lower()
-                for label_el in labels:
-                    text = (await label_el.inner_text()).lower()
-                    if label_text in text:
-                        is_visible = await label_el.is_visible()
-                        is_enabled = await label_el.is_enabled()
-                        self.logger.info(f"Label '{text}' is_visible={is_visible}, is_enabled={is_enabled}")
-                        if is_visible and is_enabled:
-                            await self._human_like_click(label_el)
-                            self.logger.info(f"Clicked label for remote type: {rt.label}")
-                            await self._random_delay(0.3, 0.8)
-                            for_attr = await label_el.get_attribute('for')
-                            if for_attr:
-                                cb = await self.page.query_selector(f'#{for_attr}')
-                                if cb:
-                                    await cb.check()
-                                    checked = await cb.is_checked()
-                                    self.logger.info(f"Checkbox for remote type '{rt.label}' checked: {checked}")
-                            any_applied = True
-                            break
-            await self._random_delay(0.5, 1)
-            done_btn = await self.page.query_selector('#jserp-filters > ul > li:nth-child(7) > div > div > div > button')
-            if done_btn:
-                await self._human_like_click(done_btn)
-                self.logger.info("Clicked 'Done' button for remote type filter.")
-            else:
-                self.logger.info("No 'Done' button found for remote type filter.")
-            await self.page.keyboard.press('Escape')
-            await self._random_delay(0.5, 1.5)
-            return any_applied
-        return False
-
-    @staticmethod
-    def _strip_query(url: str) -> str:
-        parsed = urlparse(url)
-        return urlunparse(parsed._replace(query="", fragment=""))
-
-    async def _extract_job_details(self, card, idx: int = 0) -> Optional[ShortJobListing]:
-        # Extract job details from a job card element
-        try:
-            # For guest cards, structure is different
-            title_el = await card.query_selector('a.base-card__full-link')
-            title = await title_el.inner_text() if title_el else ''
-            job_url = await title_el.get_attribute('href') if title_el else ''
-            job_url = self._strip_query(job_url)
-            company_el = await card.query_selector('h4.base-search-card__subtitle a, h4.base-search-card__subtitle')
-            company = await company_el.inner_text() if company_el else ''
-            location_el = await card.query_selector('span.job-search-card__location')
-            location = await location_el.inner_text() if location_el else ''
-            time_el = await card.query_selector('time')
-            created_ago = await time_el.inner_text() if time_el else ''
-            self.logger.info(f"Extracted job: title='{title}', company='{company}', location='{location}', url='{job_url}', created_ago='{created_ago}'")
-            return ShortJobListing(
-                title=title.strip(),
-                company=company.strip(),
-                location=location.strip(),
-                link=job_url.strip(),
-                created_ago=created_ago.strip(),
-            )
-        except Exception as e:
-            self.logger.error(f"Failed to extract job details: {e}")
-            return None
-
     async def _close_sign_in_modal(self):
         """Close the LinkedIn sign-in modal if it appears."""
-        # Try the most specific selector first, then fall back to others
+        # The known dismiss buttons are probed in one query; the generic SVG button only as a last resort,
+        # since joining it in could match an unrelated button earlier in the page
         selectors = [
-            '#base-contextual-sign-in-modal > div > section > button',
-            'button[aria-label="Dismiss"]',
+            '#base-contextual-sign-in-modal > div > section > button, '
+            'button[aria-label="Dismiss"], '
             'button.contextual-sign-in-modal__modal-dismiss',
             'button:has(svg)',  # Generic: any button with an SVG (the X)
         ]
@@ -918,70 +763,6 @@ class LinkedInScraperGuest:
         except Exception as e:
             self.logger.warning(f"Failed to reject cookies: {e}")
 
-    async def _scroll_job_results(self):
-        """Scroll the job results list section to load more jobs using scrollIntoView on the last card."""
-        try:
-            self.logger.info("Starting scrollIntoView scrolling for job results list...")
-            container = await self.page.query_selector('#main-content > section.two-pane-serp-page__results-list')
-            if not container:
-                container = await self.page.query_selector('.jobs-search__results-list')
-            if not container:
-                self.logger.warning("No main job results container found, cannot scroll.")
-                return
-            job_card_selector = '.jobs-search__results-list > li'
-            max_scroll_attempts = 10
-            seen_jobs = set()  # Store unique job identifiers (title + company)
-            
-            for i in range(max_scroll_attempts):
-                cards = await self.page.query_selector_all(job_card_selector)
-                current_jobs = set()
-                
-                # Extract title and company for each card to create unique identifiers
-                for card in cards:
-                    try:
-                        title_el = await card.query_selector('a.base-card__full-link')
-                        title = await title_el.inner_text() if title_el else ''
-                        company_el = await card.query_selector('h4.base-search-card__subtitle a, h4.base-search-card__subtitle')
-                        company = await company_el.inner_text() if company_el else ''
-                        
-                        if title and company:
-                            job_id = f"{title.strip()}::{company.strip()}"
-                            current_jobs.add(job_id)
-                    except Exception:
-                        continue
-                
-                new_jobs = current_jobs - seen_jobs
-                self.logger.info(f"Scroll {i+1}/{max_scroll_attempts}: {len(cards)} cards found, {len(current_jobs)} unique jobs, {len(new_jobs)} new.")
-                
-                # If no new jobs were found, stop scrolling
-                if len(new_jobs) == 0 and i > 0:  # Allow at least one scroll attempt
-                    self.logger.info(f"No new jobs found after scroll attempt {i+1}. Stopping scrolling.")
-                    break
-                
-                # Scroll to the last card if there are cards
-                if cards:
-                    # Human-like scrolling: sometimes scroll to middle cards too
-                    if random.random() < 0.3 and len(cards) > 5:  # 30% chance
-                        target_card = cards[len(cards) // 2]  # Middle card
-                    else:
-                        target_card = cards[-1]  # Last card
-                    
-                    await target_card.evaluate('el => el.scrollIntoView({behavior: "smooth", block: "center"})')
-                    
-                    # Variable delay after scroll
-                    await self._random_delay(1, 2.5)
-                    
-                    # Occasionally do small mouse movements while waiting
-                    if random.random() < 0.5:  # 50% chance
-                        await self._human_like_mouse_movement()
-                
-                # Update seen jobs
-                seen_jobs.update(current_jobs)
-            
-            self.logger.info(f"Finished scrollIntoView scrolling. Total unique job cards seen: {len(seen_jobs)}")
-        except Exception as e:
-            self.logger.warning(f"Failed to scroll job results list: {e}")
-
     async def check_proxy_connection(self):
         max_retries = 3
         for attempt in range(1, max_retries + 1):
@@ -989,7 +770,8 @@ class LinkedInScraperGuest:
                 await self._initialize()
                 test_url = "https://www.linkedin.com/"
                 self.logger.info(f"Testing proxy connection by navigating to {test_url} (attempt {attempt})")
-                await self.page.goto(test_url, timeout=20000)
+                # Reaching the parsed document proves the proxy works; the full load event adds nothing
+                await self.page.goto(test_url, timeout=20000, wait_until='domcontentloaded')
                 self.logger.info("Proxy connection test succeeded.")
                 await self._cleanup()
                 return True
@@ -1005,6 +787,11 @@ class LinkedInScraperGuest:
         # Consider masked if the value contains at least one '*' character
         return value is not None and '*' in value 
 
+    @classmethod
+    async def start_browser(cls):
+        """Launch the shared browser ahead of the first search; sessions only open contexts on it."""
+        await cls._get_browser()
+
     @classmethod
     async def close_all_browsers(cls):
         async with cls._browser_lock:
@@ -1015,36 +802,6 @@ class LinkedInScraperGuest:
                 await cls._playwright.stop()
                 cls._playwright = None 
 
-    async def _wait_for_results_list_with_retries(self, context: str, max_retries: int = 3, min_sleep: float = 2.0, max_sleep: float = 8.0, timeout: int = 15000) -> bool:
-        """
-        Wait for the .jobs-search__results-list container with retries and random sleep.
-        Also checks for the no-results section.
-        Returns True if results list found, False if no-results section found or not found after retries.
-        """
-        no_results_selector = 'section.core-section-container.my-3.no-results'
-        for attempt in range(1, max_retries + 1):
-            try:
-                self.logger.info(f"[{context}] Attempt {attempt}: Waiting for .jobs-search__results-list...")
-                await self._random_delay(min_sleep, max_sleep)
-                # Check for no-results section first
-                no_results_section = await self.page.query_selector(no_results_selector)
-                if no_results_section:
-                    self.logger.info(f"[{context}] No results section detected: '{no_results_selector}' (returning immediately)")
-                    return False  # Return immediately, do not retry
-                await self.page.wait_for_selector('.jobs-search__results-list', timeout=timeout)
-                self.logger.info(f"[{context}] .jobs-search__results-list found.")
-                return True
-            except Exception as e:
-                self.logger.error(f"[{context}] Attempt {attempt}: .jobs-search__results-list not found: {e}")
-        url = self.page.url if self.page else None
-        self.logger.error(f"[{context}] .jobs-search__results-list not found after {max_retries} attempts. Current URL: {url}")
-        try:
-            html = await self.page.content()
-            self.logger.error(f"[{context}] Page HTML (first 2000 chars): {html[:2000]}")
-        except Exception as html_error:
-            self.logger.error(f"[{context}] Failed to get page HTML or URL: {html_error}")
-        return False 
-
     async def _get_job_details_with_llm_filtering(
         self,
         job_ids: List[str],
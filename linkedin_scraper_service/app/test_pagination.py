@@ -0,0 +1,53 @@
+"""
+Unit tests for guest results pagination.
+"""
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from linkedin_scraper_service.app.scraper import LinkedInScraperGuest
+from shared.data import TimePeriod
+
+
+def make_urns(count: int, offset: int = 0) -> list:
+    return [f"urn:li:jobPosting:{offset + i}" for i in range(count)]
+
+
+@pytest.fixture
+def scraper():
+    """Create a guest scraper whose results pages are served by a mocked page."""
+    guest = LinkedInScraperGuest(name="test")
+    guest.page = Mock()
+    guest.page.goto = AsyncMock()
+    # No empty body and no no-results section, so only the card count decides
+    guest.page.query_selector = AsyncMock(return_value=None)
+    guest._watchdog = AsyncMock()
+    guest._random_delay = AsyncMock()
+    guest._get_job_details_with_llm_filtering = AsyncMock(return_value=[])
+    return guest
+
+
+class TestPagination:
+    """Test when result pages stop being requested."""
+
+    @pytest.mark.asyncio
+    async def test_stops_after_short_page(self, scraper):
+        """A page with fewer than a full set of cards should be the last one fetched."""
+        scraper.page.eval_on_selector_all = AsyncMock(side_effect=[make_urns(10), make_urns(3, offset=10)])
+
+        await scraper._search_jobs_internal("Python", time_period=TimePeriod.parse("1 hour"))
+
+        assert scraper.page.goto.await_count == 2
+        job_ids = scraper._get_job_details_with_llm_filtering.await_args.args[0]
+        assert len(job_ids) == 13
+
+    @pytest.mark.asyncio
+    async def test_stops_at_page_limit(self, scraper):
+        """Full pages should be fetched up to the time period's page limit."""
+        time_period = TimePeriod.parse("15 minutes")
+        scraper.page.eval_on_selector_all = AsyncMock(
+            side_effect=[make_urns(10, offset=10 * i) for i in range(10)]
+        )
+
+        await scraper._search_jobs_internal("Python", time_period=time_period)
+
+        assert scraper.page.goto.await_count == time_period.get_max_pages_to_scrape()
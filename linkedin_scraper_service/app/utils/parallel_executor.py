@@ -53,24 +53,19 @@ async def execute_parallel_with_semaphore(
     try:
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        # Process results and count successes/failures
-        successful_results = []
+        # Replace exceptions with None in place, keeping input order, and count failures in the same pass
         failed_count = 0
-        
         for i, result in enumerate(results):
             if isinstance(result, Exception):
                 logger.error(f"{operation_name} task {i+1} failed with exception: {result}")
+                results[i] = None
                 failed_count += 1
-                successful_results.append(None)  # Maintain order
-            elif result is not None:
-                successful_results.append(result)
-            else:
+            elif result is None:
                 failed_count += 1
-                successful_results.append(None)  # Maintain order
         
-        success_count = len([r for r in successful_results if r is not None])
+        success_count = len(results) - failed_count
         logger.info(f"Parallel {operation_name} completed: {success_count} successful, {failed_count} failed out of {len(items)} total")
-        return successful_results
+        return results
         
     except Exception as e:
         logger.error(f"Error in parallel {operation_name} execution: {e}", exc_info=True)
@@ -0,0 +1,32 @@
+"""
+Telegram Application factory.
+"""
+from telegram.ext import Application
+from telegram.request import HTTPXRequest
+
+DEFAULT_BASE_URL = "https://api.telegram.org/bot"
+DEFAULT_BASE_FILE_URL = "https://api.telegram.org/file/bot"
+
+# Sized to the global send rate so concurrent sends don't queue for a connection
+SEND_CONNECTION_POOL_SIZE = 32
+
+
+def build_application(
+    token: str,
+    base_url: str = DEFAULT_BASE_URL,
+    base_file_url: str = DEFAULT_BASE_FILE_URL,
+) -> Application:
+    """Build an Application with the bot's base URLs and pooled HTTP/2 requests.
+
+    Each call returns a new Application with its own handlers and connection pools;
+    the container builds the bot, and with it the Application, once per process.
+    """
+    return (
+        Application.builder()
+        .token(token)
+        .base_url(base_url)
+        .base_file_url(base_file_url)
+        .request(HTTPXRequest(connection_pool_size=SEND_CONNECTION_POOL_SIZE, http_version="2", read_timeout=20))
+        .get_updates_request(HTTPXRequest(http_version="2"))
+        .build()
+    )
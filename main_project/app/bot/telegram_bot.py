@@ -1,12 +1,15 @@
 """
 Refactored Telegram bot module with LLM agent integration.
 """
+import functools
 import logging
 import os
-from typing import Dict, List, Optional
+import random
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+from collections import OrderedDict, deque
 from telegram import Update, Message
+from telegram.error import BadRequest, NetworkError, RetryAfter
 from telegram.ext import (
-    Application,
     CommandHandler,
     ContextTypes,
     MessageHandler,
@@ -17,10 +20,14 @@ from datetime import datetime
 import asyncio
 
 from shared.data import (
-    JobListing, StreamType, StreamEvent, StreamManager
+    FullJobListing, JobListing, StreamType, StreamEvent, StreamManager
+)
+from main_project.app.bot.application import (
+    DEFAULT_BASE_FILE_URL, DEFAULT_BASE_URL, SEND_CONNECTION_POOL_SIZE, build_application
 )
 from main_project.app.core.job_search_manager import JobSearchManager
 from main_project.app.llm.job_search_agent import JobSearchAgent
+from main_project.app.utils.rate_limiter import AsyncTokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -29,29 +36,314 @@ try:
 except (TypeError, ValueError):
     raise RuntimeError("ADMIN_USER_ID environment variable must be set and be an integer.")
 
+# Telegram limits: ~30 messages per second overall and 20 messages per minute per chat
+GLOBAL_SEND_RATE = 30
+PER_CHAT_SEND_RATE = 20 / 60
+PER_CHAT_SEND_BURST = 20
+# Per-chat buckets kept for the most recently active chats; the least recently used are evicted
+CHAT_BUCKETS_LIMIT = 10000
+MAX_SEND_ATTEMPTS = 3
+SEND_RETRY_BASE_DELAY = 0.5
+# Keep in-flight sends within the HTTP connection pool so bursts queue here instead of hitting pool timeouts
+MAX_CONCURRENT_SENDS = SEND_CONNECTION_POOL_SIZE
+# Sends waiting for delivery across all chats beyond which new job notifications are refused,
+# before their jobs are claimed as sent
+SEND_QUEUE_SIZE = 10000
+MAX_MESSAGE_LENGTH = 4096
+JOB_LISTINGS_HEADER = "🔔 New job listings found!\n\n"
+CONTINUATION_HEADER = "📄 Continued...\n\n"
+# Long-poll getUpdates for up to 20s so an idle bot makes far fewer requests
+POLLING_TIMEOUT = 20
+
+# Static parts of the /start and /help replies
+START_CAPABILITIES = (
+    "🤖 **What makes me special:**\n"
+    "• I understand **natural language** - just talk to me like a person!\n"
+    "• I'll guide you through each step and ask for confirmation\n"
+    "• I remember our conversation and provide contextual help\n"
+    "• No need to learn complex commands - I speak human! 😊\n\n"
+)
+START_GETTING_STARTED = (
+    "\n\n✨ **Getting Started Tips:**\n"
+    "• Ask me questions naturally: \"Can you show me my searches?\"\n"
+    "• I'll ask for any missing information I need\n"
+    "• Say \"help with [topic]\" for detailed guidance\n"
+    "• I'll always confirm before making changes\n\n"
+    "📚 Use /help anytime for detailed information.\n\n"
+    "**Ready to get started?** What would you like to do with job searching today?"
+)
+HELP_HEADER = """🤖 **AI Job Search Assistant - Complete Guide**
+
+I'm your intelligent job search companion! I understand natural language and can help you with all aspects of job searching.
+
+🎯 **How I Work:**
+• **Natural Conversation**: Talk to me like you would a human assistant
+• **Smart Understanding**: I interpret your intent from casual language  
+• **Guided Process**: I'll ask for any missing information step-by-step
+• **Confirmation Safety**: I always confirm before making changes
+• **Memory**: I remember our conversation context
+
+💬 **Communication Tips:**
+• Be conversational: "I need help finding Python jobs"
+• Ask questions: "What job searches do I have active?"
+• Request help: "Help me create a new search"
+• Give feedback: "That's not what I meant, let me clarify..."
+
+📚 **Detailed Help:**
+Say "help with [topic]" for specific guidance:
+• "help with creating searches" - Learn about setting up job alerts
+• "help with finding jobs" - Understand immediate job searching
+• "help with managing searches" - Learn to view, edit, and delete alerts
+
+🔧 **Troubleshooting:**
+• If I misunderstand, just clarify: "No, I meant..."
+• For complex requests, break them into smaller parts
+• I'll guide you if you're missing required information
+
+"""
+HELP_FOOTER = """\n
+💡 **Pro Tips:**
+• I learn from context - reference previous messages
+• I can handle typos and informal language
+• Feel free to change your mind or ask follow-up questions
+• Use /start to see the welcome message again
+
+**Ready to start?** Just tell me what you want to do with job searching!"""
+
+
+# Messages answered by the fast path without involving the LLM
+GREETINGS = frozenset({'hi', 'hello', 'hey', 'start'})
+QUICK_HELP_REQUESTS = frozenset({'help', '?', 'what can you do'})
+LIST_REQUEST_PHRASES = ('show my searches', 'list searches', 'my searches', 'show searches')
+
+# Phrases that mark a message as a help request
+HELP_REQUEST_PATTERNS = (
+    "help with",
+    "how to",
+    "how do i",
+    "what is",
+    "explain",
+    "show me how to",
+    "guide me",
+    "instructions for"
+)
+
+# Phrases in a help request mapped to the tool they ask about
+HELP_TOOL_PHRASES = {
+    "list": "list_job_searches",
+    "listing": "list_job_searches", 
+    "show": "list_job_searches",
+    "display": "list_job_searches",
+    "view": "list_job_searches",
+    "create": "create_job_search",
+    "creating": "create_job_search",
+    "add": "create_job_search",
+    "set up": "create_job_search",
+    "setup": "create_job_search",
+    "delete": "delete_job_search",
+    "deleting": "delete_job_search", 
+    "remove": "delete_job_search",
+    "cancel": "delete_job_search",
+    "details": "get_job_search_details",
+    "detail": "get_job_search_details",
+    "info": "get_job_search_details",
+    "information": "get_job_search_details",
+    "search": "one_time_search",
+    "searching": "one_time_search",
+    "find": "one_time_search",
+    "one time": "one_time_search",
+    "immediate": "one_time_search"
+}
+
+
+JOB_LISTING_TEMPLATE = (
+    "🏢 {company}\n"
+    "💼 {title}\n"
+    "📍 {location}\n"
+    "💼 {job_type}\n"
+    "🔗 {link}"
+)
+JOB_NOTIFICATION_TEMPLATE = (
+    "Compatibility: {compatibility_score}\n"
+    "Title: {title}\n"
+    "Employer: {company}\n"
+    "Techstack: {techstack}\n"
+    "Location: {location}\n"
+    "Created: {created_ago}\n"
+    "🔗: {link}"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_job_fields(company: str, title: str, location: str, job_type: str, link: str) -> str:
+    return JOB_LISTING_TEMPLATE.format(
+        company=company, title=title, location=location, job_type=job_type, link=link
+    )
+
+
+def format_job_listing(job: JobListing) -> str:
+    """Format a job listing for display, reusing the text for jobs seen before."""
+    return _format_job_fields(job.company, job.title, job.location, job.job_type, job.link)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_notification_fields(
+    compatibility_score: Optional[int],
+    title: str,
+    company: str,
+    techstack: Tuple[str, ...],
+    location: str,
+    created_ago: str,
+    link: str,
+) -> str:
+    return JOB_NOTIFICATION_TEMPLATE.format(
+        compatibility_score=compatibility_score,
+        title=title,
+        company=company,
+        techstack=", ".join(techstack),
+        location=location,
+        created_ago=created_ago,
+        link=link,
+    )
+
+
+def format_job_notification(job: FullJobListing) -> str:
+    """Format a scraped job for a search results notification, reusing the text when several users get the same job."""
+    return _format_notification_fields(
+        job.compatibility_score,
+        job.title,
+        job.company,
+        tuple(job.techstack),
+        job.location,
+        job.created_ago,
+        job.link,
+    )
+
+
+def utf16_len(text: str) -> int:
+    """Length of text in UTF-16 code units, the unit Telegram's message limit is counted in."""
+    return len(text.encode("utf-16-le")) >> 1
+
+
+def utf16_truncate(text: str, limit: int) -> str:
+    """Cut text to at most `limit` UTF-16 code units without splitting a surrogate pair."""
+    encoded = text.encode("utf-16-le")
+    if len(encoded) <= 2 * limit:
+        return text
+    encoded = encoded[:2 * limit]
+    if 0xD800 <= int.from_bytes(encoded[-2:], "little") <= 0xDBFF:
+        encoded = encoded[:-2]
+    return encoded.decode("utf-16-le")
+
+
+def pack_messages(
+    header: str,
+    blocks: List[str],
+    continuation_header: str = CONTINUATION_HEADER,
+    limit: int = MAX_MESSAGE_LENGTH,
+) -> List[str]:
+    """Pack text blocks into as few messages as possible without splitting a block."""
+    messages = []
+    parts = [header]
+    running = utf16_len(header)
+    separator = "\n\n"
+    separator_length = len(separator)
+    
+    for block, block_length in zip(blocks, map(utf16_len, blocks)):
+        size = block_length + separator_length
+        if len(parts) > 1 and running + size > limit:
+            messages.append("".join(parts))
+            parts = [continuation_header]
+            running = utf16_len(continuation_header)
+        parts.append(block)
+        parts.append(separator)
+        running += size
+    
+    if len(parts) > 1:
+        messages.append("".join(parts))
+    return messages
+
+
 class TelegramBot:
     """Telegram bot for managing job searches with LLM agent."""
     
-    def __init__(self, token: str, stream_manager: StreamManager, job_search_manager: JobSearchManager):
+    __slots__ = (
+        "token",
+        "stream_manager",
+        "job_search_manager",
+        "application",
+        "_global_bucket",
+        "_chat_buckets",
+        "_send_semaphore",
+        "_send_queues",
+        "_send_tasks",
+        "_pending_sends",
+        "_sending",
+        "_loop",
+        "llm_agent",
+        "_help_text",
+        "_tools_summary",
+        "_tool_examples",
+    )
+    
+    def __init__(
+        self,
+        token: str,
+        stream_manager: StreamManager,
+        job_search_manager: JobSearchManager,
+        base_url: str = DEFAULT_BASE_URL,
+        base_file_url: str = DEFAULT_BASE_FILE_URL,
+    ):
         """Initialize the bot with token and MongoDB manager."""
         self.token = token
         self.stream_manager = stream_manager
         self.job_search_manager = job_search_manager
-        self.application = Application.builder().token(token).build()
+        self.application = build_application(token, base_url, base_file_url)
+        
+        # Outgoing message pacing
+        self._global_bucket = AsyncTokenBucket(GLOBAL_SEND_RATE, GLOBAL_SEND_RATE)
+        self._chat_buckets: "OrderedDict[int, AsyncTokenBucket]" = OrderedDict()
+        self._send_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+        # Outgoing sends waiting for delivery, queued per chat so each chat's messages stay in order
+        # while a chat waiting on its own rate limit never holds up the others
+        self._send_queues: Dict[Optional[int], Deque[Callable[[], Awaitable]]] = {}
+        self._send_tasks: Dict[Optional[int], asyncio.Task] = {}
+        self._pending_sends = 0
+        self._sending = False
+        # Loop the bot runs on, captured in initialize() so stream events from other threads can be handed to it
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Initialize LLM agent
         self.llm_agent = JobSearchAgent(job_search_manager)
         
+        # Help text derived from tool documentation, built on first use
+        self._help_text: Optional[str] = None
+        self._tools_summary: Optional[str] = None
+        self._tool_examples: Optional[str] = None
+        
         self._setup_handlers()
 
         # Subscribe to send message stream
         self.stream_manager.get_stream(StreamType.SEND_MESSAGE).subscribe(
-            lambda event: asyncio.create_task(self._handle_send_message(event))
+            lambda event: self._run_in_loop(
+                self._enqueue_send, event.data.get("user_id"), functools.partial(self._handle_send_message, event)
+            )
         )
         self.stream_manager.get_stream(StreamType.SEND_LOG).subscribe(
-            lambda event: asyncio.create_task(self._handle_send_log(event))
+            lambda event: self._run_in_loop(asyncio.create_task, self._handle_send_log(event))
         )
     
+    def _run_in_loop(self, callback: Callable, *args) -> None:
+        """Call `callback` on the bot's event loop, whichever thread the stream event arrived on."""
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if self._loop is None or running_loop is self._loop:
+            callback(*args)
+        else:
+            self._loop.call_soon_threadsafe(callback, *args)
+    
     def _setup_handlers(self):
         """Set up all command and message handlers."""
         # Basic command handlers
@@ -75,7 +367,7 @@ class TelegramBot:
         
         try:
             # Get dynamic content from tool registry if available
-            if hasattr(self.llm_agent, 'tool_registry') and self.llm_agent.tool_registry:
+            if self.llm_agent.tool_registry:
                 # Generate dynamic start message from tool capabilities
                 start_message = self._generate_start_message(user.first_name)
             else:
@@ -87,7 +379,7 @@ class TelegramBot:
             await update.message.reply_text(start_message, parse_mode=ParseMode.MARKDOWN)
             
         except Exception as e:
-            logger.error(f"Error in start command: {e}")
+            logger.error("Error in start command for user %s: %s", user.id, e)
             # Ultimate fallback
             await update.message.reply_text(
                 f"👋 Hi {user.first_name}! I'm your job search assistant. Use /help to see what I can do!"
@@ -97,57 +389,18 @@ class TelegramBot:
         """Send comprehensive help message with detailed guidance."""
         try:
             # Get dynamic help from tool registry with enhanced presentation
-            if hasattr(self.llm_agent, 'tool_registry') and self.llm_agent.tool_registry:
-                enhanced_help = """🤖 **AI Job Search Assistant - Complete Guide**
-
-I'm your intelligent job search companion! I understand natural language and can help you with all aspects of job searching.
-
-🎯 **How I Work:**
-• **Natural Conversation**: Talk to me like you would a human assistant
-• **Smart Understanding**: I interpret your intent from casual language  
-• **Guided Process**: I'll ask for any missing information step-by-step
-• **Confirmation Safety**: I always confirm before making changes
-• **Memory**: I remember our conversation context
-
-💬 **Communication Tips:**
-• Be conversational: "I need help finding Python jobs"
-• Ask questions: "What job searches do I have active?"
-• Request help: "Help me create a new search"
-• Give feedback: "That's not what I meant, let me clarify..."
-
-📚 **Detailed Help:**
-Say "help with [topic]" for specific guidance:
-• "help with creating searches" - Learn about setting up job alerts
-• "help with finding jobs" - Understand immediate job searching
-• "help with managing searches" - Learn to view, edit, and delete alerts
-
-🔧 **Troubleshooting:**
-• If I misunderstand, just clarify: "No, I meant..."
-• For complex requests, break them into smaller parts
-• I'll guide you if you're missing required information
-
-"""
-                # Get tool-specific help
-                tool_help = self.llm_agent.get_tool_help()
-                full_help = enhanced_help + "\n" + tool_help
-                
-                # Add footer with more guidance
-                full_help += """\n
-💡 **Pro Tips:**
-• I learn from context - reference previous messages
-• I can handle typos and informal language
-• Feel free to change your mind or ask follow-up questions
-• Use /start to see the welcome message again
-
-**Ready to start?** Just tell me what you want to do with job searching!"""
+            if self.llm_agent.tool_registry:
+                # Tool documentation is static once the registry is loaded, so build this once
+                if self._help_text is None:
+                    self._help_text = HELP_HEADER + "\n" + self.llm_agent.get_tool_help() + HELP_FOOTER
                 
-                await self._send_message_with_splitting(update.effective_user.id, full_help)
+                await self._send_message_with_splitting(update.effective_user.id, self._help_text)
             else:
                 # Enhanced fallback with more context
                 fallback_help = self._generate_enhanced_fallback_help()
                 await self._send_message_with_splitting(update.effective_user.id, fallback_help)
         except Exception as e:
-            logger.error(f"Error showing help: {e}")
+            logger.error("Error showing help: %s", e)
             # Generate minimal help without hardcoded tool descriptions
             fallback_help = self._generate_fallback_help()
             await update.message.reply_text(fallback_help, parse_mode=ParseMode.MARKDOWN)
@@ -157,42 +410,45 @@ Say "help with [topic]" for specific guidance:
         """Handle all non-command messages with LLM agent."""
         progress_message = None
         try:
-            user_message = update.message.text
+            message = update.message
+            user_message = message.text
             user_id = update.effective_user.id
             
             # IMMEDIATE RESPONSE: Send instant acknowledgment
-            await update.message.reply_chat_action("typing")
-            progress_message = await update.message.reply_text("💭 Got it! Processing...")
+            await message.reply_chat_action("typing")
+            progress_message = await message.reply_text("💭 Got it! Processing...")
+            edit_progress = progress_message.edit_text
             
             # FAST PATH: Check for simple, direct operations that don't need LLM
-            fast_response = await self._try_fast_path(user_message, user_id)
+            normalized_message = user_message.casefold().strip()
+            fast_response = await self._try_fast_path(normalized_message, user_id)
             if fast_response:
-                await progress_message.edit_text("✅ Ready!")
+                await edit_progress("✅ Ready!")
                 await self._send_message_with_splitting(user_id, fast_response)
                 return
             
             # Check for specific help requests first (quick path)
-            if self._is_help_request(user_message):
-                tool_name = self._extract_tool_name_from_help(user_message)
-                if tool_name and hasattr(self.llm_agent, 'tool_registry') and self.llm_agent.tool_registry:
-                    await progress_message.edit_text("📚 Getting help information...")
+            if self._is_help_request(normalized_message):
+                tool_name = self._extract_tool_name_from_help(normalized_message)
+                if tool_name and self.llm_agent.tool_registry:
+                    await edit_progress("📚 Getting help information...")
                     help_response = self.llm_agent.get_tool_help(tool_name)
-                    await progress_message.edit_text("✅ Ready!")
+                    await edit_progress("✅ Ready!")
                     await self._send_message_with_splitting(user_id, help_response)
                     return
             
             # Initialize LLM agent if not already done
-            if not hasattr(self.llm_agent, 'agent_executor') or self.llm_agent.agent_executor is None:
-                await progress_message.edit_text("🤖 Initializing AI assistant...")
+            if self.llm_agent.agent_executor is None:
+                await edit_progress("🤖 Initializing AI assistant...")
                 try:
                     await self.llm_agent.initialize()
-                    await progress_message.edit_text("✅ AI ready! Thinking...")
+                    await edit_progress("✅ AI ready! Thinking...")
                 except Exception as init_error:
-                    await progress_message.edit_text("❌ Failed to initialize AI assistant.")
+                    await edit_progress("❌ Failed to initialize AI assistant.")
                     raise init_error
             
             # Update progress and start processing
-            await progress_message.edit_text("🧠 Thinking...")
+            await edit_progress("🧠 Thinking...")
             
             # Start periodic status updates
             status_task = asyncio.create_task(self._show_processing_status(progress_message))
@@ -205,18 +461,18 @@ Say "help with [topic]" for specific guidance:
                 status_task.cancel()
                 
                 # Quick final update
-                await progress_message.edit_text("✅ Response ready!")
+                await edit_progress("✅ Response ready!")
                 
                 # Send response immediately
                 await self._send_message_with_splitting(user_id, response)
                 
             except Exception as processing_error:
                 status_task.cancel()
-                await progress_message.edit_text("❌ Error processing request.")
+                await edit_progress("❌ Error processing request.")
                 raise processing_error
             
         except Exception as e:
-            logger.error(f"Error handling message: {e}")
+            logger.error("Error handling message: %s", e)
             error_response = self._generate_error_response(e, user_message)
             if progress_message:
                 try:
@@ -226,16 +482,18 @@ Say "help with [topic]" for specific guidance:
             else:
                 await update.message.reply_text(error_response)
 
-    async def _try_fast_path(self, message: str, user_id: int) -> Optional[str]:
+    async def _try_fast_path(self, message_lower: str, user_id: int) -> Optional[str]:
         """Try to handle simple requests without LLM processing for speed.
         
+        Args:
+            message_lower: The user's message, already lowercased and stripped
+        
         Returns:
             str: Fast response if handled, None if LLM processing needed
         """
-        message_lower = message.lower().strip()
         
         # Simple greetings
-        if message_lower in ['hi', 'hello', 'hey', 'start']:
+        if message_lower in GREETINGS:
             return ("👋 Hello! I'm your AI job search assistant.\n\n"
                    "I can help you:\n"
                    "• List your job searches\n" 
@@ -245,7 +503,7 @@ Say "help with [topic]" for specific guidance:
                    "Just tell me what you'd like to do!")
         
         # Status/list requests
-        if any(phrase in message_lower for phrase in ['show my searches', 'list searches', 'my searches', 'show searches']):
+        if any(phrase in message_lower for phrase in LIST_REQUEST_PHRASES):
             try:
                 searches = await self.job_search_manager.get_user_searches(user_id)
                 if not searches:
@@ -263,11 +521,11 @@ Say "help with [topic]" for specific guidance:
                 
                 return "\n".join(search_list)
             except Exception as e:
-                logger.error(f"Error in fast path list: {e}")
+                logger.error("Error in fast path list: %s", e)
                 return None
         
         # Quick help
-        if message_lower in ['help', '?', 'what can you do']:
+        if message_lower in QUICK_HELP_REQUESTS:
             return ("🤖 **I'm your AI Job Search Assistant!**\n\n"
                    "**What I can do:**\n"
                    "• 📋 List your job searches\n"
@@ -305,23 +563,24 @@ Say "help with [topic]" for specific guidance:
             # Normal cancellation when processing is done
             pass
         except Exception as e:
-            logger.warning(f"Error updating status: {e}")
+            logger.warning("Error updating status: %s", e)
 
     async def handle_unknown_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle unknown commands by redirecting to LLM agent."""
         try:
-            command = update.message.text
+            message = update.message
+            command = message.text
             user_id = update.effective_user.id
             
             # Show typing indicator
-            await update.message.reply_chat_action("typing")
+            await message.reply_chat_action("typing")
             
             # Convert command to natural language and process with LLM
             natural_message = f"I tried to use the command: {command}. Can you help me with what I'm trying to do?"
             
             # Initialize LLM agent if not already done
-            if not hasattr(self.llm_agent, 'agent_executor') or self.llm_agent.agent_executor is None:
-                await update.message.reply_text("🤖 Initializing AI assistant... Please wait a moment.")
+            if self.llm_agent.agent_executor is None:
+                await message.reply_text("🤖 Initializing AI assistant... Please wait a moment.")
                 await self.llm_agent.initialize()
             
             # Process with LLM agent
@@ -334,7 +593,7 @@ Say "help with [topic]" for specific guidance:
             await self._send_message_with_splitting(user_id, full_response)
             
         except Exception as e:
-            logger.error(f"Error handling unknown command: {e}")
+            logger.error("Error handling unknown command: %s", e)
             # Generate examples from tools if available
             examples_text = self._get_command_examples()
             await update.message.reply_text(
@@ -345,19 +604,33 @@ Say "help with [topic]" for specific guidance:
     # Bot lifecycle methods
     def run(self):
         """Run the bot."""
-        self.application.run_polling()
+        self.application.run_polling(timeout=POLLING_TIMEOUT, allowed_updates=Update.ALL_TYPES)
     
     async def initialize(self) -> None:
         """Initialize the bot."""
+        await self.connect()
+        await self.start_polling()
+    
+    async def connect(self) -> None:
+        """Complete the Telegram handshake without receiving updates yet."""
         try:
             await self.application.initialize()
+        except Exception as e:
+            logger.error("Failed to connect Telegram bot: %s", e)
+            raise
+    
+    async def start_polling(self) -> None:
+        """Start delivering messages and handling updates; call connect() first."""
+        try:
             await self.application.start()
+            self._loop = asyncio.get_running_loop()
+            self._start_send_workers()
             # Initialize LLM agent in background (don't wait for it)
             asyncio.create_task(self._initialize_llm_agent())
-            await self.application.updater.start_polling()
+            await self.application.updater.start_polling(timeout=POLLING_TIMEOUT, allowed_updates=Update.ALL_TYPES)
             logger.info("Telegram bot started successfully")
         except Exception as e:
-            logger.error(f"Failed to start Telegram bot: {e}")
+            logger.error("Failed to start Telegram bot: %s", e)
             raise
     
     async def _initialize_llm_agent(self) -> None:
@@ -366,74 +639,85 @@ Say "help with [topic]" for specific guidance:
             await self.llm_agent.initialize()
             logger.info("LLM agent initialized successfully")
         except Exception as e:
-            logger.warning(f"Failed to initialize LLM agent: {e}")
+            logger.warning("Failed to initialize LLM agent: %s", e)
             # Don't raise - bot should still work without LLM
             
     async def stop(self) -> None:
         """Stop the bot."""
         try:
-            await self.application.updater.stop()
-            await self.application.stop()
+            # The bot may have been connected without ever polling if startup failed part way
+            if self.application.updater.running:
+                await self.application.updater.stop()
+            await self._stop_send_workers()
+            if self.application.running:
+                await self.application.stop()
             await self.application.shutdown()
             logger.info("Telegram bot stopped")
         except Exception as e:
-            logger.error(f"Failed to stop Telegram bot: {e}")
+            logger.error("Failed to stop Telegram bot: %s", e)
             raise
 
     # Job notification methods (preserved for system notifications)
     async def send_job_listings(self, user_id: int, jobs: List[JobListing]) -> None:
-        """Send job listings to a user."""
+        """Queue job listings for delivery to a user."""
         if not jobs:
             return
         
-        # Format all job listings
-        formatted_jobs = [self._format_job_listing(job) for job in jobs]
-        
-        # Try to send all jobs in one message
-        message = "🔔 New job listings found!\n\n" + "\n\n".join(formatted_jobs)
-        
-        try:
-            # Check if message is too long
-            if len(message) > 4096:  # Telegram's message length limit
-                # Split into multiple messages
-                current_message = "🔔 New job listings found!\n\n"
-                
-                for job in formatted_jobs:
-                    # Check if adding this job would exceed the limit
-                    if len(current_message) + len(job) + 3 > 4096:  # +3 for "\n\n"
-                        # Send current message and start a new one
-                        await self.application.bot.send_message(
-                            chat_id=user_id,
-                            text=current_message
-                        )
-                        current_message = "📄 Continued...\n\n" + job + "\n\n"
-                    else:
-                        current_message += job + "\n\n"
-                
-                # Send the last message if it's not empty
-                if current_message:
-                    await self.application.bot.send_message(
-                        chat_id=user_id,
-                        text=current_message
-                    )
-            else:
-                # Send all jobs in one message
-                await self.application.bot.send_message(
-                    chat_id=user_id,
-                    text=message
-                )
-        except Exception as e:
-            logger.error(f"Error sending job listings to user {user_id}: {e}")
+        # Format all job listings and pack as many as fit into each message
+        formatted_jobs = [format_job_listing(job) for job in jobs]
+        for message in pack_messages(JOB_LISTINGS_HEADER, formatted_jobs):
+            self._enqueue_send(user_id, functools.partial(self._send_message, chat_id=user_id, text=message))
     
-    def _format_job_listing(self, job: JobListing) -> str:
-        """Format a job listing for display."""
-        return (
-            f"🏢 {job.company}\n"
-            f"💼 {job.title}\n"
-            f"📍 {job.location}\n"
-            f"💼 {job.job_type}\n"
-            f"🔗 {job.link}"
-        )
+    @property
+    def send_queue_full(self) -> bool:
+        """Whether SEND_QUEUE_SIZE sends are already waiting; callers should hold off new notifications."""
+        return self._pending_sends >= SEND_QUEUE_SIZE
+    
+    def _enqueue_send(self, chat_id: Optional[int], send: Callable[[], Awaitable]) -> None:
+        """Queue a send behind the chat's earlier messages.
+
+        Never drops: jobs in a notification are already recorded as sent, so the bound is
+        applied before claiming them, through send_queue_full.
+        """
+        queue = self._send_queues.get(chat_id)
+        if queue is None:
+            queue = self._send_queues[chat_id] = deque()
+        queue.append(send)
+        self._pending_sends += 1
+        if self._sending and chat_id not in self._send_tasks:
+            self._send_tasks[chat_id] = asyncio.create_task(self._drain_chat_queue(chat_id))
+    
+    def _start_send_workers(self) -> None:
+        """Start delivering queued sends, one sender task per chat with pending messages."""
+        self._sending = True
+        for chat_id in self._send_queues:
+            if chat_id not in self._send_tasks:
+                self._send_tasks[chat_id] = asyncio.create_task(self._drain_chat_queue(chat_id))
+    
+    async def _stop_send_workers(self) -> None:
+        """Stop sending once everything queued before the call has been delivered."""
+        if not self._sending:
+            return
+        self._sending = False
+        while self._send_tasks:
+            await asyncio.gather(*self._send_tasks.values())
+    
+    async def _drain_chat_queue(self, chat_id: Optional[int]) -> None:
+        """Deliver one chat's queued sends in order; concurrency across chats is bounded by the send semaphore."""
+        queue = self._send_queues[chat_id]
+        try:
+            while queue:
+                send = queue.popleft()
+                self._pending_sends -= 1
+                try:
+                    await send()
+                except Exception as e:
+                    logger.error("Error sending message to %s: %s", chat_id, e)
+        finally:
+            # Anything left over was abandoned by cancellation
+            self._pending_sends -= len(queue)
+            del self._send_queues[chat_id]
+            del self._send_tasks[chat_id]
 
     # Stream event handlers (preserved for system notifications)
     async def _handle_send_log(self, event: StreamEvent) -> None:
@@ -452,12 +736,12 @@ Say "help with [topic]" for specific guidance:
                         caption=message
                     )
             else:
-                await self.application.bot.send_message(
+                await self._send_message(
                     chat_id=ADMIN_USER_ID,
                     text=message
                 )
         except Exception as e:
-            logger.error(f"Failed to send log to admin: {e}")
+            logger.error("Failed to send log to admin: %s", e)
 
     async def _handle_send_message(self, event: StreamEvent):
         """Handle message sending requests from other components."""
@@ -478,16 +762,49 @@ Say "help with [topic]" for specific guidance:
                 # Check if message is too long and split if needed
                 await self._send_message_with_splitting(user_id, message)
         except Exception as e:
-            logger.error(f"Error sending message: {e}")
+            logger.error("Error sending message: %s", e)
     
     # Message utilities (preserved for response handling)
+    def _chat_bucket(self, chat_id: int) -> AsyncTokenBucket:
+        """Return the chat's send bucket, evicting the least recently used ones beyond CHAT_BUCKETS_LIMIT."""
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self._chat_buckets[chat_id] = AsyncTokenBucket(PER_CHAT_SEND_RATE, PER_CHAT_SEND_BURST)
+            while len(self._chat_buckets) > CHAT_BUCKETS_LIMIT:
+                self._chat_buckets.popitem(last=False)
+        else:
+            self._chat_buckets.move_to_end(chat_id)
+        return bucket
+
+    async def _send_message(self, chat_id: int, text: str, **kwargs) -> Message:
+        """Send a message within Telegram's rate limits, retrying transient failures with jittered backoff."""
+        for attempt in range(MAX_SEND_ATTEMPTS):
+            await self._chat_bucket(chat_id).acquire()
+            await self._global_bucket.acquire()
+            try:
+                async with self._send_semaphore:
+                    return await self.application.bot.send_message(chat_id=chat_id, text=text, **kwargs)
+            except RetryAfter as e:
+                if attempt == MAX_SEND_ATTEMPTS - 1:
+                    raise
+                logger.warning("Rate limited sending to %s, retrying in %ss", chat_id, e.retry_after)
+                await asyncio.sleep(e.retry_after + random.uniform(0, 0.5))
+            except BadRequest:
+                # A NetworkError subclass, but permanent: retrying cannot fix a rejected request
+                raise
+            except NetworkError as e:  # includes TimedOut
+                if attempt == MAX_SEND_ATTEMPTS - 1:
+                    raise
+                logger.warning("Network error sending to %s: %s, retrying", chat_id, e)
+                await asyncio.sleep(SEND_RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, SEND_RETRY_BASE_DELAY))
+
     async def _send_message_with_splitting(self, user_id: int, message: str):
         """Send a message with automatic splitting if it's too long."""
         try:
-            # Telegram's message length limit is 4096 characters
-            if len(message) <= 4096:
+            # Respect Telegram's message length limit
+            if utf16_len(message) <= MAX_MESSAGE_LENGTH:
                 # Send message as-is if it's within the limit
-                await self.application.bot.send_message(
+                await self._send_message(
                     chat_id=user_id,
                     text=message,
                     parse_mode=ParseMode.MARKDOWN
@@ -496,22 +813,23 @@ Say "help with [topic]" for specific guidance:
                 # Split the message into multiple parts
                 await self._send_long_message_in_parts(user_id, message)
         except Exception as e:
-            logger.error(f"Error sending message to user {user_id}: {e}")
+            logger.error("Error sending message to user %s: %s", user_id, e)
     
     async def _send_long_message_in_parts(self, user_id: int, message: str):
         """Split a long message into multiple parts and send them."""
-        lines = message.split('\n')
-        current_message = ""
+        parts: List[str] = []
+        size = 0  # Running length of the current part, so it is never re-joined just to be measured
         part_number = 1
         
-        for line in lines:
-            # Check if adding this line would exceed the limit
-            test_message = current_message + line + '\n'
+        for line in message.split('\n'):
+            line_size = utf16_len(line) + 1  # +1 for newline
             
-            if len(test_message) > 4096:
+            # Check if adding this line would exceed the limit
+            if size + line_size > MAX_MESSAGE_LENGTH:
                 # Send current message if it's not empty
+                current_message = "".join(parts)
                 if current_message.strip():
-                    await self.application.bot.send_message(
+                    await self._send_message(
                         chat_id=user_id,
                         text=current_message.rstrip(),
                         parse_mode=ParseMode.MARKDOWN
@@ -521,78 +839,39 @@ Say "help with [topic]" for specific guidance:
                 # Start new message with current line, add part indicator for subsequent parts
                 if part_number > 1:
                     header = f"📄 Part {part_number}:\n\n"
-                    current_message = header + line + '\n'
                     
                     # If even with header it's too long, truncate the line
-                    if len(current_message) > 4096:
-                        max_line_length = 4096 - len(header) - 1  # -1 for newline
-                        truncated_line = line[:max_line_length - 3] + "..."
-                        current_message = header + truncated_line + '\n'
+                    if utf16_len(header) + line_size > MAX_MESSAGE_LENGTH:
+                        max_line_length = MAX_MESSAGE_LENGTH - utf16_len(header) - 1  # -1 for newline
+                        line = utf16_truncate(line, max_line_length - 3) + "..."
+                    parts = [header, line, '\n']
                 else:
-                    current_message = line + '\n'
-                    
                     # If even a single line is too long, truncate it
-                    if len(current_message) > 4096:
-                        truncated_line = line[:4090] + "..."
-                        current_message = truncated_line + '\n'
+                    if line_size > MAX_MESSAGE_LENGTH:
+                        line = utf16_truncate(line, MAX_MESSAGE_LENGTH - 6) + "..."
+                    parts = [line, '\n']
+                size = sum(map(utf16_len, parts))
             else:
-                current_message = test_message
+                parts.append(line)
+                parts.append('\n')
+                size += line_size
         
         # Send the last part if it's not empty
+        current_message = "".join(parts)
         if current_message.strip():
-            await self.application.bot.send_message(
+            await self._send_message(
                 chat_id=user_id,
                 text=current_message.rstrip(),
                 parse_mode=ParseMode.MARKDOWN
             )
     
-    def _is_help_request(self, message: str) -> bool:
-        """Check if message is a help request for a specific operation."""
-        message_lower = message.lower()
-        help_patterns = [
-            "help with",
-            "how to",
-            "how do i",
-            "what is",
-            "explain",
-            "show me how to",
-            "guide me",
-            "instructions for"
-        ]
-        return any(pattern in message_lower for pattern in help_patterns)
+    def _is_help_request(self, message_lower: str) -> bool:
+        """Check if a lowercased message is a help request for a specific operation."""
+        return any(pattern in message_lower for pattern in HELP_REQUEST_PATTERNS)
     
-    def _extract_tool_name_from_help(self, message: str) -> Optional[str]:
-        """Extract tool name from a help request message."""
-        message_lower = message.lower()
-        
-        # Map common phrases to tool names
-        tool_mappings = {
-            "list": "list_job_searches",
-            "listing": "list_job_searches", 
-            "show": "list_job_searches",
-            "display": "list_job_searches",
-            "view": "list_job_searches",
-            "create": "create_job_search",
-            "creating": "create_job_search",
-            "add": "create_job_search",
-            "set up": "create_job_search",
-            "setup": "create_job_search",
-            "delete": "delete_job_search",
-            "deleting": "delete_job_search", 
-            "remove": "delete_job_search",
-            "cancel": "delete_job_search",
-            "details": "get_job_search_details",
-            "detail": "get_job_search_details",
-            "info": "get_job_search_details",
-            "information": "get_job_search_details",
-            "search": "one_time_search",
-            "searching": "one_time_search",
-            "find": "one_time_search",
-            "one time": "one_time_search",
-            "immediate": "one_time_search"
-        }
-        
-        for phrase, tool_name in tool_mappings.items():
+    def _extract_tool_name_from_help(self, message_lower: str) -> Optional[str]:
+        """Extract tool name from a lowercased help request message."""
+        for phrase, tool_name in HELP_TOOL_PHRASES.items():
             if phrase in message_lower:
                 return tool_name
         
@@ -602,40 +881,28 @@ Say "help with [topic]" for specific guidance:
         """Generate comprehensive welcoming start message using tool registry."""
         try:
             # Create a more welcoming and comprehensive onboarding message
-            base_message = f"👋 **Welcome {user_name}!** I'm your AI-powered job search assistant.\n\n"
-            
-            # Explain AI capabilities clearly
-            base_message += "🤖 **What makes me special:**\n" \
-                           "• I understand **natural language** - just talk to me like a person!\n" \
-                           "• I'll guide you through each step and ask for confirmation\n" \
-                           "• I remember our conversation and provide contextual help\n" \
-                           "• No need to learn complex commands - I speak human! 😊\n\n"
+            parts = [f"👋 **Welcome {user_name}!** I'm your AI-powered job search assistant.\n\n", START_CAPABILITIES]
             
             # Get capabilities from tools with better formatting
-            if hasattr(self.llm_agent, 'tool_registry') and self.llm_agent.tool_registry:
-                base_message += "🎯 **What I can help you with:**\n"
+            if self.llm_agent.tool_registry:
+                parts.append("🎯 **What I can help you with:**\n")
                 tools_summary = self._get_tools_summary()
                 if tools_summary:
-                    base_message += tools_summary
+                    parts.append(tools_summary)
                 
                 # Add conversation examples with more context
                 examples = self._get_tool_examples()
                 if examples:
-                    base_message += f"\n\n💬 **Try saying things like:**\n{examples}\n"
+                    parts.append(f"\n\n💬 **Try saying things like:**\n{examples}\n")
             
             # Add onboarding tips and next steps
-            base_message += "\n\n✨ **Getting Started Tips:**\n" \
-                           "• Ask me questions naturally: \"Can you show me my searches?\"\n" \
-                           "• I'll ask for any missing information I need\n" \
-                           "• Say \"help with [topic]\" for detailed guidance\n" \
-                           "• I'll always confirm before making changes\n\n" \
-                           "📚 Use /help anytime for detailed information.\n\n" \
-                           "**Ready to get started?** What would you like to do with job searching today?"
+            parts.append(START_GETTING_STARTED)
             
+            base_message = "".join(parts)
             return base_message
             
         except Exception as e:
-            logger.error(f"Error generating start message: {e}")
+            logger.error("Error generating start message: %s", e)
             # Enhanced fallback with onboarding context
             return f"👋 Welcome {user_name}! I'm your AI-powered job search assistant.\n\n" \
                    "🤖 **I understand natural language** - just talk to me normally!\n\n" \
@@ -646,8 +913,10 @@ Say "help with [topic]" for specific guidance:
     def _get_tools_summary(self) -> str:
         """Get a brief summary of all tool capabilities."""
         try:
-            if not hasattr(self.llm_agent, 'tool_registry') or not self.llm_agent.tool_registry:
+            if not self.llm_agent.tool_registry:
                 return ""
+            if self._tools_summary is not None:
+                return self._tools_summary
             
             summaries = []
             for tool_name, tool in self.llm_agent.tool_registry.tools.items():
@@ -659,17 +928,20 @@ Say "help with [topic]" for specific guidance:
                         purpose = f"• {purpose}"
                     summaries.append(purpose)
             
-            return "\n".join(summaries) if summaries else ""
+            self._tools_summary = "\n".join(summaries) if summaries else ""
+            return self._tools_summary
             
         except Exception as e:
-            logger.error(f"Error getting tools summary: {e}")
+            logger.error("Error getting tools summary: %s", e)
             return ""
 
     def _get_tool_examples(self) -> str:
         """Get examples from all tools."""
         try:
-            if not hasattr(self.llm_agent, 'tool_registry') or not self.llm_agent.tool_registry:
+            if not self.llm_agent.tool_registry:
                 return ""
+            if self._tool_examples is not None:
+                return self._tool_examples
             
             all_examples = []
             for tool_name, tool in self.llm_agent.tool_registry.tools.items():
@@ -679,10 +951,11 @@ Say "help with [topic]" for specific guidance:
                     for example in doc.examples[:2]:
                         all_examples.append(f"- \"{example}\"")
             
-            return "\n".join(all_examples) if all_examples else ""
+            self._tool_examples = "\n".join(all_examples) if all_examples else ""
+            return self._tool_examples
             
         except Exception as e:
-            logger.error(f"Error getting tool examples: {e}")
+            logger.error("Error getting tool examples: %s", e)
             return ""
 
     def _generate_enhanced_fallback_help(self) -> str:
@@ -735,7 +1008,7 @@ Use /help for more detailed assistance."""
     def _get_command_examples(self) -> str:
         """Get examples for unknown command responses."""
         try:
-            if hasattr(self.llm_agent, 'tool_registry') and self.llm_agent.tool_registry:
+            if self.llm_agent.tool_registry:
                 examples = self._get_tool_examples()
                 if examples:
                     return f"**For example:**\n{examples}"
@@ -747,7 +1020,7 @@ Use /help for more detailed assistance."""
 - "Find jobs for me now\""""
             
         except Exception as e:
-            logger.error(f"Error getting command examples: {e}")
+            logger.error("Error getting command examples: %s", e)
             return """**For example:**
 - "Show me my searches"
 - "Create a new job alert"
@@ -6,7 +6,6 @@ import os
 from typing import Dict, List, Optional
 from telegram import Update, Message
 from telegram.ext import (
-    Application,
     CommandHandler,
     ContextTypes,
     MessageHandler,
@@ -19,6 +18,7 @@ import asyncio
 from shared.data import (
     JobListing, StreamType, StreamEvent, StreamManager
 )
+from main_project.app.bot.application import build_application
 from main_project.app.core.job_search_manager import JobSearchManager
 from main_project.app.llm.job_search_agent import JobSearchAgent
 
@@ -29,6 +29,9 @@ try:
 except (TypeError, ValueError):
     raise RuntimeError("ADMIN_USER_ID environment variable must be set and be an integer.")
 
+# Long-poll getUpdates for up to 20s so an idle bot makes far fewer requests
+POLLING_TIMEOUT = 20
+
 class TelegramBot:
     """Telegram bot for managing job searches with LLM agent."""
     
@@ -37,7 +40,7 @@ class TelegramBot:
         self.token = token
         self.stream_manager = stream_manager
         self.job_search_manager = job_search_manager
-        self.application = Application.builder().token(token).build()
+        self.application = build_application(token)
         
         # Initialize LLM agent
         self.llm_agent = JobSearchAgent(job_search_manager)
@@ -198,7 +201,7 @@ I'm your natural language job search assistant! Just talk to me like you would t
     # Bot lifecycle methods
     def run(self):
         """Run the bot."""
-        self.application.run_polling()
+        self.application.run_polling(timeout=POLLING_TIMEOUT, allowed_updates=Update.ALL_TYPES)
     
     async def initialize(self) -> None:
         """Initialize the bot."""
@@ -207,7 +210,7 @@ I'm your natural language job search assistant! Just talk to me like you would t
             await self.application.start()
             # Initialize LLM agent in background (don't wait for it)
             asyncio.create_task(self._initialize_llm_agent())
-            await self.application.updater.start_polling()
+            await self.application.updater.start_polling(timeout=POLLING_TIMEOUT, allowed_updates=Update.ALL_TYPES)
             logger.info("Telegram bot started successfully")
         except Exception as e:
             logger.error(f"Failed to start Telegram bot: {e}")
@@ -242,39 +245,28 @@ I'm your natural language job search assistant! Just talk to me like you would t
         # Format all job listings
         formatted_jobs = [self._format_job_listing(job) for job in jobs]
         
-        # Try to send all jobs in one message
-        message = "🔔 New job listings found!\n\n" + "\n\n".join(formatted_jobs)
+        header = "🔔 New job listings found!\n\n"
         
         try:
-            # Check if message is too long
-            if len(message) > 4096:  # Telegram's message length limit
-                # Split into multiple messages
-                current_message = "🔔 New job listings found!\n\n"
-                
-                for job in formatted_jobs:
-                    # Check if adding this job would exceed the limit
-                    if len(current_message) + len(job) + 3 > 4096:  # +3 for "\n\n"
-                        # Send current message and start a new one
-                        await self.application.bot.send_message(
-                            chat_id=user_id,
-                            text=current_message
-                        )
-                        current_message = "📄 Continued...\n\n" + job + "\n\n"
-                    else:
-                        current_message += job + "\n\n"
-                
-                # Send the last message if it's not empty
-                if current_message:
+            # Pack jobs into messages under Telegram's 4096 character limit
+            parts = [header]
+            size = len(header)
+            for job in formatted_jobs:
+                if size + len(job) + 2 > 4096 and len(parts) > 1:
                     await self.application.bot.send_message(
                         chat_id=user_id,
-                        text=current_message
+                        text="".join(parts)
                     )
-            else:
-                # Send all jobs in one message
-                await self.application.bot.send_message(
-                    chat_id=user_id,
-                    text=message
-                )
+                    parts = ["📄 Continued...\n\n"]
+                    size = len(parts[0])
+                parts.append(job)
+                parts.append("\n\n")
+                size += len(job) + 2
+            
+            await self.application.bot.send_message(
+                chat_id=user_id,
+                text="".join(parts)
+            )
         except Exception as e:
             logger.error(f"Error sending job listings to user {user_id}: {e}")
     
@@ -3,6 +3,7 @@ Simple configuration management for Jobs Alerts.
 """
 import os
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -28,12 +29,23 @@ class Config:
         else:
             logger.info("Loaded TELEGRAM_BOT_TOKEN")
         
+        # Bot API endpoints; point these at a colocated telegram-bot-api server to cut RTT
+        self.telegram_api_base_url = os.getenv('TG_API_BASE_URL', 'https://api.telegram.org/bot')
+        self.telegram_file_base_url = os.getenv('TG_FILE_BASE_URL', 'https://api.telegram.org/file/bot')
+        
         # MongoDB settings
         self.mongo_uri = os.getenv('MONGO_URL')
         if not self.mongo_uri:
             logger.error('MONGO_URL not found in environment variables')
             raise RuntimeError('MONGO_URL not set in environment')
         
+        # Scraper results are posted back to this endpoint
+        callback_base_url = os.getenv('CALLBACK_URL')
+        if not callback_base_url:
+            logger.error('CALLBACK_URL not found in environment variables')
+            raise RuntimeError('CALLBACK_URL not set in environment')
+        self.job_results_callback_url = callback_base_url.rstrip('/') + '/job_results_callback'
+        
         # DeepSeek API settings for LLM integration
         self.deepseek_api_key = os.getenv('DEEPSEEK_API_KEY')
         if not self.deepseek_api_key:
@@ -59,10 +71,19 @@ class Config:
     
     def _log_config(self):
         """Log the current configuration, masking sensitive values."""
-        logger.info("Current configuration:")
-        logger.info(f"  - Telegram Bot Token: {'***' if self.telegram_bot_token else 'NOT SET'}")
-        logger.info(f"  - MongoDB URI: {'***' if self.mongo_uri else 'NOT SET'}")
-        logger.info(f"  - DeepSeek API Key: {'***' if self.deepseek_api_key else 'NOT SET'}")
+        logger.info(
+            "Current configuration:\n"
+            "  - Telegram Bot Token: %s\n"
+            "  - Telegram API Base URL: %s\n"
+            "  - MongoDB URI: %s\n"
+            "  - DeepSeek API Key: %s",
+            '***' if self.telegram_bot_token else 'NOT SET',
+            self.telegram_api_base_url,
+            '***' if self.mongo_uri else 'NOT SET',
+            '***' if self.deepseek_api_key else 'NOT SET',
+        )
 
-# Create a singleton instance
-config = Config() 
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the shared configuration, loading it on first use."""
+    return Config()
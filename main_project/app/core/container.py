@@ -1,11 +1,13 @@
 """
 Dependency injection container for the application.
 """
+import asyncio
 import logging
-from typing import Optional
+from functools import cached_property
+from typing import Awaitable, Optional, Set
 
 from main_project.app.bot.telegram_bot import TelegramBot
-from main_project.app.core.config import Config
+from main_project.app.core.config import Config, get_config
 from main_project.app.core.mongo_connection import MongoConnection
 from main_project.app.schedulers.job_search_scheduler import JobSearchScheduler
 from main_project.app.core.job_search_manager import JobSearchManager
@@ -16,91 +18,98 @@ from main_project.app.core.stores.sent_jobs_store import SentJobsStore
 logger = logging.getLogger(__name__)
 
 class Container:
-    """Dependency injection container."""
+    """Dependency injection container.
     
-    def __init__(self):
-        """Initialize the container."""
-        self._config: Optional[Config] = None
-        self._mongo_connection: Optional[MongoConnection] = None
-        self._job_search_store: Optional[JobSearchStore] = None
-        self._sent_jobs_store: Optional[SentJobsStore] = None
-        self._job_search_manager: Optional[JobSearchManager] = None
-        self._telegram_bot: Optional['TelegramBot'] = None
-        self._scheduler: Optional[JobSearchScheduler] = None
-        self._stream_manager: Optional[StreamManager] = None
+    Services are built on first access and then stored on the instance, so later
+    lookups are plain attribute reads.
+    """
     
-    @property
-    def config(self) -> Config:
-        """Get the configuration instance."""
-        if not self._config:
-            self._config = Config()
-        return self._config
+    def __init__(self):
+        """Initialize the container with the cheap services every startup needs."""
+        self.config: Config = get_config()
+        self.stream_manager = StreamManager()
+        # Services whose startup completed and that must be stopped on shutdown
+        self._started: Set[str] = set()
     
-    @property
+    @cached_property
     def mongo_connection(self) -> MongoConnection:
-        if not self._mongo_connection:
-            self._mongo_connection = MongoConnection()
-        return self._mongo_connection
+        return MongoConnection()
     
-    @property
+    @cached_property
     def job_search_store(self) -> JobSearchStore:
-        if not self._job_search_store:
-            self._job_search_store = JobSearchStore(self.mongo_connection)
-        return self._job_search_store
+        return JobSearchStore(self.mongo_connection)
     
-    @property
+    @cached_property
     def sent_jobs_store(self) -> SentJobsStore:
-        if not self._sent_jobs_store:
-            self._sent_jobs_store = SentJobsStore(self.mongo_connection)
-        return self._sent_jobs_store
+        return SentJobsStore(self.mongo_connection)
     
-    @property
+    @cached_property
     def job_search_manager(self) -> JobSearchManager:
         """Get the job search manager instance."""
-        if not self._job_search_manager:
-            self._job_search_manager = JobSearchManager(job_search_store=self.job_search_store, job_search_scheduler=self.scheduler)
-        return self._job_search_manager
+        return JobSearchManager(job_search_store=self.job_search_store, job_search_scheduler=self.scheduler)
     
-    @property
+    @cached_property
     def telegram_bot(self) -> 'TelegramBot':
         """Get the Telegram bot instance."""
-        if not self._telegram_bot:
-            token = self.config.telegram_bot_token
-            if not token:
-                raise ValueError("TELEGRAM_BOT_TOKEN not set in configuration")
-            self._telegram_bot = TelegramBot(
-                token=token,
-                stream_manager=self.stream_manager,
-                job_search_manager=self.job_search_manager
-            )
-        return self._telegram_bot
-    
-    @property
-    def stream_manager(self) -> StreamManager:
-        if self._stream_manager is None:
-            self._stream_manager = StreamManager()
-        return self._stream_manager
+        token = self.config.telegram_bot_token
+        if not token:
+            raise ValueError("TELEGRAM_BOT_TOKEN not set in configuration")
+        return TelegramBot(
+            token=token,
+            stream_manager=self.stream_manager,
+            job_search_manager=self.job_search_manager,
+            base_url=self.config.telegram_api_base_url,
+            base_file_url=self.config.telegram_file_base_url
+        )
     
-    @property
+    @cached_property
     def scheduler(self) -> JobSearchScheduler:
         """Get the job search scheduler instance."""
-        if not self._scheduler:
-            self._scheduler = JobSearchScheduler(
-                sent_jobs_store=self.sent_jobs_store,
-                stream_manager=self.stream_manager
-            )
-        return self._scheduler
+        return JobSearchScheduler(
+            sent_jobs_store=self.sent_jobs_store,
+            stream_manager=self.stream_manager
+        )
     
-
+    async def _start(self, name: str, start: Awaitable) -> None:
+        """Await a service's startup and remember that it needs stopping."""
+        await start
+        self._started.add(name)
+    
+    async def _stop(self, name: str, method: str) -> None:
+        """Stop a started service, logging failures so the other services still shut down."""
+        if name not in self._started:
+            return
+        self._started.discard(name)
+        try:
+            await getattr(self.__dict__[name], method)()
+        except Exception as e:
+            logger.error("Error stopping %s: %s", name, e)
+    
+    async def _initialize_storage(self) -> None:
+        """Connect to MongoDB, then prepare both stores on the shared connection."""
+        await self._start('mongo_connection', self.mongo_connection.connect())
+        await asyncio.gather(
+            self.job_search_store.connect(),
+            self._start('sent_jobs_store', self.sent_jobs_store.connect()),
+        )
     
     async def initialize(self) -> None:
         """Initialize all services."""
         try:
-            await self.mongo_connection.connect()
-            await self.job_search_store.connect()
-            await self.sent_jobs_store.connect()
-            await self.telegram_bot.initialize()
-            await self.scheduler.initialize()
+            # The MongoDB handshake and the bot's Telegram handshake don't depend on each other.
+            # Both are awaited before any error is raised, so a connected bot is always stopped by shutdown()
+            results = await asyncio.gather(
+                self._initialize_storage(),
+                self._start('telegram_bot', self.telegram_bot.connect()),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            # Handlers read the stores, so updates are only received once storage is ready
+            await self.telegram_bot.start_polling()
+            await self._start('scheduler', self.scheduler.initialize())
+            # Loading searches schedules them, so the scheduler and the bot must be running first
             await self.job_search_manager.initialize()
             logger.info("All services initialized successfully")
         except Exception as e:
@@ -109,17 +118,15 @@ class Container:
     
     async def shutdown(self) -> None:
         """Shutdown all services."""
-        try:
-            if self._scheduler and hasattr(self._scheduler, '_running'):
-                await self._scheduler.stop()
-            if self._telegram_bot and hasattr(self._telegram_bot, 'application'):
-                await self._telegram_bot.stop()
-            if self._mongo_connection and hasattr(self._mongo_connection, 'client'):
-                await self._mongo_connection.close()
-            logger.info("All services shut down successfully")
-        except Exception as e:
-            logger.error(f"Error shutting down services: {e}")
-            raise
+        # Each of these drains only its own work, so they can stop together
+        await asyncio.gather(
+            self._stop('scheduler', 'stop'),
+            self._stop('telegram_bot', 'stop'),
+            self._stop('sent_jobs_store', 'close'),
+        )
+        # The sent-jobs writer flushes into MongoDB, so the connection closes last
+        await self._stop('mongo_connection', 'close')
+        logger.info("All services shut down")
 
 # Global container instance
 container: Optional[Container] = None
@@ -129,4 +136,4 @@ def get_container() -> Container:
     global container
     if container is None:
         container = Container()
-    return container 
\ No newline at end of file
+    return container
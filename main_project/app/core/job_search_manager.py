@@ -2,10 +2,10 @@
 Job search manager for handling user job searches.
 """
 import logging
-import os
 from typing import Dict, List, Optional
 import uuid
 from shared.data import JobSearchOut, JobSearchIn, JobSearchRemove, JobType, RemoteType, StreamManager, TimePeriod, StreamType, StreamEvent, SearchJobsParams, get_time_period_for_one_time_search
+from main_project.app.core.config import get_config
 from main_project.app.core.stores.job_search_store import JobSearchStore
 import asyncio
 
@@ -28,11 +28,13 @@ class JobSearchManager:
         """Initialize job searches from MongoDB."""
         try:
             searches = await self._job_search_store.get_all_searches()
+            # Build a fresh mapping and swap it in at once: users looked up before
+            # initialize() already have their searches cached and must not get them twice
+            job_searches: Dict[int, List[JobSearchOut]] = {}
             for search in searches:
-                if search.user_id not in self.job_searches:
-                    self.job_searches[search.user_id] = []
-                self.job_searches[search.user_id].append(search)
+                job_searches.setdefault(search.user_id, []).append(search)
                 logger.info(f"Loaded job search from MongoDB: {search.to_log_string()}")
+            self.job_searches = job_searches
 
             # Send initial job searches to scheduler directly
             await self._job_search_scheduler.add_initial_job_searches(searches)
@@ -59,13 +61,15 @@ class JobSearchManager:
                 filter_text=search_in.filter_text,
             )
             logger.info(f"Added new job search from user: {search.to_log_string()}")
+            # Load the user's existing searches first, so the cache never holds only the new one
+            await self.get_user_searches(search.user_id)
             # Save to MongoDB first
             await self._job_search_store.save_job_search(search)
             
-            # Update in-memory cache
-            if search.user_id not in self.job_searches:
-                self.job_searches[search.user_id] = []
-            self.job_searches[search.user_id].append(search)
+            # Update in-memory cache; a reload during the save may already include the search
+            searches = self.job_searches.setdefault(search.user_id, [])
+            if all(s.id != search.id for s in searches):
+                searches.append(search)
             
             # Add to scheduler directly
             await self._job_search_scheduler.add_job_search(search)
@@ -85,9 +89,6 @@ class JobSearchManager:
         try:
             logger.info(f"Executing one-time search for user {user_id}: {job_search.job_title} in {job_search.location}")
 
-            base_url = os.getenv("CALLBACK_URL")
-            callback_url = base_url.rstrip("/") + "/job_results_callback"
-            
             params = SearchJobsParams(
                 keywords=job_search.job_title,
                 location=job_search.location,
@@ -95,7 +96,7 @@ class JobSearchManager:
                 remote_types=[rt.label for rt in job_search.remote_types],
                 time_period=get_time_period_for_one_time_search(),  
                 filter_text=getattr(job_search, 'filter_text', None),
-                callback_url=callback_url,
+                callback_url=get_config().job_results_callback_url,
                 job_search_id=None,
                 user_id=job_search.user_id,
             )
@@ -134,11 +135,25 @@ class JobSearchManager:
             return False
     
     async def get_user_searches(self, user_id: int) -> List[JobSearchOut]:
-        """Get all job searches for a user."""
-        searches = await self._job_search_store.get_user_searches(user_id)
-        for search in searches:
-            logger.info(f"Loaded job search from MongoDB: {search.to_log_string()}")
-        return searches
+        """Get all job searches for a user.
+        
+        Served from the in-memory cache, which add_search and delete_search keep current;
+        MongoDB is only queried for users the cache has not seen yet.
+        """
+        searches = self.job_searches.get(user_id)
+        if searches is None:
+            loaded = await self._job_search_store.get_user_searches(user_id)
+            # Keep a list filled while this load was awaited, e.g. one add_search appended to
+            searches = self.job_searches.setdefault(user_id, loaded)
+            logger.debug("Loaded %d job searches for user %s", len(loaded), user_id)
+        return list(searches)
+    
+    async def get_user_search(self, user_id: int, search_id: str) -> Optional[JobSearchOut]:
+        """Get one of a user's job searches by ID, or None if the user has no such search."""
+        for search in await self.get_user_searches(user_id):
+            if search.id == search_id:
+                return search
+        return None
     
     async def get_active_job_searches(self) -> List[JobSearchOut]:
         """Get all job searches."""
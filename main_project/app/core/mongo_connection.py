@@ -8,6 +8,11 @@ from pymongo.errors import ServerSelectionTimeoutError
 
 logger = logging.getLogger(__name__)
 
+# One client serves the whole app; keep a few warm connections so bursts of store calls skip the handshake
+MONGO_MAX_POOL_SIZE = 50
+MONGO_MIN_POOL_SIZE = 5
+MONGO_MAX_IDLE_TIME_MS = 60000
+
 class MongoConnection:
     def __init__(self):
         self.client = None
@@ -28,7 +33,12 @@ class MongoConnection:
                 else:
                     mongo_url = mongo_url.replace("mongodb://", f"mongodb://{mongo_user}:{mongo_password}@")
 
-            self.client = AsyncIOMotorClient(mongo_url)
+            self.client = AsyncIOMotorClient(
+                mongo_url,
+                maxPoolSize=MONGO_MAX_POOL_SIZE,
+                minPoolSize=MONGO_MIN_POOL_SIZE,
+                maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+            )
             self.db = self.client[mongo_db]
             await self.client.admin.command('ping')
             self._connected = True
@@ -1,8 +1,10 @@
 """
 Sent jobs MongoDB store methods.
 """
-from typing import List
-from pymongo.errors import ServerSelectionTimeoutError
+import asyncio
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from pymongo.errors import BulkWriteError, ServerSelectionTimeoutError
 from shared.data import SentJobOut
 from main_project.app.core.mongo_connection import MongoConnection
 from datetime import datetime, timezone
@@ -10,22 +12,156 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# How many recently claimed (user_id, job_url) pairs to remember for deduplication
+RECENTLY_CLAIMED_LIMIT = 10000
+# Write attempts per flush before the jobs are held back for the next flush
+SAVE_ATTEMPTS = 3
+SAVE_RETRY_BASE_DELAY = 1.0
+# Most sent jobs held back after failed writes; beyond this the oldest are dropped
+UNSAVED_LIMIT = 10000
+# Seconds the writer waits for new jobs before retrying held-back ones on its own
+UNSAVED_RETRY_INTERVAL = 30.0
+# MongoDB duplicate key error, raised for documents an earlier attempt already inserted
+DUPLICATE_KEY_ERROR = 11000
+
 class SentJobsStore:
     def __init__(self, mongo_connection: MongoConnection):
         self.mongo_connection = mongo_connection
         self.collection = None
+        # Write-behind buffer: jobs recorded as sent but not yet persisted
+        self._pending: Dict[int, Dict[str, SentJobOut]] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._closed = False
+        # Documents whose write failed, retried with the next flush
+        self._unsaved: List[dict] = []
+        # Jobs claimed by recent callbacks, so overlapping searches don't send them twice
+        self._recently_claimed: "OrderedDict[Tuple[int, str], None]" = OrderedDict()
 
     async def connect(self):
         self.collection = self.mongo_connection.db.sent_jobs
         # Ensure user_id is indexed (non-unique)
         await self.collection.create_index("user_id", unique=False)
+        self._queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._writer())
 
-    async def save_sent_job(self, user_id: int, job_url: str) -> None:
-        if not self.mongo_connection._connected:
-            raise ServerSelectionTimeoutError("Not connected to MongoDB")
-        sent_job = SentJobOut(user_id=user_id, job_url=job_url, sent_at=datetime.now(timezone.utc))
-        await self.collection.insert_one(sent_job.__dict__)
-        logger.info(f"Saved sent job for user {user_id}: {job_url}")
+    async def close(self):
+        """Stop the background writer once everything buffered is persisted.
+
+        Jobs can no longer be recorded afterwards.
+        """
+        self._closed = True
+        if self._writer_task:
+            self._queue.put_nowait(None)
+            await self._writer_task
+            self._writer_task = None
+        if self._unsaved:
+            logger.error(f"Closing with {len(self._unsaved)} sent jobs that could not be saved")
+
+    def enqueue_sent_jobs(self, user_id: int, job_urls: List[str]) -> None:
+        """Record jobs as sent right away; they are persisted in the background."""
+        if self._closed:
+            raise RuntimeError("SentJobsStore is closed")
+        sent_at = datetime.now(timezone.utc)
+        pending = self._pending.setdefault(user_id, {})
+        for job_url in job_urls:
+            sent_job = SentJobOut(user_id=user_id, job_url=job_url, sent_at=sent_at)
+            pending[job_url] = sent_job
+            self._queue.put_nowait(sent_job)
+
+    def claim_unsent_jobs(self, user_id: int, job_urls: List[str]) -> List[str]:
+        """Return the job URLs not already claimed for this user and record them as sent.
+
+        Runs without awaiting, so concurrent callbacks for the same user can't both
+        claim a job between their sent-jobs lookup and the write. Nothing is claimed
+        once the store is closed, since the claim could no longer be persisted.
+        """
+        if self._closed:
+            logger.warning("Sent jobs store is closed, not claiming %d jobs for user %s", len(job_urls), user_id)
+            return []
+        claimed = []
+        for job_url in job_urls:
+            key = (user_id, job_url)
+            if key in self._recently_claimed:
+                continue
+            self._recently_claimed[key] = None
+            claimed.append(job_url)
+        while len(self._recently_claimed) > RECENTLY_CLAIMED_LIMIT:
+            self._recently_claimed.popitem(last=False)
+        if claimed:
+            self.enqueue_sent_jobs(user_id, claimed)
+        return claimed
+
+    def _drain(self) -> List[SentJobOut]:
+        batch = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _writer(self):
+        stopping = False
+        while not stopping:
+            if self._unsaved:
+                # Retry held-back jobs even if no further jobs are recorded
+                try:
+                    batch = [await asyncio.wait_for(self._queue.get(), UNSAVED_RETRY_INTERVAL)]
+                except asyncio.TimeoutError:
+                    await self._flush([])
+                    continue
+            else:
+                batch = [await self._queue.get()]
+            batch.extend(self._drain())
+            # None is the shutdown sentinel queued by close()
+            stopping = batch[-1] is None
+            batch = [job for job in batch if job is not None]
+            if batch or self._unsaved:
+                await self._flush(batch)
+
+    async def _flush(self, batch: List[SentJobOut]) -> None:
+        documents = self._unsaved + [job.model_dump() for job in batch]
+        self._unsaved = []
+        if await self._insert(documents):
+            logger.info(f"Saved {len(documents)} sent jobs")
+            self._forget_pending(documents)
+            return
+        # Keep them pending so lookups still see them, and retry with the next flush
+        if len(documents) > UNSAVED_LIMIT:
+            dropped = documents[:-UNSAVED_LIMIT]
+            logger.error(f"Dropping {len(dropped)} sent jobs that could not be saved")
+            self._forget_pending(dropped)
+            documents = documents[-UNSAVED_LIMIT:]
+        self._unsaved = documents
+
+    async def _insert(self, documents: List[dict]) -> bool:
+        """Insert documents with bounded retries; returns whether all of them are stored."""
+        for attempt in range(SAVE_ATTEMPTS):
+            try:
+                await self.collection.insert_many(documents, ordered=False)
+                return True
+            except BulkWriteError as e:
+                # insert_many assigned each document an _id, so a retry only collides with what is already stored
+                details = e.details or {}
+                write_errors = details.get("writeErrors", [])
+                if not details.get("writeConcernErrors") and all(
+                    error.get("code") == DUPLICATE_KEY_ERROR for error in write_errors
+                ):
+                    return True
+                error = e
+            except Exception as e:
+                error = e
+            logger.warning(f"Failed to save {len(documents)} sent jobs (attempt {attempt + 1}/{SAVE_ATTEMPTS}): {error}")
+            if attempt < SAVE_ATTEMPTS - 1:
+                await asyncio.sleep(SAVE_RETRY_BASE_DELAY * 2 ** attempt)
+        logger.error(f"Could not save {len(documents)} sent jobs, keeping them for the next flush")
+        return False
+
+    def _forget_pending(self, documents: List[dict]) -> None:
+        for document in documents:
+            pending = self._pending.get(document["user_id"])
+            if pending is not None:
+                pending.pop(document["job_url"], None)
+                if not pending:
+                    del self._pending[document["user_id"]]
 
     async def get_sent_jobs_for_user(self, user_id: int) -> List[SentJobOut]:
         if not self.mongo_connection._connected:
@@ -35,6 +171,8 @@ class SentJobsStore:
         async for doc in cursor:
             doc.pop('_id', None)
             jobs.append(SentJobOut(**doc))
+        # Include jobs the background writer has not persisted yet
+        jobs.extend(self._pending.get(user_id, {}).values())
         return jobs
 
     async def was_job_sent(self, user_id: int, job_url: str) -> bool:
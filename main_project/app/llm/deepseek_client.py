@@ -8,7 +8,7 @@ from langchain_openai import ChatOpenAI
 from langchain.schema import HumanMessage, SystemMessage, AIMessage
 from langchain.callbacks.base import BaseCallbackHandler
 
-from main_project.app.core.config import config
+from main_project.app.core.config import get_config
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +40,7 @@ class ChatDeepSeekClient:
             temperature: Sampling temperature (0.0 to 1.0) - Lower for faster responses
             max_tokens: Maximum tokens in response
         """
-        self.api_key = api_key or config.deepseek_api_key
+        self.api_key = api_key or get_config().deepseek_api_key
         if not self.api_key:
             raise ValueError("DeepSeek API key is required. Set DEEPSEEK_API_KEY environment variable.")
         
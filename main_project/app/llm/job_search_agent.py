@@ -270,7 +270,7 @@ Please try again, or contact support if the problem persists. You can also use t
     
     def _is_off_topic_request(self, message: str) -> bool:
         """Check if a message is clearly off-topic and should be blocked."""
-        message_lower = message.lower().strip()
+        message_lower = message.casefold().strip()
         
         # Keywords that indicate off-topic requests (be more specific to avoid false positives)
         off_topic_keywords = [
@@ -351,10 +351,9 @@ Please try again, or contact support if the problem persists. You can also use t
 I can only help with job search management. Please try again once the system is fully initialized."""
 
         # Generate capabilities from tool registry
-        capabilities_text = ""
-        for tool_name, tool in self.tool_registry.tools.items():
-            doc = tool.tool_documentation
-            capabilities_text += f"• {doc.description}\n"
+        capabilities_text = "".join(
+            f"• {tool.tool_documentation.description}\n" for tool in self.tool_registry.tools.values()
+        )
         
         return f"""🎯 **I'm a specialized job search assistant**
 
@@ -431,32 +430,33 @@ I can only help with creating, managing, and finding job search alerts.
         if not self.tool_registry:
             return "Tool registry not initialized. Please try again."
         
-        help_text = """🤖 **Natural Language Job Search Assistant**
+        parts = ["""🤖 **Natural Language Job Search Assistant**
 
 I can help you manage your job searches using natural language! Just talk to me like you would talk to a person.
 
 **What I can help you with:**
 
-"""
+"""]
+        append = parts.append
         
         # Generate examples from tool registry
         for tool_name, tool in self.tool_registry.tools.items():
             doc = tool.tool_documentation
-            help_text += f"🔹 **{doc.name}**\n"
+            append(f"🔹 **{doc.name}**\n")
             
             # Add up to 3 examples from the tool documentation
             examples_to_show = doc.examples[:3] if len(doc.examples) >= 3 else doc.examples
             for example in examples_to_show:
-                help_text += f"   • \"{example}\"\n"
-            help_text += "\n"
+                append(f"   • \"{example}\"\n")
+            append("\n")
         
-        help_text += """**I understand natural language**, so you don't need to use specific commands. Just tell me what you want to do!
+        append("""**I understand natural language**, so you don't need to use specific commands. Just tell me what you want to do!
 
 **Note:** I'll always ask for confirmation before creating, updating, or deleting anything to make sure I understand correctly.
 
-**🌟 Special Feature:** Use our unique AI-powered smart filter to describe what you DON'T want in job results using natural language (e.g., "No entry level positions", "Exclude travel requirements")."""
+**🌟 Special Feature:** Use our unique AI-powered smart filter to describe what you DON'T want in job results using natural language (e.g., "No entry level positions", "Exclude travel requirements").""")
         
-        return help_text
+        return "".join(parts)
     
     async def get_status(self) -> Dict[str, Any]:
         """Get agent status information.
@@ -88,51 +88,55 @@ class DocumentedTool(ABC):
         """Get comprehensive usage help for this tool."""
         doc = self.tool_documentation
         
-        help_text = f"🛠️ **{doc.name}**\n"
-        help_text += f"{doc.purpose}\n\n"
-        help_text += f"📝 **Description:** {doc.description}\n\n"
+        parts = [
+            f"🛠️ **{doc.name}**\n",
+            f"{doc.purpose}\n\n",
+            f"📝 **Description:** {doc.description}\n\n",
+        ]
+        append = parts.append
         
         if doc.confirmation_required:
-            help_text += "⚠️ **Note:** This operation requires confirmation before execution.\n\n"
+            append("⚠️ **Note:** This operation requires confirmation before execution.\n\n")
         
         # Required parameters
         required_params = self.get_required_parameters()
         if required_params:
-            help_text += "📋 **Required Parameters:**\n"
+            append("📋 **Required Parameters:**\n")
             for param in required_params:
-                help_text += f"• {self.format_parameter_help(param)}\n\n"
+                append(f"• {self.format_parameter_help(param)}\n\n")
         
         # Optional parameters
         optional_params = self.get_optional_parameters()
         if optional_params:
-            help_text += "🔧 **Optional Parameters:**\n"
+            append("🔧 **Optional Parameters:**\n")
             for param in optional_params:
-                help_text += f"• {self.format_parameter_help(param)}\n\n"
+                append(f"• {self.format_parameter_help(param)}\n\n")
         
         # Examples
         if doc.examples:
-            help_text += "💬 **Example Usage:**\n"
+            append("💬 **Example Usage:**\n")
             for i, example in enumerate(doc.examples, 1):
-                help_text += f"{i}. \"{example}\"\n"
+                append(f"{i}. \"{example}\"\n")
         
-        return help_text
+        return "".join(parts)
     
     def get_parameter_prompt(self, missing_params: List[str]) -> str:
         """Generate prompt for missing parameters."""
         if not missing_params:
             return ""
         
-        prompt = "I need some additional information:\n\n"
+        parts = ["I need some additional information:\n\n"]
+        append = parts.append
         
         for param_name in missing_params:
             param_info = self.get_parameter_help(param_name)
             if param_info:
-                prompt += f"• **{param_info.name}**: {param_info.description}"
+                append(f"• **{param_info.name}**: {param_info.description}")
                 if param_info.example:
-                    prompt += f" (e.g., {param_info.example})"
+                    append(f" (e.g., {param_info.example})")
                 if param_info.options:
-                    prompt += f"\n  Choose from: {', '.join(param_info.options)}"
-                prompt += "\n\n"
+                    append(f"\n  Choose from: {', '.join(param_info.options)}")
+                append("\n\n")
         
-        prompt += "Please provide these details and I'll help you proceed."
-        return prompt 
\ No newline at end of file
+        append("Please provide these details and I'll help you proceed.")
+        return "".join(parts)
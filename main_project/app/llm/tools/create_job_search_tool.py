@@ -11,21 +11,30 @@ from main_project.app.core.job_search_manager import JobSearchManager
 from shared.data import (
     JobSearchIn, JobType, RemoteType, TimePeriod, 
     get_job_types, get_remote_types, get_time_periods,
-    get_default_job_type, get_default_time_period, get_all_job_types, get_all_remote_types
+    get_default_job_type, get_default_time_period
 )
 from .base_tool import DocumentedTool, ToolDocumentation, ParameterInfo, InputType
+from .option_parsing import (
+    JOB_TYPES_BY_LABEL, REMOTE_TYPES_BY_LABEL, TIME_PERIODS_BY_NAME,
+    VALID_JOB_TYPES, VALID_REMOTE_TYPES, VALID_TIME_PERIODS,
+    option_key, parse_labels, validate_labels
+)
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_JOB_TYPES = (JOB_TYPES_BY_LABEL[option_key(get_default_job_type())],)
+_ALL_REMOTE_TYPES = tuple(REMOTE_TYPES_BY_LABEL.values())
+_DEFAULT_TIME_PERIOD = TIME_PERIODS_BY_NAME[option_key(get_default_time_period())]
+
 
 class CreateJobSearchInput(BaseModel):
     """Input schema for creating a job search."""
     user_id: int = Field(description="Telegram user ID creating the search")
     job_title: str = Field(description="Job title or keywords to search for (e.g., 'Python developer', 'Data scientist')")
     location: str = Field(description="Location to search in (e.g., 'Berlin', 'Remote', 'New York'). Required - specify city, country, or 'Remote'.")
-    job_types: Optional[List[str]] = Field(default=None, description=f"List of job types. Valid options: {', '.join(get_job_types())}. Leave empty for all types.")
-    remote_types: Optional[List[str]] = Field(default=None, description=f"Remote work preferences. Valid options: {', '.join(get_remote_types())}. Leave empty for all types.")
-    time_period: Optional[str] = Field(default=None, description=f"How frequently to check for new jobs. Valid options: {', '.join(get_time_periods())}. Default is '{get_default_time_period()}' if not specified.")
+    job_types: Optional[List[str]] = Field(default=None, description=f"List of job types. Valid options: {VALID_JOB_TYPES}. Leave empty for all types.")
+    remote_types: Optional[List[str]] = Field(default=None, description=f"Remote work preferences. Valid options: {VALID_REMOTE_TYPES}. Leave empty for all types.")
+    time_period: Optional[str] = Field(default=None, description=f"How frequently to check for new jobs. Valid options: {VALID_TIME_PERIODS}. Default is '{get_default_time_period()}' if not specified.")
     filter_text: Optional[str] = Field(default=None, description="🌟 Our unique AI-powered smart filter! Use natural language to describe what you want to EXCLUDE from results")
 
     @field_validator('job_types')
@@ -33,10 +42,7 @@ class CreateJobSearchInput(BaseModel):
     def validate_job_types(cls, v):
         if v is None:
             return v
-        valid_types = get_job_types()
-        invalid_types = [jt for jt in v if jt not in valid_types]
-        if invalid_types:
-            raise ValueError(f"Invalid job types: {', '.join(invalid_types)}. Valid options are: {', '.join(valid_types)}")
+        validate_labels(v, JOB_TYPES_BY_LABEL, "job types", VALID_JOB_TYPES)
         return v
     
     @field_validator('remote_types')
@@ -44,10 +50,7 @@ class CreateJobSearchInput(BaseModel):
     def validate_remote_types(cls, v):
         if v is None:
             return v
-        valid_types = get_remote_types()
-        invalid_types = [rt for rt in v if rt not in valid_types]
-        if invalid_types:
-            raise ValueError(f"Invalid remote types: {', '.join(invalid_types)}. Valid options are: {', '.join(valid_types)}")
+        validate_labels(v, REMOTE_TYPES_BY_LABEL, "remote types", VALID_REMOTE_TYPES)
         return v
     
     @field_validator('time_period')
@@ -55,12 +58,84 @@ class CreateJobSearchInput(BaseModel):
     def validate_time_period(cls, v):
         if v is None:
             return v
-        valid_periods = get_time_periods()
-        if v not in valid_periods:
-            raise ValueError(f"Invalid time period: '{v}'. Valid options are: {', '.join(valid_periods)}")
+        validate_labels([v], TIME_PERIODS_BY_NAME, "time period", VALID_TIME_PERIODS)
         return v
 
 
+_DOCUMENTATION = ToolDocumentation(
+    name="Create Job Search",
+    description="Create a new automated job search alert",
+    purpose="Set up a recurring job search that will automatically find and notify you of new job opportunities matching your criteria.",
+    parameters=[
+        ParameterInfo(
+            name="user_id",
+            description="Your Telegram user ID (automatically provided)",
+            type=InputType.NUMBER,
+            required=True,
+            example="12345"
+        ),
+        ParameterInfo(
+            name="job_title",
+            description="Job title, role name, or keywords to search for",
+            type=InputType.TEXT,
+            required=True,
+            example="Python developer",
+            validation_rules="Be specific but not too narrow. Include main skills or technologies."
+        ),
+        ParameterInfo(
+            name="location",
+            description="City, country, or region where you want to find jobs",
+            type=InputType.TEXT,
+            required=True,
+            example="Berlin, Germany",
+            validation_rules="Must specify a location - can be a city, country, or 'Worldwide'"
+        ),
+        ParameterInfo(
+            name="job_types", 
+            description="Types of employment you're interested in",
+            type=InputType.MULTISELECT,
+            required=False,
+            options=get_job_types(),
+            example=get_default_job_type(),
+            validation_rules=f"Must choose from: {VALID_JOB_TYPES}. Leave empty to include all types."
+        ),
+        ParameterInfo(
+            name="remote_types",
+            description="Remote work preferences",
+            type=InputType.MULTISELECT,
+            required=False,
+            options=get_remote_types(),
+            example="Remote",
+            validation_rules=f"Must choose from: {VALID_REMOTE_TYPES}. Leave empty to include all arrangements."
+        ),
+        ParameterInfo(
+            name="time_period",
+            description="How frequently to search for new jobs",
+            type=InputType.SELECT,
+            required=False,
+            options=get_time_periods(),
+            example=get_default_time_period(),
+            validation_rules=f"Must choose from: {VALID_TIME_PERIODS}. Defaults to '{get_default_time_period()}' if not specified."
+        ),
+        ParameterInfo(
+            name="filter_text",
+            description="🌟 Our unique AI-powered smart filter! Use natural language to describe what you want to EXCLUDE from results",
+            type=InputType.TEXT,
+            required=False,
+            example="No entry level positions, no travel required, no security clearance needed, exclude startups",
+            validation_rules="This is our signature feature - use natural language to describe what you DON'T want. The AI understands context and filters accordingly. Examples: 'No entry level', 'Avoid companies with less than 100 employees', 'No weekend work'"
+        )
+    ],
+    examples=[
+        "Create a search for Python developer jobs in Berlin with full-time contracts",
+        "I want to set up alerts for remote data scientist positions - check every hour",
+        "Create a search for React developer jobs in London - hybrid or remote preferred, filter out entry level positions",
+        "Set up alerts for marketing manager roles - part-time or contract work, exclude travel requirements"
+    ],
+    confirmation_required=True
+)
+
+
 class CreateJobSearchTool(BaseTool, DocumentedTool):
     """Tool for creating a new job search."""
     
@@ -81,9 +156,9 @@ class CreateJobSearchTool(BaseTool, DocumentedTool):
     
     Optional information:
     - location: Where they want to work (city, country, or "remote")
-    - job_types: Type of employment - options: {', '.join(get_job_types())}
-    - remote_types: Remote work preference - options: {', '.join(get_remote_types())}
-    - time_period: How frequently to check for new jobs - options: {', '.join(get_time_periods())}
+    - job_types: Type of employment - options: {VALID_JOB_TYPES}
+    - remote_types: Remote work preference - options: {VALID_REMOTE_TYPES}
+    - time_period: How frequently to check for new jobs - options: {VALID_TIME_PERIODS}
     - filter_text: 🌟 Our unique AI-powered smart filter! Use natural language to describe what you want to EXCLUDE from results
     
     Before calling this tool, make sure you have collected at least the job_title from the user.
@@ -95,78 +170,7 @@ class CreateJobSearchTool(BaseTool, DocumentedTool):
     @property
     def tool_documentation(self) -> ToolDocumentation:
         """Return complete tool documentation."""
-        return ToolDocumentation(
-            name="Create Job Search",
-            description="Create a new automated job search alert",
-            purpose="Set up a recurring job search that will automatically find and notify you of new job opportunities matching your criteria.",
-            parameters=[
-                ParameterInfo(
-                    name="user_id",
-                    description="Your Telegram user ID (automatically provided)",
-                    type=InputType.NUMBER,
-                    required=True,
-                    example="12345"
-                ),
-                ParameterInfo(
-                    name="job_title",
-                    description="Job title, role name, or keywords to search for",
-                    type=InputType.TEXT,
-                    required=True,
-                    example="Python developer",
-                    validation_rules="Be specific but not too narrow. Include main skills or technologies."
-                ),
-                ParameterInfo(
-                    name="location",
-                    description="City, country, or region where you want to find jobs",
-                    type=InputType.TEXT,
-                    required=True,
-                    example="Berlin, Germany",
-                    validation_rules="Must specify a location - can be a city, country, or 'Worldwide'"
-                ),
-                ParameterInfo(
-                    name="job_types", 
-                    description="Types of employment you're interested in",
-                    type=InputType.MULTISELECT,
-                    required=False,
-                    options=get_job_types(),
-                    example=get_default_job_type(),
-                    validation_rules=f"Must choose from: {', '.join(get_job_types())}. Leave empty to include all types."
-                ),
-                ParameterInfo(
-                    name="remote_types",
-                    description="Remote work preferences",
-                    type=InputType.MULTISELECT,
-                    required=False,
-                    options=get_remote_types(),
-                    example="Remote",
-                    validation_rules=f"Must choose from: {', '.join(get_remote_types())}. Leave empty to include all arrangements."
-                ),
-                ParameterInfo(
-                    name="time_period",
-                    description="How frequently to search for new jobs",
-                    type=InputType.SELECT,
-                    required=False,
-                    options=get_time_periods(),
-                    example=get_default_time_period(),
-                    validation_rules=f"Must choose from: {', '.join(get_time_periods())}. Defaults to '{get_default_time_period()}' if not specified."
-                ),
-                ParameterInfo(
-                    name="filter_text",
-                    description="🌟 Our unique AI-powered smart filter! Use natural language to describe what you want to EXCLUDE from results",
-                    type=InputType.TEXT,
-                    required=False,
-                    example="No entry level positions, no travel required, no security clearance needed, exclude startups",
-                    validation_rules="This is our signature feature - use natural language to describe what you DON'T want. The AI understands context and filters accordingly. Examples: 'No entry level', 'Avoid companies with less than 100 employees', 'No weekend work'"
-                )
-            ],
-            examples=[
-                "Create a search for Python developer jobs in Berlin with full-time contracts",
-                "I want to set up alerts for remote data scientist positions - check every hour",
-                "Create a search for React developer jobs in London - hybrid or remote preferred, filter out entry level positions",
-                "Set up alerts for marketing manager roles - part-time or contract work, exclude travel requirements"
-            ],
-            confirmation_required=True
-        )
+        return _DOCUMENTATION
     
     def __init__(self, job_search_manager: JobSearchManager, **kwargs):
         """Initialize the tool with JobSearchManager dependency."""
@@ -175,63 +179,24 @@ class CreateJobSearchTool(BaseTool, DocumentedTool):
     def _parse_job_types(self, job_types: Optional[List[str]]) -> List[JobType]:
         """Parse job type strings to JobType instances."""
         if not job_types:
-            return [JobType.parse(get_default_job_type())]  # Default to full-time
-        
-        valid_types = get_job_types()
-        parsed_types = []
-        invalid_types = []
+            return list(_DEFAULT_JOB_TYPES)  # Default to full-time
         
-        for jt in job_types:
-            if jt not in valid_types:
-                invalid_types.append(jt)
-            else:
-                try:
-                    parsed_types.append(JobType.parse(jt))
-                except ValueError:
-                    invalid_types.append(jt)
-        
-        if invalid_types:
-            raise ValueError(f"Invalid job types: {', '.join(invalid_types)}. Valid options are: {', '.join(valid_types)}")
-        
-        return parsed_types if parsed_types else [JobType.parse(get_default_job_type())]
+        return parse_labels(job_types, JOB_TYPES_BY_LABEL, "job types", VALID_JOB_TYPES)
     
     def _parse_remote_types(self, remote_types: Optional[List[str]]) -> List[RemoteType]:
         """Parse remote type strings to RemoteType instances."""
         if not remote_types:
             # Default to all available remote types
-            return [RemoteType.parse(rt) for rt in get_all_remote_types()]
-        
-        valid_types = get_remote_types()
-        parsed_types = []
-        invalid_types = []
-        
-        for rt in remote_types:
-            if rt not in valid_types:
-                invalid_types.append(rt)
-            else:
-                try:
-                    parsed_types.append(RemoteType.parse(rt))
-                except ValueError:
-                    invalid_types.append(rt)
+            return list(_ALL_REMOTE_TYPES)
         
-        if invalid_types:
-            raise ValueError(f"Invalid remote types: {', '.join(invalid_types)}. Valid options are: {', '.join(valid_types)}")
-        
-        return parsed_types if parsed_types else [RemoteType.parse(rt) for rt in get_all_remote_types()]
+        return parse_labels(remote_types, REMOTE_TYPES_BY_LABEL, "remote types", VALID_REMOTE_TYPES)
     
     def _parse_time_period(self, time_period: Optional[str]) -> TimePeriod:
         """Parse time period string to TimePeriod instance."""
         if not time_period:
-            return TimePeriod.parse(get_default_time_period())  # Default to 1 hour
-        
-        valid_periods = get_time_periods()
-        if time_period not in valid_periods:
-            raise ValueError(f"Invalid time period: '{time_period}'. Valid options are: {', '.join(valid_periods)}")
+            return _DEFAULT_TIME_PERIOD  # Default to 1 hour
         
-        try:
-            return TimePeriod.parse(time_period)
-        except ValueError:
-            raise ValueError(f"Invalid time period: '{time_period}'. Valid options are: {', '.join(valid_periods)}")
+        return parse_labels([time_period], TIME_PERIODS_BY_NAME, "time period", VALID_TIME_PERIODS)[0]
     
     async def _arun(
         self,
@@ -248,6 +213,14 @@ class CreateJobSearchTool(BaseTool, DocumentedTool):
         try:
             logger.info(f"Creating job search for user {user_id}: {job_title}")
             
+            # Ask for blank required fields before doing any parsing
+            missing_params = [
+                name for name, value in (("job_title", job_title), ("location", location))
+                if not value or not value.strip()
+            ]
+            if missing_params:
+                return self.get_parameter_prompt(missing_params)
+            
             # Parse and validate inputs
             try:
                 parsed_job_types = self._parse_job_types(job_types)
@@ -261,9 +234,9 @@ class CreateJobSearchTool(BaseTool, DocumentedTool):
 {error_msg}
 
 **Please specify valid values:**
-• **Job Types:** {', '.join(get_job_types())}
-• **Remote Types:** {', '.join(get_remote_types())}
-• **Time Periods:** {', '.join(get_time_periods())}
+• **Job Types:** {VALID_JOB_TYPES}
+• **Remote Types:** {VALID_REMOTE_TYPES}
+• **Time Periods:** {VALID_TIME_PERIODS}
 
 ❓ Would you like to try again with the correct values?"""
             
@@ -292,7 +265,7 @@ class CreateJobSearchTool(BaseTool, DocumentedTool):
 📍 **Location:** {location}
 💼 **Types:** {job_types_str}
 🏠 **Remote:** {remote_types_str}
-⏰ **Frequency:** Every {parsed_time_period.display_name.lower()}
+⏰ **Frequency:** Every {parsed_time_period.lowercase_name}
 """
             
             if filter_text:
@@ -300,7 +273,7 @@ class CreateJobSearchTool(BaseTool, DocumentedTool):
             
             result += f"""
 **What happens next:**
-✅ I'll automatically check for new jobs every {parsed_time_period.display_name.lower()}
+✅ I'll automatically check for new jobs every {parsed_time_period.lowercase_name}
 ✅ You'll receive notifications when relevant positions are found
 ✅ Only jobs matching your criteria will be sent to you
 
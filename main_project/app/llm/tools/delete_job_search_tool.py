@@ -20,6 +20,37 @@ class DeleteJobSearchInput(BaseModel):
     search_id: str = Field(description="ID of the job search to delete (UUID string)")
 
 
+_DOCUMENTATION = ToolDocumentation(
+    name="Delete Job Search",
+    description="Remove an existing job search alert permanently",
+    purpose="Cancel a job search that you no longer need. This will stop all notifications and permanently remove the search from your account.",
+    parameters=[
+        ParameterInfo(
+            name="user_id",
+            description="Your Telegram user ID (automatically provided)",
+            type=InputType.NUMBER,
+            required=True,
+            example="12345"
+        ),
+        ParameterInfo(
+            name="search_id",
+            description="The unique ID of the job search to delete",
+            type=InputType.TEXT,
+            required=True,
+            example="abc123def-456-789",
+            validation_rules="Must be a valid search ID from your existing searches. Use 'List job searches' to find the correct ID."
+        )
+    ],
+    examples=[
+        "Delete search abc123",
+        "Remove the Python developer search",
+        "Cancel my Berlin job alerts",
+        "Delete job search with ID xyz789"
+    ],
+    confirmation_required=True
+)
+
+
 class DeleteJobSearchTool(BaseTool, DocumentedTool):
     """Tool for deleting a job search."""
     
@@ -49,35 +80,7 @@ class DeleteJobSearchTool(BaseTool, DocumentedTool):
     @property
     def tool_documentation(self) -> ToolDocumentation:
         """Return complete tool documentation."""
-        return ToolDocumentation(
-            name="Delete Job Search",
-            description="Remove an existing job search alert permanently",
-            purpose="Cancel a job search that you no longer need. This will stop all notifications and permanently remove the search from your account.",
-            parameters=[
-                ParameterInfo(
-                    name="user_id",
-                    description="Your Telegram user ID (automatically provided)",
-                    type=InputType.NUMBER,
-                    required=True,
-                    example="12345"
-                ),
-                ParameterInfo(
-                    name="search_id",
-                    description="The unique ID of the job search to delete",
-                    type=InputType.TEXT,
-                    required=True,
-                    example="abc123def-456-789",
-                    validation_rules="Must be a valid search ID from your existing searches. Use 'List job searches' to find the correct ID."
-                )
-            ],
-            examples=[
-                "Delete search abc123",
-                "Remove the Python developer search",
-                "Cancel my Berlin job alerts",
-                "Delete job search with ID xyz789"
-            ],
-            confirmation_required=True
-        )
+        return _DOCUMENTATION
     
     def __init__(self, job_search_manager: JobSearchManager, **kwargs):
         """Initialize the tool with JobSearchManager dependency."""
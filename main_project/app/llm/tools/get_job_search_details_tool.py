@@ -19,6 +19,37 @@ class GetJobSearchDetailsInput(BaseModel):
     search_id: str = Field(description="ID of the job search to get details for (UUID string)")
 
 
+_DOCUMENTATION = ToolDocumentation(
+    name="Get Job Search Details",
+    description="View detailed information about a specific job search",
+    purpose="Get comprehensive details about one of your existing job searches, including all settings, criteria, and status information.",
+    parameters=[
+        ParameterInfo(
+            name="user_id",
+            description="Your Telegram user ID (automatically provided)",
+            type=InputType.NUMBER,
+            required=True,
+            example="12345"
+        ),
+        ParameterInfo(
+            name="search_id",
+            description="The unique ID of the job search to view details for",
+            type=InputType.TEXT,
+            required=True,
+            example="abc123def-456-789",
+            validation_rules="Must be a valid search ID from your existing searches. Use 'List job searches' to find the correct ID."
+        )
+    ],
+    examples=[
+        "Show details for search abc123",
+        "Get information about my Python developer search",
+        "View details of search xyz789",
+        "Show me more info about that Berlin search"
+    ],
+    confirmation_required=False
+)
+
+
 class GetJobSearchDetailsTool(BaseTool, DocumentedTool):
     """Tool for getting detailed information about a specific job search."""
     
@@ -44,35 +75,7 @@ class GetJobSearchDetailsTool(BaseTool, DocumentedTool):
     @property
     def tool_documentation(self) -> ToolDocumentation:
         """Return complete tool documentation."""
-        return ToolDocumentation(
-            name="Get Job Search Details",
-            description="View detailed information about a specific job search",
-            purpose="Get comprehensive details about one of your existing job searches, including all settings, criteria, and status information.",
-            parameters=[
-                ParameterInfo(
-                    name="user_id",
-                    description="Your Telegram user ID (automatically provided)",
-                    type=InputType.NUMBER,
-                    required=True,
-                    example="12345"
-                ),
-                ParameterInfo(
-                    name="search_id",
-                    description="The unique ID of the job search to view details for",
-                    type=InputType.TEXT,
-                    required=True,
-                    example="abc123def-456-789",
-                    validation_rules="Must be a valid search ID from your existing searches. Use 'List job searches' to find the correct ID."
-                )
-            ],
-            examples=[
-                "Show details for search abc123",
-                "Get information about my Python developer search",
-                "View details of search xyz789",
-                "Show me more info about that Berlin search"
-            ],
-            confirmation_required=False
-        )
+        return _DOCUMENTATION
     
     def __init__(self, job_search_manager: JobSearchManager, **kwargs):
         """Initialize the tool with JobSearchManager dependency."""
@@ -105,23 +108,17 @@ I couldn't find that job search in your account.
 Please check the search description and try again. You can use "Show my job searches" to see all your active searches."""
             
             # Format detailed information
-            job_types = [jt.label if hasattr(jt, 'label') else str(jt) for jt in target_search.job_types] if target_search.job_types else ["Any"]
-            job_types_str = ", ".join(job_types)
-            
-            remote_types = [rt.label if hasattr(rt, 'label') else str(rt) for rt in target_search.remote_types] if target_search.remote_types else ["Any"]
-            remote_types_str = ", ".join(remote_types)
-            
             result = f"""📋 **Job Search Details**
 
 🔍 **Keywords:** {target_search.job_title}
 📍 **Location:** {target_search.location or "Any location"}
-💼 **Job Types:** {job_types_str}
-🏠 **Remote Options:** {remote_types_str}
-📅 **Time Period:** {target_search.time_period.label if hasattr(target_search.time_period, 'label') else str(target_search.time_period)}
+💼 **Job Types:** {target_search.job_types_text}
+🏠 **Remote Options:** {target_search.remote_types_text}
+📅 **Time Period:** {target_search.time_period_text}
 """
             
             # Add filter text if present
-            if hasattr(target_search, 'filter_text') and target_search.filter_text:
+            if target_search.filter_text:
                 result += f"🔍 **Smart Filter:** {target_search.filter_text}\n"
             
             result += f"📅 **Created:** {target_search.created_at.strftime('%Y-%m-%d %H:%M')}\n\n"
@@ -142,7 +139,7 @@ Please check the search description and try again. You can use "Show my job sear
 • To create a new search: "Create a job search for [job title]"
 • To run a quick search: "Find [job title] jobs in [location]"
 """.format(
-                period=target_search.time_period.display_name.lower(),
+                period=target_search.time_period.lowercase_name,
                 search_id=search_id,
                 title=target_search.job_title,
                 location=target_search.location
@@ -1,23 +1,90 @@
 """
 LangChain tool for listing user's job searches.
 """
+import asyncio
 import logging
-from typing import Type, Optional, Dict, Any, Union
+from typing import Type, Optional, Dict, Any, List, Union
 from pydantic import BaseModel, Field
 from langchain.tools import BaseTool
 from langchain.callbacks.manager import CallbackManagerForToolRun
 
 from main_project.app.core.job_search_manager import JobSearchManager
+from shared.data import JobSearchOut
 from .base_tool import DocumentedTool, ToolDocumentation, ParameterInfo, InputType
 
 logger = logging.getLogger(__name__)
 
+SEARCH_SEPARATOR = "\n" + "─" * 30 + "\n\n"
+AVAILABLE_ACTIONS = """**Available Actions:**
+- To view details: "Show me details for my [job title] search"
+- To delete a search: "Delete my [job title] search" 
+- To create a new search: "Create a new job search"
+- To update a search: "Update my [job title] search" """
+
+SEARCH_TEMPLATE = """**{number}. {title}**
+📍 Location: {location}
+💼 Job Types: {job_types}
+🏠 Remote: {remote_types}
+📅 Time Period: {time_period}
+"""
+# Lists longer than this are rendered in a worker thread so other updates keep flowing
+THREADED_RENDER_THRESHOLD = 50
+
+
+def _render_searches(searches: List[JobSearchOut]) -> str:
+    """Render a user's job searches as a single message."""
+    parts = [f"📋 **Your Active Job Searches** ({len(searches)} total)\n\n"]
+    append = parts.append
+    
+    for i, search in enumerate(searches, 1):
+        append(SEARCH_TEMPLATE.format(
+            number=i,
+            title=search.job_title,
+            location=search.location or "Any location",
+            job_types=search.job_types_text,
+            remote_types=search.remote_types_text,
+            time_period=search.time_period_text,
+        ))
+        
+        # Add filter text if present
+        if search.filter_text:
+            append(f"🔍 **Smart Filter:** {search.filter_text}\n")
+        
+        # Add separator between searches
+        append(SEARCH_SEPARATOR)
+    
+    append(AVAILABLE_ACTIONS)
+    return "".join(parts)
+
 
 class ListJobSearchesInput(BaseModel):
     """Input schema for listing job searches."""
     user_id: int = Field(description="Telegram user ID to list job searches for")
 
 
+_DOCUMENTATION = ToolDocumentation(
+    name="List Job Searches",
+    description="View all your active job search alerts",
+    purpose="Display a complete list of your current job searches with their details including keywords, location, schedule, and status.",
+    parameters=[
+        ParameterInfo(
+            name="user_id",
+            description="Your Telegram user ID (automatically provided)",
+            type=InputType.NUMBER,
+            required=True,
+            example="12345"
+        )
+    ],
+    examples=[
+        "Show me my job searches",
+        "List all my job alerts", 
+        "What searches do I have?",
+        "Display my active searches"
+    ],
+    confirmation_required=False
+)
+
+
 class ListJobSearchesTool(BaseTool, DocumentedTool):
     """Tool for listing all job searches for a user."""
     
@@ -45,27 +112,7 @@ class ListJobSearchesTool(BaseTool, DocumentedTool):
     @property
     def tool_documentation(self) -> ToolDocumentation:
         """Return complete tool documentation."""
-        return ToolDocumentation(
-            name="List Job Searches",
-            description="View all your active job search alerts",
-            purpose="Display a complete list of your current job searches with their details including keywords, location, schedule, and status.",
-            parameters=[
-                ParameterInfo(
-                    name="user_id",
-                    description="Your Telegram user ID (automatically provided)",
-                    type=InputType.NUMBER,
-                    required=True,
-                    example="12345"
-                )
-            ],
-            examples=[
-                "Show me my job searches",
-                "List all my job alerts", 
-                "What searches do I have?",
-                "Display my active searches"
-            ],
-            confirmation_required=False
-        )
+        return _DOCUMENTATION
     
     def __init__(self, job_search_manager: JobSearchManager, **kwargs):
         """Initialize the tool with JobSearchManager dependency."""
@@ -95,37 +142,11 @@ Would you like me to help you create your first job search? I can guide you thro
 
 Just say something like "I want to create a new job search" and I'll help you get started!"""
             
-            # Format the search results
-            result = f"📋 **Your Active Job Searches** ({len(searches)} total)\n\n"
-            
-            for i, search in enumerate(searches, 1):
-                # Format job types
-                job_types = [jt.label if hasattr(jt, 'label') else str(jt) for jt in search.job_types] if search.job_types else ["Any"]
-                job_types_str = ", ".join(job_types)
-                
-                # Format remote types  
-                remote_types = [rt.label if hasattr(rt, 'label') else str(rt) for rt in search.remote_types] if search.remote_types else ["Any"]
-                remote_types_str = ", ".join(remote_types)
-                
-                result += f"""**{i}. {search.job_title}**
-📍 Location: {search.location or "Any location"}
-💼 Job Types: {job_types_str}
-🏠 Remote: {remote_types_str}
-📅 Time Period: {search.time_period.label if hasattr(search.time_period, 'label') else str(search.time_period)}
-"""
-                
-                # Add filter text if present
-                if hasattr(search, 'filter_text') and search.filter_text:
-                    result += f"🔍 **Smart Filter:** {search.filter_text}\n"
-                
-                # Add separator between searches
-                result += "\n" + "─" * 30 + "\n\n"
-            
-            result += """**Available Actions:**
-- To view details: "Show me details for my [job title] search"
-- To delete a search: "Delete my [job title] search" 
-- To create a new search: "Create a new job search"
-- To update a search: "Update my [job title] search" """
+            # Format the search results, off the event loop when the list is long
+            if len(searches) > THREADED_RENDER_THRESHOLD:
+                result = await asyncio.to_thread(_render_searches, searches)
+            else:
+                result = _render_searches(searches)
             
             logger.info(f"Successfully listed {len(searches)} job searches for user {user_id}")
             return result
@@ -9,22 +9,30 @@ from langchain.callbacks.manager import CallbackManagerForToolRun
 
 from main_project.app.core.job_search_manager import JobSearchManager
 from shared.data import (
-    JobSearchIn, JobType, RemoteType, TimePeriod, get_default_remote_type, 
+    JobSearchIn, JobType, RemoteType, get_default_remote_type, 
     get_job_types, get_remote_types, get_time_period_for_one_time_search, get_one_time_search_description,
-    get_default_job_type, get_all_job_types, get_all_remote_types
+    get_default_job_type
 )
 from .base_tool import DocumentedTool, ToolDocumentation, ParameterInfo, InputType
+from .option_parsing import (
+    JOB_TYPES_BY_LABEL, REMOTE_TYPES_BY_LABEL, TIME_PERIODS_BY_NAME, VALID_JOB_TYPES, VALID_REMOTE_TYPES,
+    option_key, parse_labels, validate_labels
+)
 
 logger = logging.getLogger(__name__)
 
+_ALL_JOB_TYPES = tuple(JOB_TYPES_BY_LABEL.values())
+_ALL_REMOTE_TYPES = tuple(REMOTE_TYPES_BY_LABEL.values())
+_ONE_TIME_SEARCH_PERIOD = TIME_PERIODS_BY_NAME[option_key(get_time_period_for_one_time_search())]
+
 
 class OneTimeSearchInput(BaseModel):
     """Input schema for one-time job search."""
     user_id: int = Field(description="Telegram user ID requesting the search")
     job_title: str = Field(description="Job title or keywords to search for (e.g., 'Python developer', 'Data scientist')")
     location: str = Field(description="Location to search in (e.g., 'Berlin', 'Remote', 'New York'). Required - specify city, country, or 'Remote'.")
-    job_types: Optional[List[str]] = Field(default=None, description=f"List of job types. Valid options: {', '.join(get_job_types())}. Leave empty for all types.")
-    remote_types: Optional[List[str]] = Field(default=None, description=f"Remote work preferences. Valid options: {', '.join(get_remote_types())}. Leave empty for all types.")
+    job_types: Optional[List[str]] = Field(default=None, description=f"List of job types. Valid options: {VALID_JOB_TYPES}. Leave empty for all types.")
+    remote_types: Optional[List[str]] = Field(default=None, description=f"Remote work preferences. Valid options: {VALID_REMOTE_TYPES}. Leave empty for all types.")
     filter_text: Optional[str] = Field(default=None, description="🌟 Our unique AI-powered smart filter! Use natural language to describe what you want to EXCLUDE from results")
 
     @field_validator('job_types')
@@ -32,10 +40,7 @@ class OneTimeSearchInput(BaseModel):
     def validate_job_types(cls, v):
         if v is None:
             return v
-        valid_types = get_job_types()
-        invalid_types = [jt for jt in v if jt not in valid_types]
-        if invalid_types:
-            raise ValueError(f"Invalid job types: {', '.join(invalid_types)}. Valid options are: {', '.join(valid_types)}")
+        validate_labels(v, JOB_TYPES_BY_LABEL, "job types", VALID_JOB_TYPES)
         return v
     
     @field_validator('remote_types')
@@ -43,13 +48,75 @@ class OneTimeSearchInput(BaseModel):
     def validate_remote_types(cls, v):
         if v is None:
             return v
-        valid_types = get_remote_types()
-        invalid_types = [rt for rt in v if rt not in valid_types]
-        if invalid_types:
-            raise ValueError(f"Invalid remote types: {', '.join(invalid_types)}. Valid options are: {', '.join(valid_types)}")
+        validate_labels(v, REMOTE_TYPES_BY_LABEL, "remote types", VALID_REMOTE_TYPES)
         return v
 
 
+_DOCUMENTATION = ToolDocumentation(
+    name="One-time Immediate Job Search",
+    description="Execute an immediate job search and get results now",
+    purpose=get_one_time_search_description(),
+    parameters=[
+        ParameterInfo(
+            name="user_id",
+            description="Your Telegram user ID (automatically provided)",
+            type=InputType.NUMBER,
+            required=True,
+            example="12345"
+        ),
+        ParameterInfo(
+            name="job_title",
+            description="Job title, role name, or keywords to search for immediately",
+            type=InputType.TEXT,
+            required=True,
+            example="Python developer",
+            validation_rules="Be specific about the role or skills you're looking for"
+        ),
+        ParameterInfo(
+            name="location",
+            description="City, country, or region to search in",
+            type=InputType.TEXT,
+            required=True,
+            example="Berlin, Germany",
+            validation_rules="Must specify a location - can be a city, country, or 'Remote' for remote-only positions"
+        ),
+        ParameterInfo(
+            name="job_types",
+            description="Types of employment to search for",
+            type=InputType.MULTISELECT,
+            required=False,
+            options=get_job_types(),
+            example=get_default_job_type(),
+            validation_rules=f"Must choose from: {VALID_JOB_TYPES}. Leave empty to include all types."
+        ),
+        ParameterInfo(
+            name="remote_types",
+            description="Remote work arrangement preferences",
+            type=InputType.MULTISELECT,
+            required=False,
+            options=get_remote_types(),
+            example=get_default_remote_type(),
+            validation_rules=f"Must choose from: {VALID_REMOTE_TYPES}. Leave empty to include all arrangements."
+        ),
+        ParameterInfo(
+            name="filter_text",
+            description="🌟 Our unique AI-powered smart filter! Use natural language to describe what you want to EXCLUDE from results",
+            type=InputType.TEXT,
+            required=False,
+            example="No entry level positions, no travel required, no security clearance needed, exclude startups",
+            validation_rules="This is our signature feature - describe in natural language what you DON'T want. Examples: 'No entry level jobs', 'Avoid companies requiring travel', 'No positions requiring specific certifications'"
+        )
+    ],
+    examples=[
+        "Search for Python developer jobs in Berlin now, filter out jobs that require German language and travelling",
+        "Find remote data scientist positions with full-time",
+        "Show me React developer jobs in London immediately - no entry level",
+        "Search for marketing manager roles in New York - hybrid work preferred, exclude travel requirements"
+    ],
+    confirmation_required=False
+)
+
+
 class OneTimeSearchTool(BaseTool, DocumentedTool):
     """Tool for executing a one-time job search."""
     
@@ -77,8 +144,8 @@ class OneTimeSearchTool(BaseTool, DocumentedTool):
     
     Optional information:
     - location: Where they want to work (city, country, or "remote")
-    - job_types: Type of employment ({', '.join(get_job_types())})
-    - remote_types: Remote work preference ({', '.join(get_remote_types())})
+    - job_types: Type of employment ({VALID_JOB_TYPES})
+    - remote_types: Remote work preference ({VALID_REMOTE_TYPES})
     - filter_text: 🌟 Our unique AI-powered smart filter! Use natural language to describe what you want to EXCLUDE from results
     
     The search will be executed immediately and results sent to the user.
@@ -89,69 +156,7 @@ class OneTimeSearchTool(BaseTool, DocumentedTool):
     @property
     def tool_documentation(self) -> ToolDocumentation:
         """Return complete tool documentation."""
-        return ToolDocumentation(
-            name="One-time Immediate Job Search",
-            description="Execute an immediate job search and get results now",
-            purpose=get_one_time_search_description(),
-            parameters=[
-                ParameterInfo(
-                    name="user_id",
-                    description="Your Telegram user ID (automatically provided)",
-                    type=InputType.NUMBER,
-                    required=True,
-                    example="12345"
-                ),
-                ParameterInfo(
-                    name="job_title",
-                    description="Job title, role name, or keywords to search for immediately",
-                    type=InputType.TEXT,
-                    required=True,
-                    example="Python developer",
-                    validation_rules="Be specific about the role or skills you're looking for"
-                ),
-                ParameterInfo(
-                    name="location",
-                    description="City, country, or region to search in",
-                    type=InputType.TEXT,
-                    required=True,
-                    example="Berlin, Germany",
-                    validation_rules="Must specify a location - can be a city, country, or 'Remote' for remote-only positions"
-                ),
-                ParameterInfo(
-                    name="job_types",
-                    description="Types of employment to search for",
-                    type=InputType.MULTISELECT,
-                    required=False,
-                    options=get_job_types(),
-                    example=get_default_job_type(),
-                    validation_rules=f"Must choose from: {', '.join(get_job_types())}. Leave empty to include all types."
-                ),
-                ParameterInfo(
-                    name="remote_types",
-                    description="Remote work arrangement preferences",
-                    type=InputType.MULTISELECT,
-                    required=False,
-                    options=get_remote_types(),
-                    example=get_default_remote_type(),
-                    validation_rules=f"Must choose from: {', '.join(get_remote_types())}. Leave empty to include all arrangements."
-                ),
-                ParameterInfo(
-                    name="filter_text",
-                    description="🌟 Our unique AI-powered smart filter! Use natural language to describe what you want to EXCLUDE from results",
-                    type=InputType.TEXT,
-                    required=False,
-                    example="No entry level positions, no travel required, no security clearance needed, exclude startups",
-                    validation_rules="This is our signature feature - describe in natural language what you DON'T want. Examples: 'No entry level jobs', 'Avoid companies requiring travel', 'No positions requiring specific certifications'"
-                )
-            ],
-            examples=[
-                "Search for Python developer jobs in Berlin now, filter out jobs that require German language and travelling",
-                "Find remote data scientist positions with full-time",
-                "Show me React developer jobs in London immediately - no entry level",
-                "Search for marketing manager roles in New York - hybrid work preferred, exclude travel requirements"
-            ],
-            confirmation_required=False
-        )
+        return _DOCUMENTATION
     
     def __init__(self, job_search_manager: JobSearchManager, **kwargs):
         """Initialize the tool with JobSearchManager dependency."""
@@ -161,49 +166,17 @@ class OneTimeSearchTool(BaseTool, DocumentedTool):
         """Parse and validate job type strings to JobType instances."""
         if not job_types:
             # Default to all available job types
-            return [JobType.parse(jt) for jt in get_all_job_types()]
+            return list(_ALL_JOB_TYPES)
         
-        valid_types = get_job_types()
-        parsed_types = []
-        invalid_types = []
-        
-        for jt in job_types:
-            if jt not in valid_types:
-                invalid_types.append(jt)
-            else:
-                try:
-                    parsed_types.append(JobType.parse(jt))
-                except ValueError:
-                    invalid_types.append(jt)
-        
-        if invalid_types:
-            raise ValueError(f"Invalid job types: {', '.join(invalid_types)}. Valid options are: {', '.join(valid_types)}")
-        
-        return parsed_types if parsed_types else [JobType.parse(jt) for jt in get_all_job_types()]
+        return parse_labels(job_types, JOB_TYPES_BY_LABEL, "job types", VALID_JOB_TYPES)
     
     def _parse_remote_types(self, remote_types: Optional[List[str]]) -> List[RemoteType]:
         """Parse and validate remote type strings to RemoteType instances."""
         if not remote_types:
             # Default to all available remote types
-            return [RemoteType.parse(rt) for rt in get_all_remote_types()]
-        
-        valid_types = get_remote_types()
-        parsed_types = []
-        invalid_types = []
+            return list(_ALL_REMOTE_TYPES)
         
-        for rt in remote_types:
-            if rt not in valid_types:
-                invalid_types.append(rt)
-            else:
-                try:
-                    parsed_types.append(RemoteType.parse(rt))
-                except ValueError:
-                    invalid_types.append(rt)
-        
-        if invalid_types:
-            raise ValueError(f"Invalid remote types: {', '.join(invalid_types)}. Valid options are: {', '.join(valid_types)}")
-        
-        return parsed_types if parsed_types else [RemoteType.parse(rt) for rt in get_all_remote_types()]
+        return parse_labels(remote_types, REMOTE_TYPES_BY_LABEL, "remote types", VALID_REMOTE_TYPES)
     
     async def _arun(
         self,
@@ -219,6 +192,14 @@ class OneTimeSearchTool(BaseTool, DocumentedTool):
         try:
             logger.info(f"Executing one-time search for user {user_id}: {job_title}")
             
+            # Ask for blank required fields before doing any parsing
+            missing_params = [
+                name for name, value in (("job_title", job_title), ("location", location))
+                if not value or not value.strip()
+            ]
+            if missing_params:
+                return self.get_parameter_prompt(missing_params)
+            
             # Parse and validate inputs
             try:
                 parsed_job_types = self._parse_job_types(job_types)
@@ -231,8 +212,8 @@ class OneTimeSearchTool(BaseTool, DocumentedTool):
 {error_msg}
 
 **Please specify valid values:**
-• **Job Types:** {', '.join(get_job_types())}
-• **Remote Types:** {', '.join(get_remote_types())}
+• **Job Types:** {VALID_JOB_TYPES}
+• **Remote Types:** {VALID_REMOTE_TYPES}
 
 ❓ Would you like to try again with the correct values?"""
             
@@ -242,7 +223,7 @@ class OneTimeSearchTool(BaseTool, DocumentedTool):
                 location=location,
                 job_types=parsed_job_types,
                 remote_types=parsed_remote_types,
-                time_period=TimePeriod.parse(get_time_period_for_one_time_search()),
+                time_period=_ONE_TIME_SEARCH_PERIOD,
                 user_id=user_id,
                 filter_text=filter_text,
             )
@@ -0,0 +1,40 @@
+"""
+Shared parsing of job search option labels for LangChain tools.
+"""
+from typing import Dict, List, TypeVar
+
+from shared.data import JobType, RemoteType, TimePeriod
+
+T = TypeVar("T")
+
+# Case-insensitive lookups keyed by casefolded label, so invalid input is a single dict miss
+JOB_TYPES_BY_LABEL: Dict[str, JobType] = {jt.label.casefold(): jt for jt in JobType._instances.values()}
+REMOTE_TYPES_BY_LABEL: Dict[str, RemoteType] = {rt.label.casefold(): rt for rt in RemoteType._instances.values()}
+TIME_PERIODS_BY_NAME: Dict[str, TimePeriod] = {tp.display_name.casefold(): tp for tp in TimePeriod._instances.values()}
+
+# Valid-option lists as shown to users in help and error replies
+VALID_JOB_TYPES = ", ".join(jt.label for jt in JOB_TYPES_BY_LABEL.values())
+VALID_REMOTE_TYPES = ", ".join(rt.label for rt in REMOTE_TYPES_BY_LABEL.values())
+VALID_TIME_PERIODS = ", ".join(tp.display_name for tp in TIME_PERIODS_BY_NAME.values())
+
+
+def option_key(value: str) -> str:
+    """Normalize user input to the key used by the lookup tables."""
+    return value.strip().casefold()
+
+
+def validate_labels(values: List[str], table: Dict[str, T], label: str, valid_options: str) -> None:
+    """Raise ValueError listing every value that has no entry in `table`."""
+    invalid = [value for value in values if option_key(value) not in table]
+    if invalid:
+        raise ValueError(f"Invalid {label}: {', '.join(invalid)}. Valid options are: {valid_options}")
+
+
+def parse_labels(values: List[str], table: Dict[str, T], label: str, valid_options: str) -> List[T]:
+    """Map labels to their instances via `table`, raising ValueError for unknown labels."""
+    get = table.get
+    pairs = [(value, get(option_key(value))) for value in values]
+    invalid = [value for value, member in pairs if member is None]
+    if invalid:
+        raise ValueError(f"Invalid {label}: {', '.join(invalid)}. Valid options are: {valid_options}")
+    return [member for _, member in pairs]
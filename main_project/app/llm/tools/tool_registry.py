@@ -18,22 +18,25 @@ class ToolRegistry:
     
     def get_all_tools_help(self) -> str:
         """Get comprehensive help for all available tools."""
-        help_text = "🤖 **Available Operations**\n\n"
-        help_text += "I can help you with the following job search operations:\n\n"
+        parts = [
+            "🤖 **Available Operations**\n\n",
+            "I can help you with the following job search operations:\n\n",
+        ]
+        append = parts.append
         
         for tool in self.tools.values():
             doc = tool.tool_documentation
-            help_text += f"🔹 **{doc.name}**\n"
-            help_text += f"   {doc.description}\n"
+            append(f"🔹 **{doc.name}**\n")
+            append(f"   {doc.description}\n")
             if doc.examples:
-                help_text += f"   💬 Example: \"{doc.examples[0]}\"\n"
-            help_text += "\n"
+                append(f"   💬 Example: \"{doc.examples[0]}\"\n")
+            append("\n")
         
-        help_text += "\n📝 **How to use:**\n"
-        help_text += "Just describe what you want to do in natural language! I'll understand your intent and guide you through the process.\n\n"
-        help_text += "📋 **Need detailed help?** Say \"help with [operation]\" for specific guidance.\n"
+        append("\n📝 **How to use:**\n")
+        append("Just describe what you want to do in natural language! I'll understand your intent and guide you through the process.\n\n")
+        append("📋 **Need detailed help?** Say \"help with [operation]\" for specific guidance.\n")
         
-        return help_text
+        return "".join(parts)
     
     def get_tool_help(self, tool_name: str) -> Optional[str]:
         """Get detailed help for a specific tool."""
@@ -10,11 +10,13 @@ from typing import Optional
 from pathlib import Path
 import threading
 from fastapi import FastAPI, Query, Request
+from fastapi.responses import JSONResponse
 import uvicorn
 
 from main_project.app.core.container import get_container
+from main_project.app.bot.telegram_bot import format_job_notification, pack_messages
 from main_project.app.utils.logging_config import setup_logging
-from main_project.app.scraper_client import search_jobs_via_scraper, check_proxy_connection_via_scraper
+from main_project.app.scraper_client import search_jobs_via_scraper, check_proxy_connection_via_scraper, close_scraper_client
 from shared.data import JobSearchOut, StreamEvent, StreamType, FullJobListing
 
 # Configure logging to file and console
@@ -63,6 +65,7 @@ async def on_startup():
 async def on_shutdown():
     container = get_container()
     await container.shutdown()
+    await close_scraper_client()
 
 @app.get("/")
 async def root():
@@ -84,51 +87,45 @@ async def job_results_callback(request: Request):
     container = get_container()
     sent_jobs_store = container.sent_jobs_store
     stream_manager = container.stream_manager
-    job_search_store = container.job_search_store
-
-    # Fetch job search parameters from MongoDB
-    job_search: Optional[JobSearchOut] = await job_search_store.get_search_by_id(job_search_id)
 
     if not parsed_jobs:
         logger.info(f"No jobs received for job_search_id={job_search_id}, user_id={user_id}")
     if parsed_jobs:
         sent_jobs = await sent_jobs_store.get_sent_jobs_for_user(user_id)
         sent_job_urls = {job.job_url for job in sent_jobs}
-        new_jobs = [job for job in parsed_jobs if job.link not in sent_job_urls]
+        unsent_jobs = {job.link: job for job in parsed_jobs if job.link not in sent_job_urls}
+        # Claimed jobs are recorded as sent, so refuse them while notifications can't be queued
+        if container.telegram_bot.send_queue_full:
+            logger.warning(f"Send queue full, not claiming {len(unsent_jobs)} jobs for job_search_id={job_search_id}, user_id={user_id}")
+            return JSONResponse(status_code=503, content={"status": "busy"})
+        # Claim atomically so overlapping searches for the same user don't both send a job
+        claimed_links = sent_jobs_store.claim_unsent_jobs(user_id, list(unsent_jobs))
+        new_jobs = [unsent_jobs[link] for link in claimed_links]
         logger.info(f"Found {len(new_jobs)} new jobs for job_search_id={job_search_id}, user_id={user_id}")
         if new_jobs:
+            # Search parameters for the header come from the manager's in-memory cache; one-time searches have none
+            job_search: Optional[JobSearchOut] = None
+            if job_search_id:
+                job_search = await container.job_search_manager.get_user_search(user_id, job_search_id)
             # Format header with search params
             if job_search:
                 message = (
                     f"🔔 New job listings found for:\n"
                     f"Keywords: {job_search.job_title}\n"
                     f"Location: {job_search.location}\n"
-                    f"Job Types: {', '.join([jt.label for jt in job_search.job_types])}\n"
-                    f"Remote Types: {', '.join([rt.label for rt in job_search.remote_types])}\n\n"
+                    f"Job Types: {job_search.job_types_text}\n"
+                    f"Remote Types: {job_search.remote_types_text}\n\n"
                 )
             else:
                 message = "🔔 New job listings found for your search.\n\n"
-            for job in new_jobs:
-                message += (
-                    f"Compatibility: {job.compatibility_score}\n"
-                    f"Title: {job.title}\n"
-                    f"Employer: {job.company}\n"
-                    f"Techstack: {', '.join(job.techstack)}\n"
-                    f"Location: {job.location}\n"
-                    f"Created: {job.created_ago}\n"
-                    f"🔗: {job.link}\n\n"
-                )
-            for job in new_jobs:
-                await sent_jobs_store.save_sent_job(user_id, job.link)
-            message_data = {
-                "user_id": user_id,
-                "message": message
-            }
-            stream_manager.publish(StreamEvent(
-                type=StreamType.SEND_MESSAGE,
-                data=message_data,
-                source="job_search_scheduler"
-            ))
+            job_blocks = [format_job_notification(job) for job in new_jobs]
+            # One send per packed chunk; jobs are never split across messages
+            for chunk in pack_messages(message, job_blocks):
+                stream_manager.publish(StreamEvent(
+                    type=StreamType.SEND_MESSAGE,
+                    data={"user_id": user_id, "message": chunk},
+                    source="job_search_scheduler"
+                ))
     return {"status": "received"}
 
 async def handle_shutdown(signum: int, frame: Optional[object]) -> None:
@@ -5,7 +5,6 @@ import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set
-import os
 import random
 import re
 
@@ -13,7 +12,8 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 import pytz
 
-from shared.data import JobSearchOut, StreamManager, TimePeriod, JobListing, StreamType, StreamEvent, SearchJobsParams
+from shared.data import JobSearchOut, StreamManager, TimePeriod, StreamType, StreamEvent, SearchJobsParams
+from main_project.app.core.config import get_config
 from main_project.app.core.stores.sent_jobs_store import SentJobsStore
 from main_project.app.core.mongo_connection import MongoConnection
 from main_project.app.scraper_client import search_jobs_via_scraper
@@ -143,10 +143,6 @@ class JobSearchScheduler:
             "time_period": job_search.time_period.display_name if job_search.time_period else None,
         }
         logger.info(f"Requesting scraper job: {log_data}")
-        # Build callback URL by appending the path to the base URL from env
-        base_url = os.getenv("CALLBACK_URL")
-        callback_url = base_url.rstrip("/") + "/job_results_callback"
-        
         params = SearchJobsParams(
             keywords=job_search.job_title,
             location=job_search.location,
@@ -154,7 +150,7 @@ class JobSearchScheduler:
             remote_types=log_data["remote_types"],
             time_period=log_data["time_period"],
             filter_text=getattr(job_search, 'filter_text', None),
-            callback_url=callback_url,
+            callback_url=get_config().job_results_callback_url,
             job_search_id=job_search.id,
             user_id=job_search.user_id,
         )
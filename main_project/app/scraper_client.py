@@ -1,11 +1,27 @@
 import httpx
 import os
-from typing import Any
+from typing import Any, Optional
 from shared.data import SearchJobsParams
 
 # Use environment variable or default to localhost for local development
 SCRAPER_SERVICE_URL = os.getenv("SCRAPER_SERVICE_URL")
 
+# Shared client so scheduled searches reuse pooled keep-alive connections
+_client: Optional[httpx.AsyncClient] = None
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient()
+    return _client
+
+async def close_scraper_client() -> None:
+    """Close the shared HTTP client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 async def search_jobs_via_scraper(params: SearchJobsParams) -> Any:
     """
     Search jobs via scraper service.
@@ -16,14 +32,12 @@ async def search_jobs_via_scraper(params: SearchJobsParams) -> Any:
     # Convert SearchJobsParams to JSON
     json_data = params.model_dump(exclude_none=True)
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(f"{SCRAPER_SERVICE_URL}/search_jobs", json=json_data)
-        return response
+    response = await _get_client().post(f"{SCRAPER_SERVICE_URL}/search_jobs", json=json_data)
+    return response
 
 async def check_proxy_connection_via_scraper() -> dict[str, Any]:
     """Check proxy connection via scraper service."""
     timeout = httpx.Timeout(100.0) 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.get(f"{SCRAPER_SERVICE_URL}/check_proxy_connection")
-        response.raise_for_status()
-        return response.json()
+    response = await _get_client().get(f"{SCRAPER_SERVICE_URL}/check_proxy_connection", timeout=timeout)
+    response.raise_for_status()
+    return response.json()
@@ -13,11 +13,8 @@ def setup_logging(log_file: Path = None):
     Args:
         log_file: Optional path to log file. If not provided, logs only to console.
     """
-    # Create formatters
-    console_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    file_formatter = logging.Formatter(
+    # Console and file output share one format
+    formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
@@ -26,14 +23,15 @@ def setup_logging(log_file: Path = None):
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(formatter)
     handlers.append(console_handler)
     
     # File handler (if log_file is provided)
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(file_formatter)
+        # Open the file on the first record rather than at import time
+        file_handler = logging.FileHandler(log_file, delay=True)
+        file_handler.setFormatter(formatter)
         handlers.append(file_handler)
 
     # Configure root logger
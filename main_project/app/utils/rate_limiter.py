@@ -0,0 +1,37 @@
+"""
+Async token bucket used to pace outgoing Telegram API calls.
+"""
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """Token bucket that makes callers wait until enough tokens are available."""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Create a bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of tokens the bucket can hold (burst size).
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self, n: float = 1) -> None:
+        """Wait until `n` tokens can be taken from the bucket."""
+        async with self._lock:
+            self._refill()
+            while self.tokens < n:
+                await asyncio.sleep((n - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= n
@@ -0,0 +1,98 @@
+"""
+Unit tests for Container shutdown ordering.
+"""
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from main_project.app.core.container import Container
+
+
+@pytest.fixture
+def container(monkeypatch):
+    """Create a container whose services are mocks that record their shutdown."""
+    monkeypatch.setenv("CALLBACK_URL", "http://localhost:8000")
+    container = Container()
+    calls = []
+    for name, method in [
+        ("scheduler", "stop"),
+        ("telegram_bot", "stop"),
+        ("sent_jobs_store", "close"),
+        ("mongo_connection", "close"),
+    ]:
+        service = Mock()
+        setattr(service, method, AsyncMock(side_effect=lambda name=name: calls.append(name)))
+        container.__dict__[name] = service
+    container.calls = calls
+    return container
+
+
+class TestShutdown:
+    """Test that shutdown stops exactly the started services."""
+
+    @pytest.mark.asyncio
+    async def test_stops_started_services_with_mongo_last(self, container):
+        """Every started service should stop, and MongoDB should close after the rest."""
+        container._started.update(["scheduler", "telegram_bot", "sent_jobs_store", "mongo_connection"])
+        await container.shutdown()
+        assert sorted(container.calls[:3]) == ["scheduler", "sent_jobs_store", "telegram_bot"]
+        assert container.calls[3] == "mongo_connection"
+
+    @pytest.mark.asyncio
+    async def test_skips_services_that_never_started(self, container):
+        """Services whose startup did not complete should be left alone."""
+        container._started.add("mongo_connection")
+        await container.shutdown()
+        assert container.calls == ["mongo_connection"]
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_block_other_services(self, container):
+        """One service failing to stop should not prevent the others from stopping."""
+        container.__dict__["telegram_bot"].stop.side_effect = RuntimeError("boom")
+        container._started.update(["scheduler", "telegram_bot", "mongo_connection"])
+        await container.shutdown()
+        assert container.calls == ["scheduler", "mongo_connection"]
+
+
+@pytest.fixture
+def starting_container(monkeypatch):
+    """Create a container whose services are mocks that record their startup and shutdown."""
+    monkeypatch.setenv("CALLBACK_URL", "http://localhost:8000")
+    container = Container()
+    calls = []
+    for name, methods in [
+        ("mongo_connection", ["connect", "close"]),
+        ("job_search_store", ["connect"]),
+        ("sent_jobs_store", ["connect", "close"]),
+        ("telegram_bot", ["connect", "start_polling", "stop"]),
+        ("scheduler", ["initialize", "stop"]),
+        ("job_search_manager", ["initialize"]),
+    ]:
+        service = Mock()
+        for method in methods:
+            setattr(service, method, AsyncMock(side_effect=lambda call=f"{name}.{method}": calls.append(call)))
+        container.__dict__[name] = service
+    container.calls = calls
+    return container
+
+
+class TestInitialize:
+    """Test startup ordering and startup failures."""
+
+    @pytest.mark.asyncio
+    async def test_polling_starts_after_storage(self, starting_container):
+        """The bot should only receive updates once the stores are connected."""
+        await starting_container.initialize()
+        calls = starting_container.calls
+        assert calls.index("telegram_bot.start_polling") > calls.index("sent_jobs_store.connect")
+        assert calls.index("telegram_bot.start_polling") > calls.index("job_search_store.connect")
+
+    @pytest.mark.asyncio
+    async def test_storage_failure_leaves_no_bot_running(self, starting_container):
+        """A failed MongoDB connect should not start polling, and shutdown should stop the connected bot."""
+        starting_container.mongo_connection.connect.side_effect = ConnectionError("down")
+        with pytest.raises(ConnectionError):
+            await starting_container.initialize()
+        starting_container.telegram_bot.start_polling.assert_not_awaited()
+
+        await starting_container.shutdown()
+        starting_container.telegram_bot.stop.assert_awaited_once()
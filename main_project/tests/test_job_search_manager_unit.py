@@ -0,0 +1,115 @@
+"""
+Unit tests for JobSearchManager's in-memory search cache.
+"""
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from main_project.app.core.job_search_manager import JobSearchManager
+from main_project.app.core.stores.job_search_store import JobSearchStore
+from main_project.app.schedulers.job_search_scheduler import JobSearchScheduler
+from shared.data import JobSearchIn, JobSearchRemove, JobType, RemoteType, TimePeriod
+
+
+@pytest.fixture
+def store():
+    """Create a mocked job search store."""
+    job_search_store = Mock(spec=JobSearchStore)
+    job_search_store.get_user_searches = AsyncMock(return_value=[])
+    job_search_store.get_all_searches = AsyncMock(return_value=[])
+    job_search_store.save_job_search = AsyncMock()
+    job_search_store.delete_search = AsyncMock(return_value=True)
+    return job_search_store
+
+
+@pytest.fixture
+def manager(store):
+    """Create a JobSearchManager with mocked dependencies."""
+    scheduler = Mock(spec=JobSearchScheduler)
+    scheduler.add_job_search = AsyncMock()
+    scheduler.remove_job_search = AsyncMock()
+    scheduler.add_initial_job_searches = AsyncMock()
+    return JobSearchManager(store, scheduler)
+
+
+def make_search_in(user_id: int) -> JobSearchIn:
+    return JobSearchIn(
+        job_title="Python Developer",
+        location="Berlin",
+        job_types=[JobType.parse("Full-time")],
+        remote_types=[RemoteType.parse("Remote")],
+        time_period=TimePeriod.parse("1 hour"),
+        user_id=user_id,
+    )
+
+
+class TestGetUserSearches:
+    """Test that user searches are served from memory."""
+
+    @pytest.mark.asyncio
+    async def test_store_is_queried_once_per_user(self, manager, store):
+        """Repeated lookups should not go back to MongoDB."""
+        await manager.get_user_searches(1)
+        await manager.get_user_searches(1)
+        store.get_user_searches.assert_awaited_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_reflects_add_and_delete(self, manager):
+        """Added and deleted searches should show up without a reload."""
+        await manager.get_user_searches(1)
+        search_id = await manager.add_search(make_search_in(1))
+
+        searches = await manager.get_user_searches(1)
+        assert [s.id for s in searches] == [search_id]
+
+        await manager.delete_search(JobSearchRemove(user_id=1, search_id=search_id))
+        assert await manager.get_user_searches(1) == []
+
+    @pytest.mark.asyncio
+    async def test_get_user_search_by_id(self, manager):
+        """A single search should be found among the user's cached searches."""
+        search_id = await manager.add_search(make_search_in(1))
+        assert (await manager.get_user_search(1, search_id)).id == search_id
+        assert await manager.get_user_search(1, "missing") is None
+
+    @pytest.mark.asyncio
+    async def test_initialize_after_lazy_fill_does_not_duplicate(self, manager, store):
+        """Searches cached before initialize() should not be loaded a second time."""
+        search_id = await manager.add_search(make_search_in(1))
+        search = (await manager.get_user_searches(1))[0]
+        store.get_all_searches.return_value = [search]
+
+        await manager.initialize()
+
+        assert [s.id for s in await manager.get_user_searches(1)] == [search_id]
+        assert len(await manager.get_active_job_searches()) == 1
+
+    @pytest.mark.asyncio
+    async def test_add_keeps_existing_searches_of_uncached_user(self, manager, store):
+        """Adding a search for a user not yet cached should not hide their stored searches."""
+        existing_id = await manager.add_search(make_search_in(1))
+        existing = manager.job_searches.pop(1)
+        store.get_user_searches.return_value = existing
+
+        new_id = await manager.add_search(make_search_in(1))
+
+        assert [s.id for s in await manager.get_user_searches(1)] == [existing_id, new_id]
+
+    @pytest.mark.asyncio
+    async def test_add_during_cold_lookup_is_kept(self, manager, store):
+        """A lookup that finishes after a concurrent add should not overwrite the added search."""
+        release = asyncio.Event()
+
+        async def slow_lookup(user_id):
+            await release.wait()
+            return []
+
+        store.get_user_searches.side_effect = slow_lookup
+        lookup = asyncio.create_task(manager.get_user_searches(1))
+        add = asyncio.create_task(manager.add_search(make_search_in(1)))
+        await asyncio.sleep(0)
+        release.set()
+        await lookup
+        search_id = await add
+
+        assert [s.id for s in await manager.get_user_searches(1)] == [search_id]
@@ -0,0 +1,92 @@
+"""
+Unit tests for SentJobsStore's write-behind buffer.
+"""
+import asyncio
+import pytest
+import pytest_asyncio
+from unittest.mock import Mock, AsyncMock
+
+from main_project.app.core.stores.sent_jobs_store import SAVE_ATTEMPTS, SentJobsStore
+
+
+class AsyncIterator:
+    def __init__(self, items):
+        self._items = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+@pytest_asyncio.fixture
+async def store(monkeypatch):
+    """Create a connected SentJobsStore over a mocked collection."""
+    monkeypatch.setattr("main_project.app.core.stores.sent_jobs_store.SAVE_RETRY_BASE_DELAY", 0)
+    mongo_connection = Mock()
+    mongo_connection._connected = True
+    mongo_connection.db.sent_jobs.create_index = AsyncMock()
+    mongo_connection.db.sent_jobs.insert_many = AsyncMock()
+    mongo_connection.db.sent_jobs.find = Mock(return_value=AsyncIterator([]))
+    sent_jobs_store = SentJobsStore(mongo_connection)
+    await sent_jobs_store.connect()
+    yield sent_jobs_store
+    await sent_jobs_store.close()
+
+
+def saved_urls(store):
+    return [doc["job_url"] for call in store.collection.insert_many.await_args_list for doc in call.args[0]]
+
+
+class TestWriteBehind:
+    """Test that sent jobs are persisted or kept until they are."""
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_retried_with_next_flush(self, store):
+        """Jobs from a failed write should stay visible and be saved by a later flush."""
+        store.collection.insert_many.side_effect = ConnectionError("down")
+        store.claim_unsent_jobs(1, ["a"])
+        await store._flush(store._drain())
+        assert [job.job_url for job in await store.get_sent_jobs_for_user(1)] == ["a"]
+
+        store.collection.insert_many.side_effect = None
+        store.claim_unsent_jobs(1, ["b"])
+        await store._flush(store._drain())
+
+        assert store.collection.insert_many.await_args.args[0][0]["job_url"] == "a"
+        assert {doc["job_url"] for doc in store.collection.insert_many.await_args.args[0]} == {"a", "b"}
+        assert store._unsaved == [] and store._pending == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_retried_without_new_jobs(self, store, monkeypatch):
+        """Held-back jobs should be retried by the writer even if nothing else is recorded."""
+        monkeypatch.setattr("main_project.app.core.stores.sent_jobs_store.UNSAVED_RETRY_INTERVAL", 0.01)
+        store.collection.insert_many.side_effect = [ConnectionError("down")] * SAVE_ATTEMPTS + [None]
+        store.claim_unsent_jobs(1, ["a"])
+
+        for _ in range(100):
+            if store.collection.insert_many.await_count > SAVE_ATTEMPTS:
+                break
+            await asyncio.sleep(0.01)
+
+        assert store.collection.insert_many.await_count == SAVE_ATTEMPTS + 1
+        assert store._unsaved == [] and store._pending == {}
+
+    @pytest.mark.asyncio
+    async def test_close_persists_claims(self, store):
+        """Everything claimed before close should be written."""
+        store.claim_unsent_jobs(1, ["a", "b"])
+        await store.close()
+        assert sorted(saved_urls(store)) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_no_claims_after_close(self, store):
+        """Claims after close could never be persisted, so none are made."""
+        await store.close()
+        assert store.claim_unsent_jobs(1, ["a"]) == []
+        with pytest.raises(RuntimeError):
+            store.enqueue_sent_jobs(1, ["a"])
@@ -0,0 +1,276 @@
+"""
+Unit tests for Telegram bot message delivery helpers.
+"""
+import asyncio
+import functools
+import pytest
+import threading
+import time
+from unittest.mock import Mock, AsyncMock
+
+from telegram.error import BadRequest, RetryAfter, TimedOut
+
+from main_project.app.bot.telegram_bot import TelegramBot, format_job_notification, pack_messages, utf16_len, utf16_truncate
+from main_project.app.core.job_search_manager import JobSearchManager
+from main_project.app.utils.rate_limiter import AsyncTokenBucket
+from shared.data import FullJobListing, JobListing, StreamEvent, StreamManager, StreamType
+
+
+@pytest.fixture
+def bot():
+    """Create a TelegramBot with a mocked Telegram API."""
+    telegram_bot = TelegramBot("123:TEST", StreamManager(), Mock(spec=JobSearchManager))
+    telegram_bot.application = Mock()
+    telegram_bot.application.bot.send_message = AsyncMock()
+    return telegram_bot
+
+
+class TestApplication:
+    """Test that each bot owns its Application."""
+
+    def test_bots_do_not_share_handlers(self):
+        """Building a second bot should not register handlers on the first bot's Application."""
+        first = TelegramBot("123:TEST", StreamManager(), Mock(spec=JobSearchManager))
+        handler_count = sum(len(handlers) for handlers in first.application.handlers.values())
+        second = TelegramBot("123:TEST", StreamManager(), Mock(spec=JobSearchManager))
+        assert first.application is not second.application
+        assert sum(len(handlers) for handlers in first.application.handlers.values()) == handler_count
+
+
+class TestAsyncTokenBucket:
+    """Test the token bucket used for send pacing."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_not_delayed(self):
+        """Requests within capacity should be served immediately."""
+        bucket = AsyncTokenBucket(rate=1, capacity=5)
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        assert time.monotonic() - start < 0.1
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill(self):
+        """Requests beyond capacity should wait for tokens to refill."""
+        bucket = AsyncTokenBucket(rate=20, capacity=1)
+        start = time.monotonic()
+        await bucket.acquire()
+        await bucket.acquire()
+        assert time.monotonic() - start >= 0.04
+
+
+class TestPackMessages:
+    """Test packing of job blocks into Telegram messages."""
+
+    def test_fits_in_one_message(self):
+        """Small inputs should produce a single message."""
+        messages = pack_messages("Header\n\n", ["job 1", "job 2"])
+        assert messages == ["Header\n\njob 1\n\njob 2\n\n"]
+
+    def test_splits_on_block_boundaries(self):
+        """Blocks should never be split across messages."""
+        blocks = [str(i) * 40 for i in range(10)]
+        messages = pack_messages("H\n\n", blocks, continuation_header="C\n\n", limit=100)
+        assert all(len(m) <= 100 for m in messages)
+        assert messages[1].startswith("C\n\n")
+        assert "".join(messages).count("\n\n") == len(blocks) + len(messages)
+
+    def test_empty_blocks(self):
+        """No blocks means nothing to send."""
+        assert pack_messages("Header\n\n", []) == []
+
+    def test_limit_counts_utf16_units(self):
+        """Emoji take two UTF-16 units and must be budgeted as such."""
+        blocks = ["🏢" * 30 for _ in range(5)]
+        messages = pack_messages("H\n\n", blocks, continuation_header="C\n\n", limit=100)
+        assert len(messages) == 5
+        assert all(utf16_len(m) <= 100 for m in messages)
+
+
+class TestUtf16Truncate:
+    """Test truncation to a UTF-16 length."""
+
+    def test_does_not_split_surrogate_pairs(self):
+        """A cut through an emoji should drop the whole emoji."""
+        assert utf16_truncate("a🏢b", 2) == "a"
+        assert utf16_truncate("a🏢b", 3) == "a🏢"
+        assert utf16_truncate("abc", 5) == "abc"
+
+
+class TestFormatJobNotification:
+    """Test formatting of scraped jobs for notifications."""
+
+    def test_includes_job_fields(self):
+        """All job fields should appear in the formatted block."""
+        job = FullJobListing(
+            title="Python Developer",
+            company="Acme",
+            location="Berlin",
+            link="https://example.com/job/1",
+            created_ago="2 hours ago",
+            techstack=["Python", "FastAPI"],
+            compatibility_score=90,
+        )
+        text = format_job_notification(job)
+        assert "Compatibility: 90" in text
+        assert "Techstack: Python, FastAPI" in text
+        assert text.endswith("🔗: https://example.com/job/1")
+        assert format_job_notification(job) is text
+
+
+class TestSendMessage:
+    """Test rate limited message sending."""
+
+    @pytest.mark.asyncio
+    async def test_retries_after_rate_limit(self, bot):
+        """RetryAfter should be waited out and the send retried."""
+        bot.application.bot.send_message.side_effect = [RetryAfter(0), Mock()]
+        await bot._send_message(chat_id=1, text="hello")
+        assert bot.application.bot.send_message.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retries_after_timeout(self, bot, monkeypatch):
+        """Timeouts should be retried with backoff."""
+        monkeypatch.setattr("main_project.app.bot.telegram_bot.SEND_RETRY_BASE_DELAY", 0)
+        bot.application.bot.send_message.side_effect = [TimedOut(), Mock()]
+        await bot._send_message(chat_id=1, text="hello")
+        assert bot.application.bot.send_message.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_bad_request_is_not_retried(self, bot):
+        """Permanent failures should be raised after a single attempt."""
+        bot.application.bot.send_message.side_effect = BadRequest("Chat not found")
+        with pytest.raises(BadRequest):
+            await bot._send_message(chat_id=1, text="hello")
+        assert bot.application.bot.send_message.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, bot):
+        """Persistent rate limiting should eventually raise."""
+        bot.application.bot.send_message.side_effect = RetryAfter(0)
+        with pytest.raises(RetryAfter):
+            await bot._send_message(chat_id=1, text="hello")
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrent_sends(self, bot):
+        """No more than the semaphore's worth of sends should be in flight at once."""
+        bot._send_semaphore = asyncio.Semaphore(2)
+        in_flight = 0
+        peak = 0
+
+        async def fake_send(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        bot.application.bot.send_message.side_effect = fake_send
+        await asyncio.gather(*(bot._send_message(chat_id=i, text="hello") for i in range(6)))
+        assert peak == 2
+
+    def test_chat_buckets_are_bounded(self, bot, monkeypatch):
+        """Buckets of the least recently used chats should be evicted past the limit."""
+        monkeypatch.setattr("main_project.app.bot.telegram_bot.CHAT_BUCKETS_LIMIT", 2)
+        first = bot._chat_bucket(1)
+        bot._chat_bucket(2)
+        assert bot._chat_bucket(1) is first
+        bot._chat_bucket(3)
+        assert list(bot._chat_buckets) == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_long_message_is_split_by_lines(self, bot):
+        """Messages over the limit should be sent as numbered parts within the limit."""
+        message = "\n".join(f"line {i} " + "x" * 90 for i in range(100))
+        await bot._send_message_with_splitting(1, message)
+        sent = [call.kwargs["text"] for call in bot.application.bot.send_message.await_args_list]
+        assert len(sent) == 3
+        assert all(len(text) <= 4096 for text in sent)
+        assert sent[1].startswith("📄 Part 2:")
+        assert sent[0].startswith("line 0 ")
+        assert sent[-1].endswith("line 99 " + "x" * 90)
+
+        # Lines of non-BMP characters must be truncated by UTF-16 units, not code points
+        bot.application.bot.send_message.reset_mock()
+        await bot._send_message_with_splitting(1, "intro\n" + "🏢" * 4090 + "\n" + "🏢" * 4090)
+        sent = [call.kwargs["text"] for call in bot.application.bot.send_message.await_args_list]
+        assert len(sent) == 3
+        assert all(utf16_len(text) <= 4096 for text in sent)
+        assert sent[1].endswith("🏢...") and sent[2].endswith("🏢...")
+
+
+class TestSendJobListings:
+    """Test queued delivery of job listings."""
+
+    @pytest.mark.asyncio
+    async def test_listings_are_delivered_by_worker(self, bot):
+        """Listings should be queued and sent in order by the background worker."""
+        jobs = [
+            JobListing(
+                title=f"Job {i}", company="Acme", location="Berlin",
+                description="", link=f"https://example.com/{i}", job_type="Full-time", timestamp="",
+            )
+            for i in range(2)
+        ]
+        await bot.send_job_listings(1, jobs)
+        assert bot.application.bot.send_message.await_count == 0
+
+        bot._start_send_workers()
+        await bot._stop_send_workers()
+
+        sent = bot.application.bot.send_message.await_args
+        assert sent.kwargs["chat_id"] == 1
+        assert "Job 0" in sent.kwargs["text"] and "Job 1" in sent.kwargs["text"]
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_chat_does_not_block_others(self, bot):
+        """A chat out of send tokens should not delay other chats, and its own messages stay in order."""
+        bot._chat_buckets[1] = AsyncTokenBucket(rate=10, capacity=1)
+        for chat_id, text in [(1, "a"), (1, "b"), (5, "c")]:
+            bot._enqueue_send(chat_id, functools.partial(bot._send_message, chat_id=chat_id, text=text))
+
+        bot._start_send_workers()
+        await asyncio.sleep(0.02)
+        sent = [call.kwargs["text"] for call in bot.application.bot.send_message.await_args_list]
+        assert sent == ["a", "c"]
+
+        await bot._stop_send_workers()
+        sent = [call.kwargs["text"] for call in bot.application.bot.send_message.await_args_list]
+        assert sent == ["a", "c", "b"]
+        assert bot._pending_sends == 0 and not bot._send_queues
+
+    def test_full_queue_is_reported_not_dropped(self, bot, monkeypatch):
+        """Sends past the limit should still be queued, with the queue reported as full."""
+        monkeypatch.setattr("main_project.app.bot.telegram_bot.SEND_QUEUE_SIZE", 2)
+        for text in ["a", "b", "c"]:
+            bot._enqueue_send(1, functools.partial(bot._send_message, chat_id=1, text=text))
+        assert bot.send_queue_full
+        assert len(bot._send_queues[1]) == 3
+
+    @pytest.mark.asyncio
+    async def test_stream_messages_go_through_workers(self, bot):
+        """SEND_MESSAGE events should be delivered by the send workers."""
+        bot.stream_manager.publish(StreamEvent(
+            type=StreamType.SEND_MESSAGE, data={"user_id": 7, "message": "hi"}, source="test"
+        ))
+        bot._start_send_workers()
+        await bot._stop_send_workers()
+
+        sent = bot.application.bot.send_message.await_args
+        assert sent.kwargs["chat_id"] == 7
+        assert sent.kwargs["text"] == "hi"
+
+    @pytest.mark.asyncio
+    async def test_events_from_other_threads_reach_the_loop(self, bot):
+        """SEND_MESSAGE events published off the event loop should still be delivered."""
+        bot._loop = asyncio.get_running_loop()
+        bot._start_send_workers()
+        publisher = threading.Thread(target=bot.stream_manager.publish, args=(StreamEvent(
+            type=StreamType.SEND_MESSAGE, data={"user_id": 7, "message": "hi"}, source="test"
+        ),))
+        publisher.start()
+        publisher.join()
+        await asyncio.sleep(0)
+        await bot._stop_send_workers()
+
+        assert bot.application.bot.send_message.await_args.kwargs["text"] == "hi"
@@ -60,35 +60,27 @@ class TestListJobSearchesTool:
     @pytest.mark.asyncio
     async def test_list_searches_success(self, tool, mock_manager):
         """Test successful listing of job searches."""
-        # Create mock search objects with proper attributes
-        from shared.data import JobType, RemoteType, TimePeriod
-        
-        class MockJobSearch:
-            def __init__(self, id, job_title, location, job_types, remote_types, time_period):
-                self.id = id
-                self.job_title = job_title
-                self.location = location
-                self.job_types = job_types
-                self.remote_types = remote_types
-                self.time_period = time_period
-                self.filter_text = None
+        # Create search objects as returned by the manager
+        from shared.data import JobSearchOut, JobType, RemoteType, TimePeriod
         
         mock_searches = [
-            MockJobSearch(
+            JobSearchOut(
                 id='search1',
                 job_title='Python Developer',
                 location='Berlin',
                 job_types=[JobType.parse('Full-time')],
                 remote_types=[RemoteType.parse('Hybrid')],
-                time_period=TimePeriod.parse('1 hour')
+                time_period=TimePeriod.parse('1 hour'),
+                user_id=12345
             ),
-            MockJobSearch(
+            JobSearchOut(
                 id='search2', 
                 job_title='Data Scientist',
                 location='Remote',
                 job_types=[JobType.parse('Full-time')],
                 remote_types=[RemoteType.parse('Remote')],
-                time_period=TimePeriod.parse('1 hour')
+                time_period=TimePeriod.parse('1 hour'),
+                user_id=12345
             )
         ]
         
@@ -102,6 +94,8 @@ class TestListJobSearchesTool:
         assert "Your Active Job Searches" in result
         assert "Python Developer" in result
         assert "Data Scientist" in result
+        assert "Full-time" in result
+        assert "1 hour" in result
     
     @pytest.mark.asyncio
     async def test_list_searches_empty(self, tool, mock_manager):
@@ -156,6 +150,17 @@ class TestCreateJobSearchTool:
         # Ensure no ID is exposed in the response
         assert "search123" not in result
     
+    @pytest.mark.asyncio
+    async def test_create_search_blank_location(self, tool, mock_manager):
+        """Blank required fields should prompt for them without creating a search."""
+        mock_manager.add_search = AsyncMock()
+        
+        result = await tool._arun(user_id=12345, job_title="Python Developer", location="  ")
+        
+        mock_manager.add_search.assert_not_called()
+        assert "additional information" in result
+        assert "location" in result
+    
     def test_job_type_parsing(self, tool):
         """Test job type parsing functionality."""
         # Test valid job types (use display names that match our data)
@@ -165,6 +170,15 @@ class TestCreateJobSearchTool:
         # Test empty input (should return default)
         default_types = tool._parse_job_types(None)
         assert len(default_types) >= 1
+    
+    def test_option_parsing_ignores_case(self, tool):
+        """Option labels should match regardless of case and surrounding spaces."""
+        job_types = tool._parse_job_types([" full-time", "PART-TIME"])
+        assert [jt.label for jt in job_types] == ["Full-time", "Part-time"]
+        assert tool._parse_time_period("1 HOUR").display_name == "1 hour"
+        
+        with pytest.raises(ValueError, match="Valid options are: Full-time"):
+            tool._parse_job_types(["Freelance"])
 
 
 if __name__ == "__main__":
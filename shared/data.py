@@ -2,6 +2,7 @@
 Data models and enums for the application.
 """
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set
@@ -27,7 +28,9 @@ class TimePeriod:
         self._cron = cron
         self._max_pages_to_scrape = max_pages_to_scrape
         self.linkedin_code = linkedin_code
-        TimePeriod._instances[display_name.lower()] = self
+        # Lowercase form used in running text ("every 1 hour")
+        self.lowercase_name = display_name.lower()
+        TimePeriod._instances[display_name.casefold()] = self
 
     
 
@@ -53,7 +56,7 @@ class TimePeriod:
         if isinstance(value, cls):
             return value
         if isinstance(value, str):
-            instance = cls._instances.get(value.strip().lower())
+            instance = cls._instances.get(value.strip().casefold())
             if not instance:
                 raise ValueError(f"Invalid time period: {value}, {args}, {kwargs}")
             return instance
@@ -87,7 +90,7 @@ class JobType:
 
     def __init__(self, label: str):
         self.label = label
-        JobType._instances[label.lower()] = self
+        JobType._instances[label.casefold()] = self
 
     @classmethod
     def __get_validators__(cls):
@@ -98,7 +101,7 @@ class JobType:
         if isinstance(value, cls):
             return value
         if isinstance(value, str):
-            instance = cls._instances.get(value.strip().lower())
+            instance = cls._instances.get(value.strip().casefold())
             if not instance:
                 raise ValueError(f"Invalid job type: {value}, {args}, {kwargs}")
             return instance
@@ -122,7 +125,7 @@ class RemoteType:
 
     def __init__(self, label: str):
         self.label = label
-        RemoteType._instances[label.lower()] = self
+        RemoteType._instances[label.casefold()] = self
 
     @classmethod
     def __get_validators__(cls):
@@ -133,7 +136,7 @@ class RemoteType:
         if isinstance(value, cls):
             return value
         if isinstance(value, str):
-            instance = cls._instances.get(value.strip().lower())
+            instance = cls._instances.get(value.strip().casefold())
             if not instance:
                 raise ValueError(f"Invalid remote type: {value}, {args}, {kwargs}")
             return instance
@@ -165,7 +168,7 @@ class CustomBaseModel(BaseModel):
         }
     }
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JobListing:
     """LinkedIn job listing data."""
     title: str
@@ -238,6 +241,19 @@ class JobSearchOut(CustomBaseModel):
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     filter_text: Optional[str] = None
 
+    # Display strings for the search's options; the option instances are immutable so these never go stale
+    @cached_property
+    def job_types_text(self) -> str:
+        return ", ".join([jt.label for jt in self.job_types]) or "Any"
+
+    @cached_property
+    def remote_types_text(self) -> str:
+        return ", ".join([rt.label for rt in self.remote_types]) or "Any"
+
+    @cached_property
+    def time_period_text(self) -> str:
+        return self.time_period.display_name
+
     def to_log_string(self) -> str:
         return (
             f"id={self.id}, title={self.job_title}, location={self.location}, "
@@ -251,7 +267,7 @@ class StreamType(Enum):
     SEND_MESSAGE = "send_message"
     SEND_LOG = "send_log"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StreamEvent:
     type: StreamType
     data: Any
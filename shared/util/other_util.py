@@ -5,11 +5,14 @@ from pydantic import GetCoreSchemaHandler
 
 
 def enable_enum_name_deserialization(enum_cls: type[Enum]):
+    members = enum_cls.__members__
+    valid_names = ', '.join(e.name for e in enum_cls)
+
     def _validate(input_str: str) -> Enum:
-        try:
-            return enum_cls[input_str]
-        except KeyError:
-            raise ValueError(f"Input should be one of: {', '.join(e.name for e in enum_cls)}")
+        member = members.get(input_str)
+        if member is None:
+            raise ValueError(f"Input should be one of: {valid_names}")
+        return member
 
     def __get_pydantic_core_schema__(cls, source_type, handler: GetCoreSchemaHandler):
         return core_schema.no_info_plain_validator_function(_validate)